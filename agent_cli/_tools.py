@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import json
+import logging
 import os
-import subprocess
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
+
+LOGGER = logging.getLogger(__name__)
 
 
 # Memory system helpers
@@ -88,6 +94,14 @@ def _parse_tags(tags_string: str) -> list[str]:
 
 R = TypeVar("R")
 
+# Limits that keep tool calls from blocking the chat for long or flooding the prompt
+EXECUTE_CODE_TIMEOUT = 30.0
+MAX_TOOL_OUTPUT_BYTES = 64 * 1024
+
+# Tool-result cache settings for read-only tools
+WEB_SEARCH_CACHE_TTL = 15 * 60.0
+TOOL_CACHE_MAX_ENTRIES = 128
+
 
 def _memory_operation(operation_name: str, operation_func: Callable[[], str]) -> str:
     """Wrapper for memory operations with consistent error handling."""
@@ -97,40 +111,156 @@ def _memory_operation(operation_name: str, operation_func: Callable[[], str]) ->
         return f"Error {operation_name}: {e}"
 
 
-def read_file(path: str) -> str:
+_BINARY_SNIFF_BYTES = 8192
+
+
+def _truncation_marker(shown: str, size: int, hint: str) -> str:
+    return f"\n... [truncated: {shown} shown, file is {size} bytes; {hint}]"
+
+
+def _read_file_range(
+    path: Path,
+    offset: int,
+    limit: int | None,
+    start_line: int | None,
+    end_line: int | None,
+) -> str:
+    """Read part of a file with buffered I/O, never more than the output budget."""
+    budget = min(limit, MAX_TOOL_OUTPUT_BYTES) if limit else MAX_TOOL_OUTPUT_BYTES
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        if b"\0" in f.read(_BINARY_SNIFF_BYTES):
+            return f"Error: {path} appears to be a binary file ({size} bytes)"
+
+        if start_line is None and end_line is None:
+            f.seek(offset)
+            data = f.read(budget)
+            end = offset + len(data)
+            text = data.decode(errors="replace")
+            if end < size:
+                text += _truncation_marker(
+                    f"bytes {offset}-{end}",
+                    size,
+                    f"use offset={end} to read more",
+                )
+            return text
+
+        f.seek(0)
+        first = start_line or 1
+        kept = bytearray()
+        position = 0
+        for number, line in enumerate(f, start=1):
+            if end_line is not None and number > end_line:
+                break
+            if number >= first:
+                if len(kept) + len(line) > budget:
+                    if kept:
+                        shown = f"lines {first}-{number - 1}"
+                        hint = f"use start_line={number} to read more"
+                    else:
+                        # A single line longer than the budget, continue by byte offset
+                        kept.extend(line[:budget])
+                        shown = f"part of line {number}"
+                        hint = f"use offset={position + budget} to read more"
+                    return kept.decode(errors="replace") + _truncation_marker(shown, size, hint)
+                kept.extend(line)
+            position += len(line)
+        return kept.decode(errors="replace")
+
+
+async def read_file(
+    path: str,
+    offset: int = 0,
+    limit: int | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
+) -> str:
     """Read the content of a file.
 
+    Large files are truncated, so use the range arguments to page through them.
+
     Args:
         path: The path to the file to read.
+        offset: Byte offset to start reading from.
+        limit: Maximum number of bytes to return.
+        start_line: First line to read (1-based). Takes precedence over offset.
+        end_line: Last line to read (inclusive).
 
     """
     try:
-        return Path(path).read_text()
+        return await asyncio.to_thread(
+            _read_file_range,
+            Path(path),
+            offset,
+            limit,
+            start_line,
+            end_line,
+        )
     except FileNotFoundError:
         return f"Error: File not found at {path}"
     except OSError as e:
         return f"Error reading file: {e}"
 
 
-def execute_code(code: str) -> str:
+async def _read_capped(stream: asyncio.StreamReader, limit: int) -> tuple[bytes, int]:
+    """Read a stream to EOF, keeping at most ``limit`` bytes.
+
+    The remainder is drained and discarded so the child never blocks on a full pipe.
+    Returns the kept bytes and the total number of bytes produced.
+    """
+    kept = bytearray()
+    total = 0
+    while chunk := await stream.read(64 * 1024):
+        total += len(chunk)
+        if len(kept) < limit:
+            kept.extend(chunk[: limit - len(kept)])
+    return bytes(kept), total
+
+
+def _decode_output(data: bytes, total: int) -> str:
+    """Decode subprocess output, appending a marker if it was truncated."""
+    text = data.decode(errors="replace")
+    if total > len(data):
+        text += f"\n... [output truncated: {len(data)} of {total} bytes shown]"
+    return text
+
+
+async def execute_code(code: str) -> str:
     """Execute a shell command.
 
     Args:
         code: The shell command to execute.
 
     """
+    args = code.split()
     try:
-        result = subprocess.run(
-            code.split(),
-            capture_output=True,
-            text=True,
-            check=True,
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error executing code: {e.stderr}"
     except FileNotFoundError:
-        return f"Error: Command not found: {code.split()[0]}"
+        return f"Error: Command not found: {args[0]}"
+
+    assert proc.stdout is not None
+    assert proc.stderr is not None
+    try:
+        (stdout, stdout_total), (stderr, stderr_total), returncode = await asyncio.wait_for(
+            asyncio.gather(
+                _read_capped(proc.stdout, MAX_TOOL_OUTPUT_BYTES),
+                _read_capped(proc.stderr, MAX_TOOL_OUTPUT_BYTES),
+                proc.wait(),
+            ),
+            timeout=EXECUTE_CODE_TIMEOUT,
+        )
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return f"Error: Command timed out after {EXECUTE_CODE_TIMEOUT:g}s: {code}"
+
+    if returncode != 0:
+        return f"Error executing code: {_decode_output(stderr, stderr_total)}"
+    return _decode_output(stdout, stdout_total)
 
 
 def add_memory(content: str, category: str = "general", tags: str = "") -> str:
@@ -351,18 +481,95 @@ def list_memory_categories() -> str:
     return _memory_operation("listing categories", _list_categories_operation)
 
 
+# Tool-result cache
+
+
+async def _file_fingerprint(arguments: dict[str, Any]) -> tuple[int, int] | None:
+    """Return the mtime and size of the file a ``read_file`` call refers to."""
+    try:
+        stat = await asyncio.to_thread(Path(arguments["path"]).stat)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def cache_tool_results(
+    func: Callable[..., Awaitable[R]],
+    *,
+    ttl: float | None = None,
+    fingerprint: Callable[[dict[str, Any]], Awaitable[object]] | None = None,
+    max_entries: int = TOOL_CACHE_MAX_ENTRIES,
+) -> Callable[..., Awaitable[R]]:
+    """Memoise the results of a read-only async tool.
+
+    Calls are keyed on their (bound) arguments. An entry is reused while it is
+    younger than ``ttl`` seconds and, if given, ``await fingerprint(arguments)``
+    still returns the same value as when the entry was stored.
+    """
+    signature = inspect.signature(func)
+    name = getattr(func, "__name__", repr(func))
+    cache: dict[str, tuple[float, object, R]] = {}
+    stats = {"hits": 0, "misses": 0}
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> R:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = json.dumps(bound.arguments, sort_keys=True, default=str)
+        stamp = await fingerprint(bound.arguments) if fingerprint else None
+        now = time.monotonic()
+
+        entry = cache.get(key)
+        if entry is not None and entry[1] == stamp and (ttl is None or now - entry[0] < ttl):
+            stats["hits"] += 1
+            LOGGER.info(
+                "Tool cache hit for %s (hits=%d, misses=%d)",
+                name,
+                stats["hits"],
+                stats["misses"],
+            )
+            return entry[2]
+
+        stats["misses"] += 1
+        LOGGER.info(
+            "Tool cache miss for %s (hits=%d, misses=%d)",
+            name,
+            stats["hits"],
+            stats["misses"],
+        )
+        result = await func(*args, **kwargs)
+        cache.pop(key, None)
+        cache[key] = (now, stamp, result)
+        if len(cache) > max_entries:
+            del cache[next(iter(cache))]
+        return result
+
+    return wrapper
+
+
 def tools() -> list:
-    """Return a list of tools."""
+    """Return a list of tools.
+
+    The results of ``read_file`` and ``duckduckgo_search`` are cached for the lifetime
+    of the returned tools, so create them once per session.
+    """
     from pydantic_ai.common_tools.duckduckgo import duckduckgo_search_tool  # noqa: PLC0415
     from pydantic_ai.tools import Tool  # noqa: PLC0415
 
+    search = duckduckgo_search_tool()
+    # ``read_file`` and ``execute_code`` are coroutines, so several calls issued by the
+    # model in a single step run concurrently without blocking the event loop.
     return [
-        Tool(read_file),
+        Tool(cache_tool_results(read_file, fingerprint=_file_fingerprint)),
         Tool(execute_code),
         Tool(add_memory),
         Tool(search_memory),
         Tool(update_memory),
         Tool(list_all_memories),
         Tool(list_memory_categories),
-        duckduckgo_search_tool(),
+        Tool(
+            cache_tool_results(search.function, ttl=WEB_SEARCH_CACHE_TTL),
+            name=search.name,
+            description=search.description,
+        ),
     ]
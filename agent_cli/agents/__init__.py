@@ -1,12 +1,5 @@
-"""Agent implementations for the Agent CLI."""
+"""Agent implementations for the Agent CLI.
 
-from . import assistant, autocorrect, chat, speak, transcribe, voice_edit
-
-__all__ = [
-    "assistant",
-    "autocorrect",
-    "chat",
-    "speak",
-    "transcribe",
-    "voice_edit",
-]
+The agent modules are not imported here: each one is imported on its own when
+its command is run (see `agent_cli.cli`), so that it only loads what it needs.
+"""
@@ -91,11 +91,12 @@ async def process_instruction_and_respond(
     agent_instructions: str,
     live: Live | None,
     logger: logging.Logger,
-) -> None:
-    """Process instruction with LLM and handle TTS response."""
+) -> str | None:
+    """Process instruction with LLM, handle TTS response, and return the LLM response."""
+    response = None
     # Process with LLM if clipboard mode is enabled
     if general_cfg.clipboard:
-        await process_and_update_clipboard(
+        response = await process_and_update_clipboard(
             system_prompt=system_prompt,
             agent_instructions=agent_instructions,
             provider_cfg=provider_cfg,
@@ -130,3 +131,4 @@ async def process_instruction_and_respond(
                     description="TTS audio",
                     live=live,
                 )
+    return response
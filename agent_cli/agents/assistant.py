@@ -29,36 +29,56 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from pathlib import Path  # noqa: TC003
 from typing import TYPE_CHECKING
 
-from agent_cli import config, opts
+import typer
+
+from agent_cli import config, constants, opts
 from agent_cli.agents._voice_agent_common import (
     get_instruction_from_audio,
     process_instruction_and_respond,
 )
 from agent_cli.cli import app
-from agent_cli.core import audio, process
+from agent_cli.core import audio, ipc, loop_monitor, metrics, process, profiler, tracing, vad
 from agent_cli.core.audio import pyaudio_context, setup_devices
 from agent_cli.core.utils import (
     InteractiveStopEvent,
     maybe_live,
     print_command_line_args,
+    print_error_message,
     print_with_style,
+    run_with_control_socket,
     setup_logging,
     signal_handling_context,
     stop_or_status_or_toggle,
 )
 from agent_cli.services import asr
-from agent_cli.services.wake_word import create_wake_word_detector
+from agent_cli.services.wake_word import (
+    DEFAULT_WAKE_WORDS,
+    create_wake_word_session,
+    has_openwakeword,
+    openwakeword_model_error,
+)
 
 if TYPE_CHECKING:
-    import pyaudio
     from rich.live import Live
 
+    from agent_cli.services.wake_word import WakeWordSession
+
 LOGGER = logging.getLogger()
 
+# Audio kept from before the wake word detection, so that speech right after the
+# wake word is recorded even though the detection arrives with some latency
+WAKE_WORD_PREROLL_SECONDS = 0.5
+# Audio history of the tee, covering the pre-roll plus chunks still queued for the detector
+_TEE_HISTORY_SECONDS = 2.0
+# Pause before restarting wake word detection after it stopped, e.g., on a lost connection;
+# doubled after each failed restart, up to the maximum
+_RESTART_DELAY_SECONDS = 2.0
+_MAX_RESTART_DELAY_SECONDS = 60.0
+
 WAKE_WORD_VARIATIONS = {
     "ok_nabu": ["ok nabu", "okay nabu", "okay, nabu", "ok, nabu", "ok naboo", "okay naboo"],
     "alexa": ["alexa"],
@@ -69,7 +89,7 @@ WAKE_WORD_VARIATIONS = {
 SYSTEM_PROMPT_TEMPLATE = """\
 You are a helpful voice assistant. Respond to user questions and commands in a conversational, friendly manner.
 
-The user is using a wake word to start and stop the recording, so the wake word will always appear at the END of the transcription.
+The user is using a wake word to start and stop the recording, so the wake word will always appear at the END of the transcription, and its tail may also appear at the START.
 The wake word is "{wake_word}". You should ignore the wake word and any variations of it (e.g., "{variations}") when processing the user's command.
 
 Keep your responses concise but informative. If the user asks you to perform an action that requires external tools or systems, explain what you would do if you had access to those capabilities.
@@ -91,16 +111,34 @@ Respond as if you're having a natural conversation.
 
 
 async def _record_audio_with_wake_word(
-    stream: pyaudio.Stream,
+    tee: audio._AudioTee,
+    session: WakeWordSession,
     stop_event: InteractiveStopEvent,
     logger: logging.Logger,
     *,
     wake_word_cfg: config.WakeWord,
     quiet: bool = False,
-    live: Live | None = None,
 ) -> bytes | None:
-    """Record audio to a buffer using wake word detection to start and stop."""
-    if not quiet:
+    """Record audio to a buffer using wake word detection to start and stop.
+
+    Returns None if no recording was made, e.g., because the detector stopped.
+    """
+    if session.finished:
+        # Wait before reconnecting, e.g., while the server restarts
+        delay = min(
+            _RESTART_DELAY_SECONDS * 2 ** max(session.failures - 1, 0),
+            _MAX_RESTART_DELAY_SECONDS,
+        )
+        with suppress(TimeoutError):
+            await asyncio.wait_for(stop_event.wait(), timeout=delay)
+        if stop_event.is_set():
+            return None
+        logger.debug("Restarting wake word detection after %.0f s", delay)
+        metrics.RECONNECTS.inc(service="wake_word")
+        session.start()
+
+    # Only prompt again once the detector is back up
+    if not quiet and not session.failures:
         print_with_style(
             f"👂 Listening for wake word: [bold yellow]{wake_word_cfg.wake_word}[/bold yellow]",
         )
@@ -109,48 +147,33 @@ async def _record_audio_with_wake_word(
             style="dim",
         )
 
-    async with audio.tee_audio_stream(stream, stop_event, logger) as tee:
-        # Create a queue for wake word detection
-        wake_queue = await tee.add_queue()
+    # Skip detections and audio from while the previous command was processed
+    session.drain()
+    session.progress_message = "Listening for wake word"
+    detected_word = await anext(session, None)
+    if not detected_word or stop_event.is_set():
+        return None
 
-        detector = create_wake_word_detector(wake_word_cfg)
-        detected_word = await detector(
-            logger=logger,
-            queue=wake_queue,
-            quiet=quiet,
-            live=live,
+    if not quiet:
+        print_with_style(
+            f"✅ Wake word '{detected_word}' detected! Starting recording...",
+            style="green",
         )
 
-        if not detected_word or stop_event.is_set():
-            # Clean up the queue if we exit early
-            await tee.remove_queue(wake_queue)
-            return None
-
-        if not quiet:
-            print_with_style(
-                f"✅ Wake word '{detected_word}' detected! Starting recording...",
-                style="green",
-            )
-
-        # Add a new queue for recording
-        record_queue = await tee.add_queue()
-        record_task = asyncio.create_task(asr.record_audio_to_buffer(record_queue, logger))
-
-        # Use the same wake_queue for stop-word detection
-        stop_detected_word = await detector(
-            logger=logger,
-            queue=wake_queue,
-            quiet=quiet,
-            live=live,
-            progress_message="Recording... (say wake word to stop)",
-        )
+    # Start recording at the last chunk the detector has seen, minus the pre-roll
+    wake_boundary = tee.chunks_taken(session.queue)
+    record_queue = await tee.add_queue(
+        start_chunk=wake_boundary - constants.seconds_to_chunks(WAKE_WORD_PREROLL_SECONDS),
+    )
+    record_task = asyncio.create_task(asr.record_audio_to_buffer(record_queue, logger))
 
-        # Stop the recording task by removing its queue
-        await tee.remove_queue(record_queue)
-        audio_data = await record_task
+    # The same session detects the wake word that stops the recording
+    session.progress_message = "Recording... (say wake word to stop)"
+    stop_detected_word = await anext(session, None)
 
-        # Clean up the wake queue
-        await tee.remove_queue(wake_queue)
+    # Stop the recording task by removing its queue
+    await tee.remove_queue(record_queue)
+    audio_data = await record_task
 
     if not stop_detected_word or stop_event.is_set():
         return None
@@ -183,8 +206,17 @@ async def _async_main(
     system_prompt: str,
     agent_instructions: str,
     live: Live | None,
+    stop_event: InteractiveStopEvent | None = None,
 ) -> None:
-    """Core asynchronous logic for the wake word assistant."""
+    """Core asynchronous logic for the wake word assistant.
+
+    Runs until SIGINT/SIGTERM, or until the given `stop_event` is set.
+    """
+    stop_context = (
+        nullcontext(stop_event)
+        if stop_event is not None
+        else signal_handling_context(LOGGER, general_cfg.quiet)
+    )
     with pyaudio_context() as p:
         device_info = setup_devices(p, general_cfg, audio_in_cfg, audio_out_cfg)
         if device_info is None:
@@ -196,60 +228,81 @@ async def _async_main(
         stream_kwargs = audio.setup_input_stream(input_device_index)
         with (
             audio.open_pyaudio_stream(p, **stream_kwargs) as stream,
-            signal_handling_context(LOGGER, general_cfg.quiet) as stop_event,
+            stop_context as stop_event,  # noqa: PLR1704
         ):
-            while not stop_event.is_set():
-                audio_data = await _record_audio_with_wake_word(
-                    stream,
-                    stop_event,
+            # One audio tee and one wake word session serve all interactions
+            async with audio.tee_audio_stream(
+                stream,
+                stop_event,
+                LOGGER,
+                history_seconds=_TEE_HISTORY_SECONDS,
+            ) as tee:
+                # The wake word queue skips silence if gated
+                wake_queue = await tee.add_queue(
+                    gate=vad.EnergyGate() if wake_word_cfg.energy_gate else None,
+                )
+                async with create_wake_word_session(
+                    wake_word_cfg,
                     LOGGER,
-                    wake_word_cfg=wake_word_cfg,
-                    quiet=general_cfg.quiet,
+                    wake_queue,
                     live=live,
-                )
-
-                if not audio_data:
-                    if not general_cfg.quiet:
-                        print_with_style("No audio recorded", style="yellow")
-                    continue
-
-                if stop_event.is_set():
-                    break
-
-                instruction = await get_instruction_from_audio(
-                    audio_data=audio_data,
-                    provider_cfg=provider_cfg,
-                    audio_input_cfg=audio_in_cfg,
-                    wyoming_asr_cfg=wyoming_asr_cfg,
-                    openai_asr_cfg=openai_asr_cfg,
-                    ollama_cfg=ollama_cfg,
-                    logger=LOGGER,
                     quiet=general_cfg.quiet,
-                )
-                if not instruction:
-                    continue
-
-                await process_instruction_and_respond(
-                    instruction=instruction,
-                    original_text="",
-                    provider_cfg=provider_cfg,
-                    general_cfg=general_cfg,
-                    ollama_cfg=ollama_cfg,
-                    openai_llm_cfg=openai_llm_cfg,
-                    gemini_llm_cfg=gemini_llm_cfg,
-                    audio_output_cfg=audio_out_cfg,
-                    wyoming_tts_cfg=wyoming_tts_cfg,
-                    openai_tts_cfg=openai_tts_cfg,
-                    kokoro_tts_cfg=kokoro_tts_cfg,
-                    piper_tts_cfg=piper_tts_cfg,
-                    system_prompt=system_prompt,
-                    agent_instructions=agent_instructions,
-                    live=live,
-                    logger=LOGGER,
-                )
-
-                if not general_cfg.quiet:
-                    print_with_style("✨ Ready for next command...", style="green")
+                ) as session:
+                    while not stop_event.is_set():
+                        audio_data = await _record_audio_with_wake_word(
+                            tee,
+                            session,
+                            stop_event,
+                            LOGGER,
+                            wake_word_cfg=wake_word_cfg,
+                            quiet=general_cfg.quiet,
+                        )
+
+                        if audio_data is None:
+                            continue
+                        if not audio_data:
+                            if not general_cfg.quiet:
+                                print_with_style("No audio recorded", style="yellow")
+                            continue
+
+                        if stop_event.is_set():
+                            break
+
+                        instruction = await get_instruction_from_audio(
+                            audio_data=audio_data,
+                            provider_cfg=provider_cfg,
+                            audio_input_cfg=audio_in_cfg,
+                            wyoming_asr_cfg=wyoming_asr_cfg,
+                            openai_asr_cfg=openai_asr_cfg,
+                            ollama_cfg=ollama_cfg,
+                            logger=LOGGER,
+                            quiet=general_cfg.quiet,
+                        )
+                        if not instruction:
+                            continue
+
+                        await process_instruction_and_respond(
+                            instruction=instruction,
+                            original_text="",
+                            provider_cfg=provider_cfg,
+                            general_cfg=general_cfg,
+                            ollama_cfg=ollama_cfg,
+                            openai_llm_cfg=openai_llm_cfg,
+                            gemini_llm_cfg=gemini_llm_cfg,
+                            audio_output_cfg=audio_out_cfg,
+                            wyoming_tts_cfg=wyoming_tts_cfg,
+                            openai_tts_cfg=openai_tts_cfg,
+                            kokoro_tts_cfg=kokoro_tts_cfg,
+                            piper_tts_cfg=piper_tts_cfg,
+                            system_prompt=system_prompt,
+                            agent_instructions=agent_instructions,
+                            live=live,
+                            logger=LOGGER,
+                        )
+
+                        if not general_cfg.quiet:
+                            print_with_style("✨ Ready for next command...", style="green")
+                await tee.remove_queue(wake_queue)
 
 
 @app.command("assistant")
@@ -262,7 +315,9 @@ def assistant(
     # --- Wake Word Configuration ---
     wake_server_ip: str = opts.WAKE_SERVER_IP,
     wake_server_port: int = opts.WAKE_SERVER_PORT,
-    wake_word: str = opts.WAKE_WORD,
+    wake_word: str | None = opts.WAKE_WORD,
+    wake_word_provider: str = opts.WAKE_WORD_PROVIDER,
+    energy_gate: bool = opts.ENERGY_GATE,
     # --- ASR (Audio) Configuration ---
     input_device_index: int | None = opts.INPUT_DEVICE_INDEX,
     input_device_name: str | None = opts.INPUT_DEVICE_NAME,
@@ -307,6 +362,11 @@ def assistant(
     clipboard: bool = opts.CLIPBOARD,
     log_level: str = opts.LOG_LEVEL,
     log_file: str | None = opts.LOG_FILE,
+    trace_file: Path | None = opts.TRACE_FILE,
+    debug_loop: bool = opts.DEBUG_LOOP,
+    profile_file: Path | None = opts.PROFILE,
+    metrics_port: int | None = opts.METRICS_PORT,
+    metrics_file: Path | None = opts.METRICS_FILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
     config_file: str | None = opts.CONFIG_FILE,
@@ -334,9 +394,21 @@ def assistant(
         quiet=general_cfg.quiet,
     ):
         return
-
+    if wake_word_provider == "openwakeword" and not has_openwakeword:
+        print_error_message(
+            "The 'openwakeword' wake word provider requires the openWakeWord package.",
+            "Install it with `pip install openwakeword`.",
+        )
+        raise typer.Exit(1)
+    wake_word = wake_word or DEFAULT_WAKE_WORDS.get(wake_word_provider, "ok_nabu")
+    if wake_word_provider == "openwakeword" and (error := openwakeword_model_error(wake_word)):
+        print_error_message(error)
+        raise typer.Exit(1)
+
+    # The control socket lets `--stop` end the assistant without signal polling
+    control_socket = ipc.socket_path(process_name)
     with (
-        process.pid_file_context(process_name),
+        process.pid_file_context(process_name, control_socket=control_socket),
         suppress(KeyboardInterrupt),
         maybe_live(not general_cfg.quiet) as live,
     ):
@@ -405,6 +477,8 @@ def assistant(
             wake_server_ip=wake_server_ip,
             wake_server_port=wake_server_port,
             wake_word=wake_word,
+            wake_word_provider=wake_word_provider,
+            energy_gate=energy_gate,
         )
 
         variations = ", ".join(WAKE_WORD_VARIATIONS.get(wake_word_cfg.wake_word, []))
@@ -417,24 +491,38 @@ def assistant(
             variations=variations,
         )
 
-        asyncio.run(
-            _async_main(
-                provider_cfg=provider_cfg,
-                general_cfg=general_cfg,
-                audio_in_cfg=audio_in_cfg,
-                wyoming_asr_cfg=wyoming_asr_cfg,
-                openai_asr_cfg=openai_asr_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_llm_cfg=openai_llm_cfg,
-                gemini_llm_cfg=gemini_llm_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
-                piper_tts_cfg=piper_tts_cfg,
-                wake_word_cfg=wake_word_cfg,
-                system_prompt=system_prompt,
-                agent_instructions=agent_instructions,
-                live=live,
-            ),
-        )
+        with tracing.tracing(trace_file), profiler.profiling(profile_file):
+            asyncio.run(
+                loop_monitor.run_with_monitor(
+                    metrics.run_with_exporter(
+                        run_with_control_socket(
+                            control_socket,
+                            lambda stop_event: _async_main(
+                                provider_cfg=provider_cfg,
+                                general_cfg=general_cfg,
+                                audio_in_cfg=audio_in_cfg,
+                                wyoming_asr_cfg=wyoming_asr_cfg,
+                                openai_asr_cfg=openai_asr_cfg,
+                                ollama_cfg=ollama_cfg,
+                                openai_llm_cfg=openai_llm_cfg,
+                                gemini_llm_cfg=gemini_llm_cfg,
+                                audio_out_cfg=audio_out_cfg,
+                                wyoming_tts_cfg=wyoming_tts_cfg,
+                                openai_tts_cfg=openai_tts_cfg,
+                                kokoro_tts_cfg=kokoro_tts_cfg,
+                                piper_tts_cfg=piper_tts_cfg,
+                                wake_word_cfg=wake_word_cfg,
+                                system_prompt=system_prompt,
+                                agent_instructions=agent_instructions,
+                                live=live,
+                                stop_event=stop_event,
+                            ),
+                            LOGGER,
+                            quiet=general_cfg.quiet,
+                        ),
+                        port=metrics_port,
+                        textfile=metrics_file,
+                    ),
+                    enabled=debug_loop,
+                ),
+            )
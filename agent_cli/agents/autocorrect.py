@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import sys
 import time
+from pathlib import Path  # noqa: TC003
 from typing import TYPE_CHECKING
 
 import pyperclip
@@ -13,6 +15,8 @@ import typer
 
 from agent_cli import config, opts
 from agent_cli.cli import app
+from agent_cli.core import profiler
+from agent_cli.core.chunking import split_text
 from agent_cli.core.utils import (
     create_status,
     get_clipboard_text,
@@ -23,11 +27,22 @@ from agent_cli.core.utils import (
     print_with_style,
     setup_logging,
 )
-from agent_cli.services.llm import create_llm_agent
+from agent_cli.services.llm import (
+    ResponseCache,
+    create_llm_agent,
+    get_model_host,
+    get_model_name,
+    get_response_cache,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic_ai import Agent
     from rich.status import Status
 
+    from agent_cli.core.chunking import Chunk
+
 # --- Configuration ---
 
 # Template to clearly separate the text to be corrected from instructions
@@ -69,18 +84,21 @@ Correct grammar, spelling, and punctuation errors.
 Output format: corrected text only, no other words.
 """
 
+# Budget and requests in flight of `--incremental`, as `autocorrect-files` has by default
+_INCREMENTAL_MAX_TOKENS = 500
+_INCREMENTAL_CONCURRENCY = 4
+
 # --- Main Application Logic ---
 
 
-async def _process_text(
-    text: str,
+def _create_correction_agent(
     provider_cfg: config.ProviderSelection,
     ollama_cfg: config.Ollama,
     openai_llm_cfg: config.OpenAILLM,
     gemini_llm_cfg: config.GeminiLLM,
-) -> tuple[str, float]:
-    """Process text with the LLM and return the corrected text and elapsed time."""
-    agent = create_llm_agent(
+) -> Agent:
+    """Create the LLM agent that corrects text, which can be reused across requests."""
+    return create_llm_agent(
         provider_cfg=provider_cfg,
         ollama_cfg=ollama_cfg,
         openai_cfg=openai_llm_cfg,
@@ -89,13 +107,96 @@ async def _process_text(
         instructions=AGENT_INSTRUCTIONS,
     )
 
+
+def _cache_key(provider: str, model: str, host: str, text: str) -> str:
+    """Return the response cache key of correcting a text with a model."""
+    return ResponseCache.key(
+        provider=provider,
+        model=model,
+        host=host,
+        system_prompt=SYSTEM_PROMPT,
+        instructions=AGENT_INSTRUCTIONS,
+        user_input=INPUT_TEMPLATE.format(text=text),
+    )
+
+
+async def _correct_text(agent: Agent, text: str) -> str:
+    """Correct a text with the agent."""
     # Format the input using the template to clearly separate text from instructions
-    formatted_input = INPUT_TEMPLATE.format(text=text)
+    result = await agent.run(INPUT_TEMPLATE.format(text=text))
+    return result.output
+
+
+async def _correct_chunk(
+    get_agent: Callable[[], Agent],
+    chunk: Chunk,
+    semaphore: asyncio.Semaphore,
+    cache: ResponseCache | None,
+    cache_key: Callable[[str], str],
+) -> str:
+    """Correct a chunk of a longer text, or take its correction from the `cache`."""
+    if not chunk.text.strip():
+        return chunk.text
+    if cache is not None and (cached_text := await cache.get(cache_key(chunk.text))) is not None:
+        return cached_text
+    async with semaphore:
+        corrected_text = (await _correct_text(get_agent(), chunk.text)).strip()
+    if cache is not None:
+        await cache.put(cache_key(chunk.text), corrected_text)
+        # Rerunning on the corrected output, e.g., after editing it, reuses it as is
+        await cache.put(cache_key(corrected_text), corrected_text)
+    return corrected_text
+
 
+async def _process_text(
+    text: str,
+    provider_cfg: config.ProviderSelection,
+    ollama_cfg: config.Ollama,
+    openai_llm_cfg: config.OpenAILLM,
+    gemini_llm_cfg: config.GeminiLLM,
+    *,
+    cache: ResponseCache | None = None,
+    incremental: bool = False,
+) -> tuple[str, float]:
+    """Process text with the LLM and return the corrected text and elapsed time.
+
+    With a `cache`, an earlier correction of the same text by the same model is
+    returned without creating the agent or sending a request. With `incremental`,
+    this goes paragraph by paragraph, so that only new or edited paragraphs are
+    sent, and the text is rebuilt from their corrections.
+    """
     start_time = time.monotonic()
-    result = await agent.run(formatted_input)
+    model = get_model_name(provider_cfg, ollama_cfg, openai_llm_cfg, gemini_llm_cfg)
+    host = get_model_host(provider_cfg, ollama_cfg)
+    cache_key = functools.partial(_cache_key, provider_cfg.llm_provider, model, host)
+    # Only created on the first cache miss, which saves importing the LLM client
+    get_agent = functools.cache(
+        functools.partial(
+            _create_correction_agent,
+            provider_cfg,
+            ollama_cfg,
+            openai_llm_cfg,
+            gemini_llm_cfg,
+        ),
+    )
+    if incremental:
+        chunks = split_text(text, _INCREMENTAL_MAX_TOKENS, pack=False)
+        semaphore = asyncio.Semaphore(_INCREMENTAL_CONCURRENCY)
+        corrected_chunks = await asyncio.gather(
+            *(_correct_chunk(get_agent, chunk, semaphore, cache, cache_key) for chunk in chunks),
+        )
+        corrected_text = "".join(
+            corrected + chunk.separator
+            for corrected, chunk in zip(corrected_chunks, chunks, strict=True)
+        )
+        return corrected_text, time.monotonic() - start_time
+    corrected_text = await cache.get(cache_key(text)) if cache is not None else None
+    if corrected_text is None:
+        corrected_text = await _correct_text(get_agent(), text)
+        if cache is not None:
+            await cache.put(cache_key(text), corrected_text)
     elapsed = time.monotonic() - start_time
-    return result.output, elapsed
+    return corrected_text, elapsed
 
 
 def _display_original_text(original_text: str, quiet: bool) -> None:
@@ -136,12 +237,7 @@ def _maybe_status(
     quiet: bool,
 ) -> Status | contextlib.nullcontext:
     if not quiet:
-        if provider_cfg.llm_provider == "local":
-            model_name = ollama_cfg.llm_ollama_model
-        elif provider_cfg.llm_provider == "openai":
-            model_name = openai_llm_cfg.llm_openai_model
-        elif provider_cfg.llm_provider == "gemini":
-            model_name = gemini_llm_cfg.llm_gemini_model
+        model_name = get_model_name(provider_cfg, ollama_cfg, openai_llm_cfg, gemini_llm_cfg)
         return create_status(f"🤖 Correcting with {model_name}...", "bold yellow")
     return contextlib.nullcontext()
 
@@ -154,6 +250,8 @@ async def _async_autocorrect(
     openai_llm_cfg: config.OpenAILLM,
     gemini_llm_cfg: config.GeminiLLM,
     general_cfg: config.General,
+    cache: ResponseCache | None = None,
+    incremental: bool = False,
 ) -> None:
     """Asynchronous version of the autocorrect command."""
     setup_logging(general_cfg.log_level, general_cfg.log_file, quiet=general_cfg.quiet)
@@ -178,6 +276,8 @@ async def _async_autocorrect(
                 ollama_cfg,
                 openai_llm_cfg,
                 gemini_llm_cfg,
+                cache=cache,
+                incremental=incremental,
             )
 
         _display_result(corrected_text, original_text, elapsed, simple_output=general_cfg.quiet)
@@ -216,14 +316,21 @@ def autocorrect(
     # Gemini
     llm_gemini_model: str = opts.LLM_GEMINI_MODEL,
     gemini_api_key: str | None = opts.GEMINI_API_KEY,
+    llm_cache: bool = opts.LLM_CACHE,
+    incremental: bool = opts.INCREMENTAL,
     # --- General Options ---
     log_level: str = opts.LOG_LEVEL,
     log_file: str | None = opts.LOG_FILE,
+    profile_file: Path | None = opts.PROFILE,
     quiet: bool = opts.QUIET,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
 ) -> None:
-    """Correct text from clipboard using a local or remote LLM."""
+    """Correct text from clipboard using a local or remote LLM.
+
+    With `--incremental`, rerunning on a lightly edited text only sends the
+    paragraphs that changed.
+    """
     if print_args:
         print_command_line_args(locals())
     provider_cfg = config.ProviderSelection(
@@ -246,13 +353,21 @@ def autocorrect(
         quiet=quiet,
         clipboard=True,
     )
-    asyncio.run(
-        _async_autocorrect(
-            text=text,
-            provider_cfg=provider_cfg,
-            ollama_cfg=ollama_cfg,
-            openai_llm_cfg=openai_llm_cfg,
-            gemini_llm_cfg=gemini_llm_cfg,
-            general_cfg=general_cfg,
-        ),
-    )
+    # Incremental runs are built on the cache, so they use it regardless
+    use_cache = llm_cache or incremental
+    with (
+        profiler.profiling(profile_file),
+        get_response_cache() if use_cache else contextlib.nullcontext() as cache,
+    ):
+        asyncio.run(
+            _async_autocorrect(
+                text=text,
+                provider_cfg=provider_cfg,
+                ollama_cfg=ollama_cfg,
+                openai_llm_cfg=openai_llm_cfg,
+                gemini_llm_cfg=gemini_llm_cfg,
+                general_cfg=general_cfg,
+                cache=cache,
+                incremental=incremental,
+            ),
+        )
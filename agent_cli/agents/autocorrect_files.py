@@ -0,0 +1,232 @@
+"""Correct text files or standard input in bulk with concurrent requests to the LLM."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import sys
+import time
+from pathlib import Path  # noqa: TC003
+from typing import NamedTuple
+
+import typer
+from rich.console import Console
+
+from agent_cli import config, opts
+from agent_cli.agents.autocorrect import _cache_key, _correct_chunk, _create_correction_agent
+from agent_cli.cli import app
+from agent_cli.core import profiler
+from agent_cli.core.chunking import estimate_tokens, split_text
+from agent_cli.core.utils import (
+    find_files,
+    print_command_line_args,
+    print_error_message,
+    setup_logging,
+)
+from agent_cli.services.llm import (
+    ResponseCache,
+    get_model_host,
+    get_model_name,
+    get_response_cache,
+)
+
+LOGGER = logging.getLogger()
+
+TEXT_EXTENSIONS = frozenset({".txt", ".md", ".markdown", ".rst", ".tex", ".org"})
+
+# The corrected text goes to stdout, so progress and errors go to stderr
+_stderr = Console(stderr=True, soft_wrap=True)
+
+
+class Document(NamedTuple):
+    """A text to correct and where it came from."""
+
+    name: str
+    text: str
+
+
+def _read_documents(inputs: list[str]) -> list[Document]:
+    """Read the input files, or standard input for `-` or when there are no inputs."""
+    documents = [
+        Document(str(path), path.read_text(encoding="utf-8"))
+        for path in find_files([item for item in inputs if item != "-"], TEXT_EXTENSIONS)
+    ]
+    if not inputs or "-" in inputs:
+        documents.insert(0, Document("<stdin>", sys.stdin.read()))
+    return documents
+
+
+async def _async_main(
+    *,
+    documents: list[Document],
+    max_chunk_tokens: int,
+    concurrency: int,
+    provider_cfg: config.ProviderSelection,
+    ollama_cfg: config.Ollama,
+    openai_llm_cfg: config.OpenAILLM,
+    gemini_llm_cfg: config.GeminiLLM,
+    quiet: bool,
+    cache: ResponseCache | None = None,
+    incremental: bool = False,
+) -> int:
+    """Correct the documents and write them to stdout, returning the number of failed chunks.
+
+    All chunks are queued at once, with at most `concurrency` requests in flight,
+    and each is written as soon as it and all chunks before it are done. A chunk
+    that fails is written uncorrected. Chunks with a correction in the `cache` are
+    not sent; with `incremental`, every paragraph is a chunk of its own, so that
+    only new or edited paragraphs miss the cache.
+    """
+    # Only created on the first cache miss, which saves importing the LLM client
+    get_agent = functools.cache(
+        functools.partial(
+            _create_correction_agent,
+            provider_cfg,
+            ollama_cfg,
+            openai_llm_cfg,
+            gemini_llm_cfg,
+        ),
+    )
+    model = get_model_name(provider_cfg, ollama_cfg, openai_llm_cfg, gemini_llm_cfg)
+    host = get_model_host(provider_cfg, ollama_cfg)
+    cache_key = functools.partial(_cache_key, provider_cfg.llm_provider, model, host)
+    semaphore = asyncio.Semaphore(concurrency)
+    jobs = [
+        (
+            document,
+            chunk,
+            asyncio.create_task(_correct_chunk(get_agent, chunk, semaphore, cache, cache_key)),
+        )
+        for document in documents
+        for chunk in split_text(document.text, max_chunk_tokens, pack=not incremental)
+    ]
+    start_time = time.perf_counter()
+    n_failed = 0
+    current_document = None
+    for document, chunk, task in jobs:
+        if document is not current_document:
+            if current_document is not None:
+                sys.stdout.write("\n")
+            if len(documents) > 1:
+                sys.stdout.write(f"==> {document.name} <==\n")
+            current_document = document
+        try:
+            corrected_text = await task
+        except Exception as e:
+            LOGGER.exception("Failed to correct a chunk of %s", document.name)
+            _stderr.print(f"[bold red]❌ {document.name}: {e}[/bold red]")
+            corrected_text = chunk.text
+            n_failed += 1
+        sys.stdout.write(corrected_text + chunk.separator)
+        sys.stdout.flush()
+    if not quiet:
+        elapsed = time.perf_counter() - start_time
+        n_tokens = sum(estimate_tokens(chunk.text) for _, chunk, _ in jobs)
+        cached = f", {cache.hits} from cache" if cache is not None else ""
+        _stderr.print(
+            f"[bold blue]📊 Corrected {len(jobs) - n_failed} of {len(jobs)} chunk(s){cached}"
+            f" (~{n_tokens} tokens) from {len(documents)} document(s) in {elapsed:.1f}s"
+            f" (~{n_tokens / elapsed if elapsed > 0 else 0:.0f} tokens/s).[/bold blue]",
+        )
+    return n_failed
+
+
+@app.command("autocorrect-files")
+def autocorrect_files(
+    *,
+    inputs: list[str] = typer.Argument(  # noqa: B008
+        None,
+        help="Text files, glob patterns, or directories (searched recursively) to correct."
+        " Reads standard input if omitted or `-`.",
+        rich_help_panel="General Options",
+        show_default=False,
+    ),
+    concurrency: int = opts.CONCURRENCY,
+    max_chunk_tokens: int = opts.MAX_CHUNK_TOKENS,
+    incremental: bool = opts.INCREMENTAL,
+    # --- Provider Selection ---
+    llm_provider: str = opts.LLM_PROVIDER,
+    # --- LLM Configuration ---
+    # Ollama (local service)
+    llm_ollama_model: str = opts.LLM_OLLAMA_MODEL,
+    llm_ollama_host: str = opts.LLM_OLLAMA_HOST,
+    # OpenAI
+    llm_openai_model: str = opts.LLM_OPENAI_MODEL,
+    openai_api_key: str | None = opts.OPENAI_API_KEY,
+    # Gemini
+    llm_gemini_model: str = opts.LLM_GEMINI_MODEL,
+    gemini_api_key: str | None = opts.GEMINI_API_KEY,
+    llm_cache: bool = opts.LLM_CACHE,
+    # --- General Options ---
+    log_level: str = opts.LOG_LEVEL,
+    log_file: str | None = opts.LOG_FILE,
+    profile_file: Path | None = opts.PROFILE,
+    quiet: bool = opts.QUIET,
+    config_file: str | None = opts.CONFIG_FILE,
+    print_args: bool = opts.PRINT_ARGS,
+) -> None:
+    """Correct text files or standard input in bulk using a local or remote LLM.
+
+    The text is split at paragraph boundaries into chunks of about
+    `--max-chunk-tokens` tokens, which are corrected with up to `--concurrency`
+    requests in flight. The corrected text is written to stdout in the original
+    order as soon as each chunk is ready, and the separators between paragraphs
+    are kept as they were. With `--incremental`, paragraphs that were corrected
+    before (or are the output of an earlier run) are taken from the LLM cache.
+
+    Usage:
+    - Proofread a draft: agent-cli autocorrect-files draft.md > draft.corrected.md
+    - From a pipe: pbpaste | agent-cli autocorrect-files --quiet
+    - Several documents with 8 parallel requests: agent-cli autocorrect-files docs/ -j 8
+    - Re-check a lightly edited draft: agent-cli autocorrect-files draft.md --incremental
+    """
+    if print_args:
+        print_command_line_args(locals())
+    setup_logging(log_level, log_file, quiet=quiet)
+    inputs = inputs or []
+    if not inputs and sys.stdin.isatty():
+        print_error_message("No input.", "Pass text files, or pipe text into standard input.")
+        raise typer.Exit(1)
+    documents = _read_documents(inputs)
+    if not documents:
+        print_error_message("No text files found.", f"Searched: {', '.join(inputs)}")
+        raise typer.Exit(1)
+
+    provider_cfg = config.ProviderSelection(
+        llm_provider=llm_provider,
+        asr_provider="local",  # Not used
+        tts_provider="piper",  # Not used
+    )
+    ollama_cfg = config.Ollama(llm_ollama_model=llm_ollama_model, llm_ollama_host=llm_ollama_host)
+    openai_llm_cfg = config.OpenAILLM(
+        llm_openai_model=llm_openai_model,
+        openai_api_key=openai_api_key,
+    )
+    gemini_llm_cfg = config.GeminiLLM(
+        llm_gemini_model=llm_gemini_model,
+        gemini_api_key=gemini_api_key,
+    )
+    # Incremental runs are built on the cache, so they use it regardless
+    use_cache = llm_cache or incremental
+    with (
+        profiler.profiling(profile_file),
+        get_response_cache() if use_cache else contextlib.nullcontext() as cache,
+    ):
+        n_failed = asyncio.run(
+            _async_main(
+                documents=documents,
+                max_chunk_tokens=max_chunk_tokens,
+                concurrency=concurrency,
+                provider_cfg=provider_cfg,
+                ollama_cfg=ollama_cfg,
+                openai_llm_cfg=openai_llm_cfg,
+                gemini_llm_cfg=gemini_llm_cfg,
+                quiet=quiet,
+                cache=cache,
+                incremental=incremental,
+            ),
+        )
+    if n_failed:
+        raise typer.Exit(1)
@@ -27,7 +27,7 @@ import typer
 from agent_cli import config, opts
 from agent_cli._tools import tools
 from agent_cli.cli import app
-from agent_cli.core import process
+from agent_cli.core import loop_monitor, metrics, process, profiler, tracing
 from agent_cli.core.audio import pyaudio_context, setup_devices
 from agent_cli.core.utils import (
     InteractiveStopEvent,
@@ -49,6 +49,7 @@ from agent_cli.services.tts import handle_tts_playback
 
 if TYPE_CHECKING:
     import pyaudio
+    from pydantic_ai.tools import Tool
     from rich.live import Live
 
 
@@ -71,7 +72,7 @@ SYSTEM_PROMPT = """\
 You are a helpful and friendly conversational AI with long-term memory. Your role is to assist the user with their questions and tasks.
 
 You have access to the following tools:
-- read_file: Read the content of a file.
+- read_file: Read the content of a file. Large files are truncated; use offset/limit or start_line/end_line to read specific parts.
 - execute_code: Execute a shell command.
 - add_memory: Add important information to long-term memory for future recall.
 - search_memory: Search your long-term memory for relevant information.
@@ -164,6 +165,7 @@ async def _handle_conversation_turn(
     openai_tts_cfg: config.OpenAITTS,
     kokoro_tts_cfg: config.KokoroTTS,
     piper_tts_cfg: config.PiperTTS,
+    chat_tools: list[Tool],
     live: Live,
 ) -> None:
     """Handles a single turn of the conversation."""
@@ -240,7 +242,7 @@ async def _handle_conversation_turn(
             openai_cfg=openai_llm_cfg,
             gemini_cfg=gemini_llm_cfg,
             logger=LOGGER,
-            tools=tools(),
+            tools=chat_tools,
             quiet=True,  # Suppress internal output since we're showing our own timer
             live=live,
         )
@@ -343,6 +345,9 @@ async def _async_main(
                     history_cfg.last_n_messages,
                 )
 
+            # Created once so cached tool results are reused across turns
+            chat_tools = tools()
+
             with (
                 maybe_live(not general_cfg.quiet) as live,
                 signal_handling_context(LOGGER, general_cfg.quiet) as stop_event,
@@ -366,6 +371,7 @@ async def _async_main(
                         openai_tts_cfg=openai_tts_cfg,
                         kokoro_tts_cfg=kokoro_tts_cfg,
                         piper_tts_cfg=piper_tts_cfg,
+                        chat_tools=chat_tools,
                         live=live,
                     )
     except Exception:
@@ -438,6 +444,11 @@ def chat(
     save_file: Path | None = opts.SAVE_FILE,
     log_level: str = opts.LOG_LEVEL,
     log_file: str | None = opts.LOG_FILE,
+    trace_file: Path | None = opts.TRACE_FILE,
+    debug_loop: bool = opts.DEBUG_LOOP,
+    profile_file: Path | None = opts.PROFILE,
+    metrics_port: int | None = opts.METRICS_PORT,
+    metrics_file: Path | None = opts.METRICS_FILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
     config_file: str | None = opts.CONFIG_FILE,
@@ -533,21 +544,29 @@ def chat(
             last_n_messages=last_n_messages,
         )
 
-        asyncio.run(
-            _async_main(
-                provider_cfg=provider_cfg,
-                general_cfg=general_cfg,
-                history_cfg=history_cfg,
-                audio_in_cfg=audio_in_cfg,
-                wyoming_asr_cfg=wyoming_asr_cfg,
-                openai_asr_cfg=openai_asr_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_llm_cfg=openai_llm_cfg,
-                gemini_llm_cfg=gemini_llm_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
-                piper_tts_cfg=piper_tts_cfg,
-            ),
-        )
+        with tracing.tracing(trace_file), profiler.profiling(profile_file):
+            asyncio.run(
+                loop_monitor.run_with_monitor(
+                    metrics.run_with_exporter(
+                        _async_main(
+                            provider_cfg=provider_cfg,
+                            general_cfg=general_cfg,
+                            history_cfg=history_cfg,
+                            audio_in_cfg=audio_in_cfg,
+                            wyoming_asr_cfg=wyoming_asr_cfg,
+                            openai_asr_cfg=openai_asr_cfg,
+                            ollama_cfg=ollama_cfg,
+                            openai_llm_cfg=openai_llm_cfg,
+                            gemini_llm_cfg=gemini_llm_cfg,
+                            audio_out_cfg=audio_out_cfg,
+                            wyoming_tts_cfg=wyoming_tts_cfg,
+                            openai_tts_cfg=openai_tts_cfg,
+                            kokoro_tts_cfg=kokoro_tts_cfg,
+                            piper_tts_cfg=piper_tts_cfg,
+                        ),
+                        port=metrics_port,
+                        textfile=metrics_file,
+                    ),
+                    enabled=debug_loop,
+                ),
+            )
@@ -4,25 +4,32 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING
 
 import typer
 
 from agent_cli import config, opts
 from agent_cli.cli import app
-from agent_cli.core import process
+from agent_cli.core import ipc, loop_monitor, process, profiler, tracing
 from agent_cli.core.audio import pyaudio_context, setup_devices
 from agent_cli.core.utils import (
     get_clipboard_text,
     maybe_live,
     print_command_line_args,
     print_input_panel,
+    run_with_control_socket,
     setup_logging,
     stop_or_status_or_toggle,
 )
 from agent_cli.services.tts import handle_tts_playback
 
+if TYPE_CHECKING:
+    import pyaudio
+
+    from agent_cli.core.utils import InteractiveStopEvent
+
 LOGGER = logging.getLogger()
 
 
@@ -36,9 +43,15 @@ async def _async_main(
     openai_tts_cfg: config.OpenAITTS,
     kokoro_tts_cfg: config.KokoroTTS,
     piper_tts_cfg: config.PiperTTS,
+    p: pyaudio.PyAudio | None = None,
+    stop_event: InteractiveStopEvent | None = None,
 ) -> None:
-    """Async entry point for the speak command."""
-    with pyaudio_context() as p:
+    """Async entry point for the speak command.
+
+    Setting `stop_event` cuts the playback short.
+    """
+    audio_context = nullcontext(p) if p is not None else pyaudio_context()
+    with audio_context as p:  # noqa: PLR1704
         # We only use setup_devices for its output device handling
         device_info = setup_devices(p, general_cfg, None, audio_out_cfg)
         if device_info is None:
@@ -73,6 +86,7 @@ async def _async_main(
                 status_message="🔊 Synthesizing speech...",
                 description="Audio",
                 live=live,
+                stop_event=stop_event,
             )
 
 
@@ -120,6 +134,9 @@ def speak(
     toggle: bool = opts.TOGGLE,
     log_level: str = opts.LOG_LEVEL,
     log_file: str | None = opts.LOG_FILE,
+    trace_file: Path | None = opts.TRACE_FILE,
+    debug_loop: bool = opts.DEBUG_LOOP,
+    profile_file: Path | None = opts.PROFILE,
     quiet: bool = opts.QUIET,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
@@ -147,7 +164,11 @@ def speak(
         return
 
     # Use context manager for PID file management
-    with process.pid_file_context(process_name), suppress(KeyboardInterrupt):
+    control_socket = ipc.socket_path(process_name)
+    with (
+        process.pid_file_context(process_name, control_socket=control_socket),
+        suppress(KeyboardInterrupt),
+    ):
         provider_cfg = config.ProviderSelection(
             tts_provider=tts_provider,
             asr_provider="local",  # Not used
@@ -185,15 +206,25 @@ def speak(
             tts_piper_noise_w_scale=tts_piper_noise_w_scale,
         )
 
-        asyncio.run(
-            _async_main(
-                general_cfg=general_cfg,
-                text=text,
-                provider_cfg=provider_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
-                piper_tts_cfg=piper_tts_cfg,
-            ),
-        )
+        with tracing.tracing(trace_file), profiler.profiling(profile_file):
+            asyncio.run(
+                loop_monitor.run_with_monitor(
+                    run_with_control_socket(
+                        control_socket,
+                        lambda stop_event: _async_main(
+                            general_cfg=general_cfg,
+                            text=text,
+                            provider_cfg=provider_cfg,
+                            audio_out_cfg=audio_out_cfg,
+                            wyoming_tts_cfg=wyoming_tts_cfg,
+                            openai_tts_cfg=openai_tts_cfg,
+                            kokoro_tts_cfg=kokoro_tts_cfg,
+                            piper_tts_cfg=piper_tts_cfg,
+                            stop_event=stop_event,
+                        ),
+                        LOGGER,
+                        quiet=general_cfg.quiet,
+                    ),
+                    enabled=debug_loop,
+                ),
+            )
@@ -3,38 +3,59 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import platform
 import time
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from datetime import UTC, datetime
 from pathlib import Path  # noqa: TC003
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pyperclip
 import typer
 
 from agent_cli import config, opts
 from agent_cli.cli import app
-from agent_cli.core import process
-from agent_cli.core.audio import pyaudio_context, setup_devices
+from agent_cli.core import ipc, loop_monitor, process, profiler, text_cleanup, tracing, vad
+from agent_cli.core.audio import (
+    open_pyaudio_stream,
+    pyaudio_context,
+    read_audio_stream,
+    setup_devices,
+    setup_input_stream,
+)
 from agent_cli.core.utils import (
+    flush_process,
     maybe_live,
     print_command_line_args,
+    print_error_message,
     print_input_panel,
     print_output_panel,
     print_with_style,
+    run_with_control_socket,
     setup_logging,
     signal_handling_context,
     stop_or_status_or_toggle,
 )
 from agent_cli.services import asr
-from agent_cli.services.llm import process_and_update_clipboard
+from agent_cli.services.llm import (
+    INPUT_TEMPLATE,
+    get_llm_response,
+    get_model_name,
+    get_response_cache,
+    process_and_update_clipboard,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pyaudio
 
+    from agent_cli.core.utils import InteractiveStopEvent
+    from agent_cli.services.llm import ResponseCache
+
 LOGGER = logging.getLogger()
 
 SYSTEM_PROMPT = """
@@ -106,6 +127,34 @@ def log_transcription(
         f.write(json.dumps(log_entry) + "\n")
 
 
+def _fast_path_cleanup(
+    transcript: str,
+    max_words: int,
+    general_cfg: config.General,
+) -> str | None:
+    """Clean up a short transcript with rules, or return None if it needs the LLM.
+
+    The result is copied and shown like the LLM's would be.
+    """
+    cleanup = text_cleanup.heuristic_cleanup(transcript, max_words=max_words)
+    text_cleanup.record(fast_path=cleanup.confident)
+    if not cleanup.confident:
+        LOGGER.info("Cleaning up with the LLM: %s", cleanup.reason)
+        return None
+    if general_cfg.clipboard:
+        pyperclip.copy(cleanup.text)
+        LOGGER.info("Copied result to clipboard.")
+    if not general_cfg.quiet:
+        print_output_panel(
+            cleanup.text,
+            title="✨ Result (Copied to Clipboard)" if general_cfg.clipboard else "✨ Result",
+            subtitle="[dim]cleaned up without the LLM[/dim]",
+        )
+    elif general_cfg.clipboard:
+        print(cleanup.text)
+    return cleanup.text
+
+
 async def _async_main(  # noqa: PLR0912
     *,
     extra_instructions: str | None,
@@ -120,11 +169,24 @@ async def _async_main(  # noqa: PLR0912
     llm_enabled: bool,
     transcription_log: Path | None,
     p: pyaudio.PyAudio,
-) -> None:
-    """Async entry point, consuming parsed args."""
+    stop_event: InteractiveStopEvent | None = None,
+    llm_cache: ResponseCache | None = None,
+    llm_fast_path_words: int = 0,
+) -> str | None:
+    """Async entry point, consuming parsed args.
+
+    Returns the (processed) transcript. Recording stops on SIGINT/SIGTERM, or when
+    the given `stop_event` is set (as done by the daemon, which must not install
+    signal handlers).
+    """
     start_time = time.monotonic()
+    stop_context = (
+        nullcontext(stop_event)
+        if stop_event is not None
+        else signal_handling_context(LOGGER, general_cfg.quiet)
+    )
     with maybe_live(not general_cfg.quiet) as live:
-        with signal_handling_context(LOGGER, general_cfg.quiet) as stop_event:
+        with stop_context as stop_event:  # noqa: PLR1704
             transcriber = asr.create_transcriber(
                 provider_cfg,
                 audio_in_cfg,
@@ -158,20 +220,30 @@ async def _async_main(  # noqa: PLR0912
             elif provider_cfg.llm_provider == "gemini":
                 model_info = f"{provider_cfg.llm_provider}:{gemini_llm_cfg.llm_gemini_model}"
 
-            processed_transcript = await process_and_update_clipboard(
-                system_prompt=SYSTEM_PROMPT,
-                agent_instructions=instructions,
-                provider_cfg=provider_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_cfg=openai_llm_cfg,
-                gemini_cfg=gemini_llm_cfg,
-                logger=LOGGER,
-                original_text=transcript,
-                instruction=INSTRUCTION,
-                clipboard=general_cfg.clipboard,
-                quiet=general_cfg.quiet,
-                live=live,
+            # Custom instructions need the LLM, even for a short transcript
+            processed_transcript = (
+                _fast_path_cleanup(transcript, llm_fast_path_words, general_cfg)
+                if llm_fast_path_words and not extra_instructions
+                else None
             )
+            if processed_transcript is not None:
+                model_info = "rules"
+            else:
+                processed_transcript = await process_and_update_clipboard(
+                    system_prompt=SYSTEM_PROMPT,
+                    agent_instructions=instructions,
+                    provider_cfg=provider_cfg,
+                    ollama_cfg=ollama_cfg,
+                    openai_cfg=openai_llm_cfg,
+                    gemini_cfg=gemini_llm_cfg,
+                    logger=LOGGER,
+                    original_text=transcript,
+                    instruction=INSTRUCTION,
+                    clipboard=general_cfg.clipboard,
+                    quiet=general_cfg.quiet,
+                    live=live,
+                    cache=llm_cache,
+                )
 
             # Log transcription if requested
             if transcription_log:
@@ -182,7 +254,7 @@ async def _async_main(  # noqa: PLR0912
                     processed_transcript=processed_transcript,
                     model_info=model_info,
                 )
-            return
+            return processed_transcript
 
     # When not using LLM, show transcript in output panel for consistency
     if transcript:
@@ -221,6 +293,227 @@ async def _async_main(  # noqa: PLR0912
                 "⚠️ No transcript captured.",
                 style="yellow",
             )
+    return transcript
+
+
+async def _clean_up_utterance(
+    transcript: str,
+    *,
+    extra_instructions: str | None,
+    llm_fast_path_words: int,
+    provider_cfg: config.ProviderSelection,
+    ollama_cfg: config.Ollama,
+    openai_llm_cfg: config.OpenAILLM,
+    gemini_llm_cfg: config.GeminiLLM,
+    llm_cache: ResponseCache | None,
+) -> tuple[str, str | None]:
+    """Clean up the transcript of an utterance, returning it and the model that did it.
+
+    Unlike the cleanup of a single recording, this shows and copies nothing, and
+    an LLM error keeps the raw transcript instead of ending the session.
+    """
+    if llm_fast_path_words and not extra_instructions:
+        cleanup = text_cleanup.heuristic_cleanup(transcript, max_words=llm_fast_path_words)
+        text_cleanup.record(fast_path=cleanup.confident)
+        if cleanup.confident:
+            return cleanup.text, "rules"
+    instructions = AGENT_INSTRUCTIONS
+    if extra_instructions:
+        instructions += f"\n\n{extra_instructions}"
+    # The status line shows the recording, so the LLM runs without a display
+    processed = await get_llm_response(
+        system_prompt=SYSTEM_PROMPT,
+        agent_instructions=instructions,
+        user_input=INPUT_TEMPLATE.format(original_text=transcript, instruction=INSTRUCTION),
+        provider_cfg=provider_cfg,
+        ollama_cfg=ollama_cfg,
+        openai_cfg=openai_llm_cfg,
+        gemini_cfg=gemini_llm_cfg,
+        logger=LOGGER,
+        quiet=True,
+        cache=llm_cache,
+    )
+    if processed is None:  # The error is logged
+        return transcript, None
+    model_name = get_model_name(provider_cfg, ollama_cfg, openai_llm_cfg, gemini_llm_cfg)
+    return processed, f"{provider_cfg.llm_provider}:{model_name}"
+
+
+def _append_utterance(
+    texts: list[str],
+    text: str,
+    *,
+    general_cfg: config.General,
+    title: str,
+    output_file: Path | None,
+) -> None:
+    """Add the text of an utterance to the clipboard, stdout, and `output_file`."""
+    texts.append(text)
+    if general_cfg.clipboard:
+        pyperclip.copy(" ".join(texts))
+    if general_cfg.quiet:
+        print(text, flush=True)
+    else:
+        copied = ", all copied to clipboard" if general_cfg.clipboard else ""
+        print_output_panel(text, title=title, subtitle=f"[dim]utterance {len(texts)}{copied}[/dim]")
+    if output_file:
+        with output_file.open("a", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+async def _forward_flush_requests(
+    flush_requests: asyncio.Queue[asyncio.Future[str | None]],
+    end_utterance: Callable[[], None],
+    utterances: asyncio.Queue[Any],
+) -> None:
+    """End the current utterance on each flush request and queue the request after it."""
+    while True:
+        flushed = await flush_requests.get()
+        end_utterance()
+        utterances.put_nowait(flushed)
+
+
+async def _async_continuous(  # noqa: PLR0915
+    *,
+    extra_instructions: str | None,
+    provider_cfg: config.ProviderSelection,
+    general_cfg: config.General,
+    audio_in_cfg: config.AudioInput,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    ollama_cfg: config.Ollama,
+    openai_llm_cfg: config.OpenAILLM,
+    gemini_llm_cfg: config.GeminiLLM,
+    llm_enabled: bool,
+    transcription_log: Path | None,
+    p: pyaudio.PyAudio,
+    stop_event: InteractiveStopEvent | None = None,
+    llm_cache: ResponseCache | None = None,
+    llm_fast_path_words: int = 0,
+    output_file: Path | None = None,
+    flush_requests: asyncio.Queue[asyncio.Future[str | None]] | None = None,
+) -> str | None:
+    """Dictate utterance after utterance until stopped, for `--continuous`.
+
+    The microphone stays open while an `UtteranceSegmenter` splits its audio at
+    pauses. Each utterance is streamed to the ASR service by its own task while it
+    is spoken, and an output task takes the transcripts in order, cleans them up
+    (if enabled), and appends them to the clipboard, stdout, the transcription log,
+    and `output_file`. So capturing an utterance overlaps with transcribing and
+    cleaning up the ones before it. Each future from `flush_requests` ends the
+    current utterance and gets the transcripts so far, once that one is done.
+
+    Returns all (processed) transcripts, joined by spaces.
+    """
+    stop_context = (
+        nullcontext(stop_event)
+        if stop_event is not None
+        else signal_handling_context(LOGGER, general_cfg.quiet)
+    )
+    asr_model_info = provider_cfg.asr_provider
+    if provider_cfg.asr_provider == "openai":
+        asr_model_info += f":{openai_asr_cfg.asr_openai_model}"
+    segmenter = vad.UtteranceSegmenter()
+    # Transcriptions of the utterances, with the flush requests in between
+    utterances: asyncio.Queue[asyncio.Task[str] | asyncio.Future[str | None] | None] = (
+        asyncio.Queue()
+    )
+    audio: asyncio.Queue[bytes | None] | None = None  # Of the utterance being spoken
+    texts: list[str] = []
+
+    def segment(items: list[bytes | None]) -> None:
+        nonlocal audio
+        for item in items:
+            if audio is None:
+                audio = asyncio.Queue()
+                transcription = asr.transcribe_utterance(
+                    audio,
+                    provider_cfg=provider_cfg,
+                    wyoming_asr_cfg=wyoming_asr_cfg,
+                    openai_asr_cfg=openai_asr_cfg,
+                    logger=LOGGER,
+                )
+                utterances.put_nowait(asyncio.create_task(transcription))
+            audio.put_nowait(item)
+            if item is None:
+                audio = None
+
+    async def output() -> None:
+        while (task := await utterances.get()) is not None:
+            if not isinstance(task, asyncio.Task):  # A flush request
+                if not task.done():
+                    task.set_result(" ".join(texts) or None)
+                continue
+            try:
+                transcript = (await task).strip()
+            except Exception:
+                LOGGER.exception("Error transcribing an utterance")
+                if not general_cfg.quiet:
+                    print_with_style("⚠️ An utterance could not be transcribed.", style="yellow")
+                continue
+            if not transcript:
+                LOGGER.info("Transcript of utterance empty.")
+                continue
+            processed, model_info = None, asr_model_info
+            if llm_enabled:
+                processed, model_info = await _clean_up_utterance(
+                    transcript,
+                    extra_instructions=extra_instructions,
+                    llm_fast_path_words=llm_fast_path_words,
+                    provider_cfg=provider_cfg,
+                    ollama_cfg=ollama_cfg,
+                    openai_llm_cfg=openai_llm_cfg,
+                    gemini_llm_cfg=gemini_llm_cfg,
+                    llm_cache=llm_cache,
+                )
+            _append_utterance(
+                texts,
+                processed or transcript,
+                general_cfg=general_cfg,
+                title="✨ Result" if llm_enabled else "📝 Transcript",
+                output_file=output_file,
+            )
+            if transcription_log:
+                log_transcription(
+                    log_file=transcription_log,
+                    role="assistant" if llm_enabled else "user",
+                    raw_transcript=transcript,
+                    processed_transcript=processed,
+                    model_info=model_info or asr_model_info,
+                )
+
+    with maybe_live(not general_cfg.quiet) as live:
+        output_task = asyncio.create_task(output())
+        flush_task = asyncio.create_task(
+            _forward_flush_requests(
+                flush_requests or asyncio.Queue(),
+                lambda: segment(segmenter.flush()),
+                utterances,
+            ),
+        )
+        with stop_context as stop_event:  # noqa: PLR1704
+            stream_kwargs = setup_input_stream(audio_in_cfg.input_device_index)
+            with tracing.span("asr.capture"), open_pyaudio_stream(p, **stream_kwargs) as stream:
+                await read_audio_stream(
+                    stream=stream,
+                    stop_event=stop_event,
+                    chunk_handler=lambda chunk: segment(segmenter.process(chunk)),
+                    logger=LOGGER,
+                    live=live,
+                    quiet=general_cfg.quiet,
+                    progress_message="Dictating (Ctrl+C to finish)",
+                    progress_style="blue",
+                )
+            flush_task.cancel()
+            segment(segmenter.flush())
+            utterances.put_nowait(None)
+            LOGGER.info("Dictated %d utterance(s)", segmenter.utterances)
+            LOGGER.info(segmenter.gate.summary())
+            # Finish the utterances that are still being transcribed or cleaned up
+            await output_task
+    if not texts and not general_cfg.quiet:
+        print_with_style("⚠️ No transcript captured.", style="yellow")
+    return " ".join(texts) or None
 
 
 @app.command("transcribe")
@@ -248,14 +541,23 @@ def transcribe(
     llm_gemini_model: str = opts.LLM_GEMINI_MODEL,
     gemini_api_key: str | None = opts.GEMINI_API_KEY,
     llm: bool = opts.LLM,
+    llm_fast_path_words: int = opts.LLM_FAST_PATH_WORDS,
+    llm_cache: bool = opts.LLM_CACHE,
+    # --- Dictation Options ---
+    continuous: bool = opts.CONTINUOUS,
+    output_file: Path | None = opts.OUTPUT_FILE,
     # --- Process Management ---
     stop: bool = opts.STOP,
     status: bool = opts.STATUS,
     toggle: bool = opts.TOGGLE,
+    flush: bool = opts.FLUSH,
     # --- General Options ---
     clipboard: bool = opts.CLIPBOARD,
     log_level: str = opts.LOG_LEVEL,
     log_file: str | None = opts.LOG_FILE,
+    trace_file: Path | None = opts.TRACE_FILE,
+    debug_loop: bool = opts.DEBUG_LOOP,
+    profile_file: Path | None = opts.PROFILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
     config_file: str | None = opts.CONFIG_FILE,
@@ -270,6 +572,9 @@ def transcribe(
     # Expand user path for transcription log
     if transcription_log:
         transcription_log = transcription_log.expanduser()
+    if output_file and not continuous:
+        print_error_message("--output-file requires --continuous.")
+        raise typer.Exit(1)
 
     general_cfg = config.General(
         log_level=log_level,
@@ -279,6 +584,10 @@ def transcribe(
         clipboard=clipboard,
     )
     process_name = "transcribe"
+    if flush:
+        if not flush_process(process_name, "transcribe", quiet=general_cfg.quiet):
+            raise typer.Exit(1)
+        return
     if stop_or_status_or_toggle(
         process_name,
         "transcribe",
@@ -327,21 +636,48 @@ def transcribe(
         input_device_index, _, _ = device_info
         audio_in_cfg.input_device_index = input_device_index
 
-        # Use context manager for PID file management
-        with process.pid_file_context(process_name), suppress(KeyboardInterrupt):
-            asyncio.run(
-                _async_main(
-                    extra_instructions=extra_instructions,
-                    provider_cfg=provider_cfg,
-                    general_cfg=general_cfg,
-                    audio_in_cfg=audio_in_cfg,
-                    wyoming_asr_cfg=wyoming_asr_cfg,
-                    openai_asr_cfg=openai_asr_cfg,
-                    ollama_cfg=ollama_cfg,
-                    openai_llm_cfg=openai_llm_cfg,
-                    gemini_llm_cfg=gemini_llm_cfg,
-                    llm_enabled=llm,
-                    transcription_log=transcription_log,
-                    p=p,
-                ),
+        # The control socket lets `--stop` end the recording without signal polling
+        control_socket = ipc.socket_path(process_name)
+        with (
+            process.pid_file_context(process_name, control_socket=control_socket),
+            suppress(KeyboardInterrupt),
+            get_response_cache() if llm_cache else nullcontext() as response_cache,
+        ):
+            extra_kwargs: dict[str, Any] = {}
+            if output_file:
+                extra_kwargs["output_file"] = output_file.expanduser()
+            # Only a continuous session has utterances to end on `--flush`
+            flush_requests: asyncio.Queue[asyncio.Future[str | None]] | None = None
+            if continuous:
+                flush_requests = extra_kwargs["flush_requests"] = asyncio.Queue()
+            main = functools.partial(
+                _async_continuous if continuous else _async_main,
+                extra_instructions=extra_instructions,
+                provider_cfg=provider_cfg,
+                general_cfg=general_cfg,
+                audio_in_cfg=audio_in_cfg,
+                wyoming_asr_cfg=wyoming_asr_cfg,
+                openai_asr_cfg=openai_asr_cfg,
+                ollama_cfg=ollama_cfg,
+                openai_llm_cfg=openai_llm_cfg,
+                gemini_llm_cfg=gemini_llm_cfg,
+                llm_enabled=llm,
+                transcription_log=transcription_log,
+                p=p,
+                llm_cache=response_cache,
+                llm_fast_path_words=llm_fast_path_words,
+                **extra_kwargs,
             )
+            with tracing.tracing(trace_file), profiler.profiling(profile_file):
+                asyncio.run(
+                    loop_monitor.run_with_monitor(
+                        run_with_control_socket(
+                            control_socket,
+                            lambda stop_event: main(stop_event=stop_event),
+                            LOGGER,
+                            quiet=general_cfg.quiet,
+                            flush_requests=flush_requests,
+                        ),
+                        enabled=debug_loop,
+                    ),
+                )
@@ -0,0 +1,265 @@
+"""Transcribe audio files in bulk with concurrent requests to the ASR service."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import typer
+
+from agent_cli import config, opts
+from agent_cli.cli import app
+from agent_cli.core import profiler
+from agent_cli.core.audio_file import find_audio_files, load_audio, pcm_duration
+from agent_cli.core.utils import (
+    print_command_line_args,
+    print_error_message,
+    print_with_style,
+    setup_logging,
+)
+from agent_cli.services import asr
+
+LOGGER = logging.getLogger()
+
+
+class FileResult(NamedTuple):
+    """The outcome of transcribing a single file."""
+
+    path: Path
+    duration: float  # Seconds of audio
+    elapsed: float  # Seconds spent decoding and transcribing
+    text: str | None = None
+    error: str | None = None
+
+
+def _sidecar_path(path: Path) -> Path:
+    # Keep the audio extension, so `a.wav` and `a.mp3` get their own transcripts
+    return path.with_name(path.name + ".txt")
+
+
+def _completed_files(output: Path) -> set[str]:
+    """Return the files that already have a transcript in a JSONL output file."""
+    if not output.exists():
+        return set()
+    completed = set()
+    with output.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # E.g., a line cut off by an interrupted run
+            if isinstance(record, dict) and record.get("text") is not None:
+                completed.add(record["file"])
+    return completed
+
+
+async def _transcribe_file(
+    path: Path,
+    files: asyncio.Semaphore,
+    requests: asyncio.Semaphore,
+    *,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+) -> FileResult:
+    async with files:
+        start_time = time.perf_counter()
+        duration = 0.0
+        try:
+            audio_data = await load_audio(path)
+            duration = pcm_duration(audio_data)
+            text = await asr.transcribe_recording(
+                audio_data,
+                provider_cfg=provider_cfg,
+                wyoming_asr_cfg=wyoming_asr_cfg,
+                openai_asr_cfg=openai_asr_cfg,
+                logger=LOGGER,
+                semaphore=requests,
+            )
+        except Exception as e:
+            LOGGER.exception("Failed to transcribe %s", path)
+            return FileResult(path, duration, time.perf_counter() - start_time, error=str(e))
+        return FileResult(path, duration, time.perf_counter() - start_time, text=text)
+
+
+def _write_result(result: FileResult, output: Path | None) -> None:
+    """Append the result to the JSONL output, or write the transcript next to the audio file."""
+    if output is None:
+        if result.text is not None:
+            _sidecar_path(result.path).write_text(result.text + "\n", encoding="utf-8")
+        return
+    record = {
+        "file": str(result.path),
+        "duration": round(result.duration, 3),
+        "elapsed": round(result.elapsed, 3),
+    }
+    record.update({"text": result.text} if result.error is None else {"error": result.error})
+    with output.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _print_summary(results: list[FileResult], n_skipped: int, wall_time: float) -> None:
+    audio_seconds = sum(r.duration for r in results if r.error is None)
+    n_failed = sum(r.error is not None for r in results)
+    speed = audio_seconds / wall_time if wall_time > 0 else 0.0
+    print_with_style(
+        f"📊 Transcribed {len(results) - n_failed} file(s), {n_failed} failed,"
+        f" {n_skipped} skipped: {audio_seconds / 3600:.2f} h of audio in {wall_time:.1f}s"
+        f" ({speed:.1f} audio hours per wall-clock hour).",
+        style="bold blue",
+    )
+
+
+async def _async_main(
+    *,
+    paths: list[Path],
+    output: Path | None,
+    concurrency: int,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    quiet: bool,
+    n_skipped: int = 0,
+) -> list[FileResult]:
+    """Transcribe the files concurrently, writing each result as soon as it is done.
+
+    At most `concurrency` files are in memory at once, and their windows (see
+    `asr.transcribe_recording`) share `concurrency` request slots, so a single
+    long file uses all of them.
+    """
+    files = asyncio.Semaphore(concurrency)
+    requests = asyncio.Semaphore(concurrency)
+    start_time = time.perf_counter()
+    tasks = [
+        _transcribe_file(
+            path,
+            files,
+            requests,
+            provider_cfg=provider_cfg,
+            wyoming_asr_cfg=wyoming_asr_cfg,
+            openai_asr_cfg=openai_asr_cfg,
+        )
+        for path in paths
+    ]
+    results = []
+    for task in asyncio.as_completed(tasks):
+        result = await task
+        _write_result(result, output)
+        results.append(result)
+        if quiet:
+            continue
+        if result.error is None:
+            print_with_style(
+                f"✅ {result.path.name} ({result.duration:.1f}s of audio in {result.elapsed:.1f}s)",
+            )
+        else:
+            print_with_style(f"❌ {result.path.name}: {result.error}", style="bold red")
+    if not quiet:
+        _print_summary(results, n_skipped, time.perf_counter() - start_time)
+    return results
+
+
+@app.command("transcribe-files")
+def transcribe_files(
+    *,
+    inputs: list[str] = typer.Argument(  # noqa: B008
+        ...,
+        help="Audio files, glob patterns, or directories (searched recursively) to transcribe.",
+        rich_help_panel="General Options",
+    ),
+    output: Path = typer.Option(  # noqa: B008
+        Path("transcripts.jsonl"),
+        "--output",
+        "-o",
+        help="JSONL file to append the transcripts to, one object per file.",
+        rich_help_panel="Batch Options",
+    ),
+    sidecar: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--sidecar",
+        help="Write each transcript next to its audio file, as <file>.txt, instead of to --output.",
+        rich_help_panel="Batch Options",
+    ),
+    concurrency: int = opts.CONCURRENCY,
+    resume: bool = opts.RESUME,
+    # --- Provider Selection ---
+    asr_provider: str = opts.ASR_PROVIDER,
+    # --- ASR (Audio) Configuration ---
+    asr_wyoming_ip: str = opts.ASR_WYOMING_IP,
+    asr_wyoming_port: int = opts.ASR_WYOMING_PORT,
+    asr_openai_model: str = opts.ASR_OPENAI_MODEL,
+    openai_api_key: str | None = opts.OPENAI_API_KEY,
+    # --- General Options ---
+    log_level: str = opts.LOG_LEVEL,
+    log_file: str | None = opts.LOG_FILE,
+    profile_file: Path | None = opts.PROFILE,
+    quiet: bool = opts.QUIET,
+    config_file: str | None = opts.CONFIG_FILE,
+    print_args: bool = opts.PRINT_ARGS,
+) -> None:
+    """Transcribe audio files in bulk using local or remote ASR services.
+
+    Files are decoded to 16 kHz mono (with ffmpeg, unless they already are WAV
+    files in that format) and transcribed with up to `--concurrency` requests in
+    flight. Long files are split at silences into windows of about 30 seconds,
+    which are transcribed in parallel. Files that already have a transcript are
+    skipped, so an interrupted run can simply be restarted.
+
+    Usage:
+    - Transcribe a directory: agent-cli transcribe-files recordings/
+    - Use OpenAI with 8 parallel requests: agent-cli transcribe-files "*.mp3" --asr-provider openai -j 8
+    - Write .txt files next to the audio: agent-cli transcribe-files recordings/ --sidecar
+    """
+    if print_args:
+        print_command_line_args(locals())
+    setup_logging(log_level, log_file, quiet=quiet)
+    paths = find_audio_files(inputs)
+    if not paths:
+        print_error_message("No audio files found.", f"Searched: {', '.join(inputs)}")
+        raise typer.Exit(1)
+
+    destination = None if sidecar else output
+    if destination is not None and not resume:
+        destination.unlink(missing_ok=True)
+    if resume:
+        completed = _completed_files(destination) if destination is not None else set()
+        pending = [
+            p
+            for p in paths
+            if str(p) not in completed and not (sidecar and _sidecar_path(p).exists())
+        ]
+    else:
+        pending = paths
+    n_skipped = len(paths) - len(pending)
+    if not quiet and n_skipped:
+        print_with_style(f"⏭️  Skipping {n_skipped} already transcribed file(s).", style="dim")
+
+    with profiler.profiling(profile_file):
+        results = asyncio.run(
+            _async_main(
+                paths=pending,
+                output=destination,
+                concurrency=concurrency,
+                provider_cfg=config.ProviderSelection(
+                    asr_provider=asr_provider,
+                    llm_provider="local",  # Not used
+                    tts_provider="piper",  # Not used
+                ),
+                wyoming_asr_cfg=config.WyomingASR(
+                    asr_wyoming_ip=asr_wyoming_ip,
+                    asr_wyoming_port=asr_wyoming_port,
+                ),
+                openai_asr_cfg=config.OpenAIASR(
+                    asr_openai_model=asr_openai_model,
+                    openai_api_key=openai_api_key,
+                ),
+                quiet=quiet,
+                n_skipped=n_skipped,
+            ),
+        )
+    if any(r.error is not None for r in results):
+        raise typer.Exit(1)
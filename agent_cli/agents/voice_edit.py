@@ -34,9 +34,11 @@ This approach uses standard Unix background processes (&) instead of Python daem
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING
 
 from agent_cli import config, opts
 from agent_cli.agents._voice_agent_common import (
@@ -44,7 +46,7 @@ from agent_cli.agents._voice_agent_common import (
     process_instruction_and_respond,
 )
 from agent_cli.cli import app
-from agent_cli.core import process
+from agent_cli.core import ipc, loop_monitor, process, profiler, tracing
 from agent_cli.core.audio import pyaudio_context, setup_devices
 from agent_cli.core.utils import (
     get_clipboard_text,
@@ -52,12 +54,18 @@ from agent_cli.core.utils import (
     print_command_line_args,
     print_input_panel,
     print_with_style,
+    run_with_control_socket,
     setup_logging,
     signal_handling_context,
     stop_or_status_or_toggle,
 )
 from agent_cli.services import asr
 
+if TYPE_CHECKING:
+    import pyaudio
+
+    from agent_cli.core.utils import InteractiveStopEvent
+
 LOGGER = logging.getLogger()
 
 # LLM Prompts
@@ -102,25 +110,37 @@ async def _async_main(
     openai_tts_cfg: config.OpenAITTS,
     kokoro_tts_cfg: config.KokoroTTS,
     piper_tts_cfg: config.PiperTTS,
-) -> None:
-    """Core asynchronous logic for the voice assistant."""
-    with pyaudio_context() as p:
+    p: pyaudio.PyAudio | None = None,
+    stop_event: InteractiveStopEvent | None = None,
+) -> str | None:
+    """Core asynchronous logic for the voice assistant.
+
+    Returns the LLM response. A resident `p` and `stop_event` can be passed in by
+    the daemon; otherwise PyAudio is initialised here and SIGINT/SIGTERM stop recording.
+    """
+    audio_context = nullcontext(p) if p is not None else pyaudio_context()
+    with audio_context as p:  # noqa: PLR1704
         device_info = setup_devices(p, general_cfg, audio_in_cfg, audio_out_cfg)
         if device_info is None:
-            return
+            return None
         input_device_index, _, tts_output_device_index = device_info
         audio_in_cfg.input_device_index = input_device_index
         audio_out_cfg.output_device_index = tts_output_device_index
 
         original_text = get_clipboard_text()
         if original_text is None:
-            return
+            return None
 
         if not general_cfg.quiet and original_text:
             print_input_panel(original_text, title="📝 Text to Process")
 
+        stop_context = (
+            nullcontext(stop_event)
+            if stop_event is not None
+            else signal_handling_context(LOGGER, general_cfg.quiet)
+        )
         with (
-            signal_handling_context(LOGGER, general_cfg.quiet) as stop_event,
+            stop_context as stop_event,  # noqa: PLR1704
             maybe_live(not general_cfg.quiet) as live,
         ):
             audio_data = await asr.record_audio_with_manual_stop(
@@ -135,7 +155,7 @@ async def _async_main(
             if not audio_data:
                 if not general_cfg.quiet:
                     print_with_style("No audio recorded", style="yellow")
-                return
+                return None
 
             instruction = await get_instruction_from_audio(
                 audio_data=audio_data,
@@ -148,9 +168,9 @@ async def _async_main(
                 quiet=general_cfg.quiet,
             )
             if not instruction:
-                return
+                return None
 
-            await process_instruction_and_respond(
+            return await process_instruction_and_respond(
                 instruction=instruction,
                 original_text=original_text,
                 provider_cfg=provider_cfg,
@@ -221,6 +241,9 @@ def voice_edit(
     clipboard: bool = opts.CLIPBOARD,
     log_level: str = opts.LOG_LEVEL,
     log_file: str | None = opts.LOG_FILE,
+    trace_file: Path | None = opts.TRACE_FILE,
+    debug_loop: bool = opts.DEBUG_LOOP,
+    profile_file: Path | None = opts.PROFILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
     config_file: str | None = opts.CONFIG_FILE,
@@ -258,7 +281,12 @@ def voice_edit(
     ):
         return
 
-    with process.pid_file_context(process_name), suppress(KeyboardInterrupt):
+    # The control socket lets `--stop` end the recording without signal polling
+    control_socket = ipc.socket_path(process_name)
+    with (
+        process.pid_file_context(process_name, control_socket=control_socket),
+        suppress(KeyboardInterrupt),
+    ):
         provider_cfg = config.ProviderSelection(
             asr_provider=asr_provider,
             llm_provider=llm_provider,
@@ -321,20 +349,31 @@ def voice_edit(
             tts_piper_noise_w_scale=tts_piper_noise_w_scale,
         )
 
-        asyncio.run(
-            _async_main(
-                provider_cfg=provider_cfg,
-                general_cfg=general_cfg,
-                audio_in_cfg=audio_in_cfg,
-                wyoming_asr_cfg=wyoming_asr_cfg,
-                openai_asr_cfg=openai_asr_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_llm_cfg=openai_llm_cfg,
-                gemini_llm_cfg=gemini_llm_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
-                piper_tts_cfg=piper_tts_cfg,
-            ),
+        main = functools.partial(
+            _async_main,
+            provider_cfg=provider_cfg,
+            general_cfg=general_cfg,
+            audio_in_cfg=audio_in_cfg,
+            wyoming_asr_cfg=wyoming_asr_cfg,
+            openai_asr_cfg=openai_asr_cfg,
+            ollama_cfg=ollama_cfg,
+            openai_llm_cfg=openai_llm_cfg,
+            gemini_llm_cfg=gemini_llm_cfg,
+            audio_out_cfg=audio_out_cfg,
+            wyoming_tts_cfg=wyoming_tts_cfg,
+            openai_tts_cfg=openai_tts_cfg,
+            kokoro_tts_cfg=kokoro_tts_cfg,
+            piper_tts_cfg=piper_tts_cfg,
         )
+        with tracing.tracing(trace_file), profiler.profiling(profile_file):
+            asyncio.run(
+                loop_monitor.run_with_monitor(
+                    run_with_control_socket(
+                        control_socket,
+                        lambda stop_event: main(stop_event=stop_event),
+                        LOGGER,
+                        quiet=general_cfg.quiet,
+                    ),
+                    enabled=debug_loop,
+                ),
+            )
@@ -2,23 +2,157 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 import typer
+from typer.core import TyperCommand, TyperGroup
 
 from .config import load_config
 from .core.utils import console
 
+if TYPE_CHECKING:
+    import click
+    from typer.models import CommandInfo
+
+# Subcommands are registered lazily so that `agent-cli <command>` only imports the
+# module (and the heavy dependencies such as PyAudio, Wyoming, or OpenAI) it needs.
+# Maps command name -> (module, short help, help panel); the help text is used to
+# render `agent-cli --help` without importing every command module.
+_LAZY_COMMANDS: dict[str, tuple[str, str, str | None]] = {
+    "assistant": (
+        "agent_cli.agents.assistant",
+        "Wake word-based voice assistant using local or remote services.",
+        None,
+    ),
+    "autocorrect": (
+        "agent_cli.agents.autocorrect",
+        "Correct text from clipboard using a local or remote LLM.",
+        None,
+    ),
+    "autocorrect-files": (
+        "agent_cli.agents.autocorrect_files",
+        "Correct text files or standard input in bulk using a local or remote LLM.",
+        None,
+    ),
+    "chat": ("agent_cli.agents.chat", "An chat agent that you can talk to.", None),
+    "speak": (
+        "agent_cli.agents.speak",
+        "Convert text to speech using Wyoming or OpenAI TTS server.",
+        None,
+    ),
+    "transcribe": (
+        "agent_cli.agents.transcribe",
+        "Wyoming ASR Client for streaming microphone audio to a transcription server.",
+        None,
+    ),
+    "transcribe-files": (
+        "agent_cli.agents.transcribe_files",
+        "Transcribe audio files in bulk using local or remote ASR services.",
+        None,
+    ),
+    "voice-edit": (
+        "agent_cli.agents.voice_edit",
+        "Interact with clipboard text via a voice command using local or remote services.",
+        None,
+    ),
+    "daemon": (
+        "agent_cli.daemon.server",
+        "Run a resident daemon that serves requests from the `agent-cli-send` client.",
+        None,
+    ),
+    "install-hotkeys": (
+        "agent_cli.install.hotkeys",
+        "Install system-wide hotkeys for agent-cli commands.",
+        "Installation",
+    ),
+    "install-services": (
+        "agent_cli.install.services",
+        "Install all required services (Ollama, Whisper, Piper, OpenWakeWord).",
+        "Installation",
+    ),
+    "start-services": (
+        "agent_cli.install.services",
+        "Start all agent-cli services in a Zellij session.",
+        "Service Management",
+    ),
+}
+
+# Commands that write their result to stdout, which must not start with a blank line
+_STDOUT_COMMANDS = frozenset({"autocorrect-files"})
+
+
+def import_command_module(name: str) -> None:
+    """Import the module that registers the subcommand `name`."""
+    if name in _LAZY_COMMANDS:
+        importlib.import_module(_LAZY_COMMANDS[name][0])
+
+
+class _LazyGroup(TyperGroup):
+    """A Typer group that imports subcommand modules only when they are used."""
+
+    _listing_help = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in _LAZY_COMMANDS if name not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in _LAZY_COMMANDS:
+            return cmd
+        if self._listing_help:
+            _, short_help, panel = _LAZY_COMMANDS[cmd_name]
+            return TyperCommand(name=cmd_name, help=short_help, rich_help_panel=panel)
+        import_command_module(cmd_name)
+        info = next(i for i in app.registered_commands if _command_name(i) == cmd_name)
+        cmd = typer.main.get_command_from_info(
+            info,
+            pretty_exceptions_short=app.pretty_exceptions_short,
+            rich_markup_mode=app.rich_markup_mode,
+        )
+        self.add_command(cmd, cmd_name)
+        return cmd
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._listing_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
+
+def _command_name(info: CommandInfo) -> str | None:
+    if info.name:
+        return info.name
+    if info.callback is None:
+        return None
+    return typer.main.get_command_name(info.callback.__name__)
+
+
 app = typer.Typer(
     name="agent-cli",
     help="A suite of AI-powered command-line tools for text correction, audio transcription, and voice assistance.",
     add_completion=True,
+    cls=_LazyGroup,
 )
 
 
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
+    startup_profile: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--startup-profile",
+        help="Print the import time of the slowest modules loaded by the given command and exit.",
+    ),
 ) -> None:
     """A suite of AI-powered tools."""
+    if startup_profile:
+        from .core.startup import print_import_profile  # noqa: PLC0415
+
+        print_import_profile(ctx.invoked_subcommand)
+        raise typer.Exit
     if ctx.invoked_subcommand is None:
         console.print("[bold red]No command specified.[/bold red]")
         console.print("[bold yellow]Running --help for your convenience.[/bold yellow]")
@@ -27,7 +161,8 @@ def main(
     import dotenv  # noqa: PLC0415
 
     dotenv.load_dotenv()
-    print()
+    if ctx.invoked_subcommand not in _STDOUT_COMMANDS:
+        print()
 
 
 def set_config_defaults(ctx: typer.Context, config_file: str | None) -> None:
@@ -44,8 +179,3 @@ def set_config_defaults(ctx: typer.Context, config_file: str | None) -> None:
     command_config = config.get(subcommand, {})
     defaults = {**wildcard_config, **command_config}
     ctx.default_map = defaults
-
-
-# Import commands from other modules to register them
-from .agents import assistant, autocorrect, chat, speak, transcribe, voice_edit  # noqa: E402, F401
-from .install import hotkeys, services  # noqa: E402, F401
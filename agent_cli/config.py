@@ -133,6 +133,8 @@ class WakeWord(BaseModel):
     wake_server_ip: str
     wake_server_port: int
     wake_word: str
+    wake_word_provider: Literal["local", "openwakeword"] = "local"
+    energy_gate: bool = True
 
 
 # --- Panel: General Options ---
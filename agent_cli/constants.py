@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import pyaudio
+import math
 
 # --- PyAudio Configuration ---
-PYAUDIO_FORMAT = pyaudio.paInt16
+# 16-bit samples; the PyAudio format is set in `agent_cli.core.audio`, so that
+# the modules that only process audio do not need PyAudio
 PYAUDIO_CHANNELS = 1
 PYAUDIO_RATE = 16000
 PYAUDIO_CHUNK_SIZE = 1024
@@ -16,3 +17,8 @@ WYOMING_AUDIO_CONFIG = {
     "width": 2,  # 16-bit audio
     "channels": PYAUDIO_CHANNELS,
 }
+
+
+def seconds_to_chunks(seconds: float) -> int:
+    """Convert a duration to the number of PyAudio chunks that cover it."""
+    return math.ceil(seconds * PYAUDIO_RATE / PYAUDIO_CHUNK_SIZE)
@@ -5,14 +5,16 @@ from __future__ import annotations
 import asyncio
 import functools
 import logging
+from collections import deque
 from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING
 
 import pyaudio
-from rich.text import Text
 
 from agent_cli import constants
 
+from . import metrics
+from .display import status_line
 from .utils import InteractiveStopEvent, console, print_device_index, print_with_style
 
 if TYPE_CHECKING:
@@ -22,6 +24,11 @@ if TYPE_CHECKING:
     from rich.live import Live
 
     from agent_cli import config
+    from agent_cli.core.vad import EnergyGate
+
+
+# Audio a consumer of the tee can fall behind by before its oldest chunks are dropped
+MAX_QUEUED_SECONDS = 30.0
 
 
 class _AudioTee:
@@ -30,6 +37,13 @@ class _AudioTee:
     This class reads from a single audio stream in a background task and forwards
     the audio chunks to any number of dynamically added consumer queues. It is designed
     to be started once and run for the lifetime of the stream.
+
+    The last `history_chunks` chunks are kept in a ring buffer, so that a consumer
+    added late (e.g., a recording started after a wake word detection) can start
+    from an earlier chunk. Chunks are numbered from 0 in the order they are read.
+
+    Each queue holds at most `MAX_QUEUED_SECONDS` of audio; when a consumer falls
+    further behind, its oldest chunks are dropped and counted in `dropped_chunks`.
     """
 
     def __init__(
@@ -37,29 +51,67 @@ class _AudioTee:
         stream: pyaudio.Stream,
         stop_event: InteractiveStopEvent,
         logger: logging.Logger,
+        *,
+        history_chunks: int = 0,
     ) -> None:
         """Initialize the AudioTee."""
         self.stream = stream
         self.stop_event = stop_event
         self.logger = logger
         self.queues: list[asyncio.Queue[bytes | None]] = []
+        self._gates: dict[asyncio.Queue[bytes | None], EnergyGate] = {}
+        # Indices of the chunks last put on each queue, to tell how far its consumer got
+        self._put_indices: dict[asyncio.Queue[bytes | None], deque[int]] = {}
+        self.chunks_read = 0  # Also the index of the next chunk
+        self.dropped_chunks = 0
+        self._max_queued_chunks = constants.seconds_to_chunks(MAX_QUEUED_SECONDS)
+        self._history: deque[bytes] = deque(maxlen=history_chunks)
         self._task: asyncio.Task | None = None
         self._stop_tee_event = asyncio.Event()
         self._lock = asyncio.Lock()  # For thread-safe modification of the queues list
 
-    async def add_queue(self) -> asyncio.Queue[bytes | None]:
-        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    async def add_queue(
+        self,
+        *,
+        start_chunk: int | None = None,
+        gate: EnergyGate | None = None,
+    ) -> asyncio.Queue[bytes | None]:
+        """Add a consumer queue that receives all chunks from now on.
+
+        Args:
+            start_chunk: Index of the first chunk to receive. Chunks before the
+                current one are replayed from the history, as far as it reaches.
+            gate: Only pass on the chunks that this energy gate lets through.
+
+        """
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=self._max_queued_chunks)
         async with self._lock:
+            self._put_indices[queue] = deque(maxlen=self._max_queued_chunks + 1)
+            if start_chunk is not None:
+                n_replay = min(self.chunks_read - start_chunk, len(self._history))
+                replayed = list(self._history)[len(self._history) - n_replay :]
+                for i, chunk in enumerate(replayed, start=self.chunks_read - n_replay):
+                    self._put(queue, chunk, i)
+            if gate is not None:
+                self._gates[queue] = gate
             self.queues.append(queue)
-        self.logger.debug("Added a queue to the tee. Total queues: %d", len(self.queues))
+        self.logger.debug(
+            "Added a queue to the tee with %d replayed chunk(s). Total queues: %d",
+            queue.qsize(),
+            len(self.queues),
+        )
         return queue
 
     async def remove_queue(self, queue: asyncio.Queue[bytes | None]) -> None:
         async with self._lock:
             if queue in self.queues:
                 self.queues.remove(queue)
+            gate = self._gates.pop(queue, None)
+            self._put_indices.pop(queue, None)
+        if gate is not None:
+            self.logger.info(gate.summary())
         # Signal the end of the stream for this specific queue consumer
-        await queue.put(None)
+        self._put(queue, None)
         self.logger.debug("Removed a queue from the tee. Total queues: %d", len(self.queues))
 
     async def _run(self) -> None:
@@ -74,8 +126,17 @@ class _AudioTee:
                 )
                 # Lock the queue list while iterating to prevent modification during iteration
                 async with self._lock:
+                    self._history.append(chunk)
+                    self.chunks_read += 1
                     for queue in self.queues:
-                        await queue.put(chunk)
+                        gate = self._gates.get(queue)
+                        passed = gate.process(chunk) if gate else (chunk,)
+                        # A gate releases its pre-roll, the chunks right before this one
+                        for i, passed_chunk in enumerate(
+                            passed,
+                            start=self.chunks_read - len(passed),
+                        ):
+                            self._put(queue, passed_chunk, i)
         except OSError:
             self.logger.exception("Error reading audio stream")
         finally:
@@ -83,18 +144,56 @@ class _AudioTee:
             self.logger.debug("Stopping audio reading task and signaling all consumers.")
             async with self._lock:
                 for queue in self.queues:
-                    await queue.put(None)
+                    self._put(queue, None)
+
+    def _put(
+        self,
+        queue: asyncio.Queue[bytes | None],
+        item: bytes | None,
+        index: int | None = None,
+    ) -> None:
+        """Put an item on a queue, dropping its oldest chunk if the consumer fell behind.
+
+        `index` is the number of the chunk in the stream; by default, that of the next
+        chunk, as for the end-of-stream marker.
+        """
+        if queue in self._put_indices:
+            self._put_indices[queue].append(self.chunks_read if index is None else index)
+        if queue.full():
+            queue.get_nowait()
+            self.dropped_chunks += 1
+            metrics.DROPPED_AUDIO_CHUNKS.inc()
+            self.logger.debug("Dropped an audio chunk for a consumer that fell behind")
+        queue.put_nowait(item)
+
+    def chunks_taken(self, queue: asyncio.Queue[bytes | None]) -> int:
+        """Return the index after the last chunk that the consumer of `queue` has taken.
+
+        This is not `chunks_read - queue.qsize()` for a gated queue, which skips
+        quiet chunks and receives the pre-roll late.
+        """
+        indices = self._put_indices.get(queue)
+        if not indices:
+            return self.chunks_read
+        pending = queue.qsize()
+        if pending >= len(indices):
+            return indices[0]  # Nothing taken since the oldest index kept
+        return indices[-pending - 1] + 1
 
     def start(self) -> None:
         """Start the background reading task."""
         if self._task is None:
             self._task = asyncio.create_task(self._run())
+            metrics.AUDIO_QUEUE_DEPTH.set_function(
+                lambda: max((queue.qsize() for queue in self.queues), default=0),
+            )
 
     async def stop(self) -> None:
         """Stop the background reading task gracefully."""
         if self._task and not self._task.done():
             self._stop_tee_event.set()
             await self._task
+        metrics.AUDIO_QUEUE_DEPTH.remove()
         self.logger.debug("Audio tee stopped successfully.")
 
 
@@ -103,9 +202,16 @@ async def tee_audio_stream(
     stream: pyaudio.Stream,
     stop_event: InteractiveStopEvent,
     logger: logging.Logger,
+    *,
+    history_seconds: float = 0.0,
 ) -> AsyncGenerator[_AudioTee, None]:
-    """Context manager for an AudioTee."""
-    tee = _AudioTee(stream, stop_event, logger)
+    """Context manager for an AudioTee that keeps the last `history_seconds` of audio."""
+    tee = _AudioTee(
+        stream,
+        stop_event,
+        logger,
+        history_chunks=constants.seconds_to_chunks(history_seconds),
+    )
     tee.start()
     try:
         yield tee
@@ -182,6 +288,8 @@ async def read_audio_stream(
         progress_style: Rich style for progress
 
     """
+    # Only the state of the status line is updated per chunk; the display renders it
+    status = status_line(live) if live and not quiet else None
     try:
         seconds_streamed = 0.0
         while not stop_event.is_set():
@@ -203,17 +311,11 @@ async def read_audio_stream(
             seconds_streamed += len(chunk) / (
                 constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2
             )
-            if live and not quiet:
+            if status is not None:
                 if stop_event.ctrl_c_pressed:
-                    msg = f"Ctrl+C pressed. Stopping {progress_message.lower()}..."
-                    live.update(Text(msg, style="yellow"))
+                    status.warn(f"Ctrl+C pressed. Stopping {progress_message.lower()}...")
                 else:
-                    live.update(
-                        Text(
-                            f"{progress_message}... ({seconds_streamed:.1f}s)",
-                            style=progress_style,
-                        ),
-                    )
+                    status.progress(progress_message, seconds_streamed, style=progress_style)
 
     except OSError:
         logger.exception("Error reading audio")
@@ -232,7 +334,7 @@ def setup_input_stream(
 
     """
     return {
-        "format": constants.PYAUDIO_FORMAT,
+        "format": pyaudio.paInt16,
         "channels": constants.PYAUDIO_CHANNELS,
         "rate": constants.PYAUDIO_RATE,
         "input": True,
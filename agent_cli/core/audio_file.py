@@ -0,0 +1,89 @@
+"""Reading audio files as 16 kHz mono PCM, the format used by all ASR services."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import shutil
+import wave
+from typing import TYPE_CHECKING
+
+from agent_cli import constants
+from agent_cli.core.utils import find_files
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+AUDIO_EXTENSIONS = frozenset({".wav", ".flac", ".mp3", ".ogg", ".opus", ".m4a", ".webm"})
+
+_SAMPLE_WIDTH = constants.WYOMING_AUDIO_CONFIG["width"]
+
+
+def find_audio_files(inputs: list[str]) -> list[Path]:
+    """Expand files, glob patterns and directories (recursively) into audio files."""
+    return find_files(inputs, AUDIO_EXTENSIONS)
+
+
+def pcm_duration(pcm: bytes) -> float:
+    """Return the duration in seconds of 16 kHz mono PCM audio."""
+    return len(pcm) / (constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * _SAMPLE_WIDTH)
+
+
+def pcm_to_wav(pcm: bytes) -> bytes:
+    """Wrap 16 kHz mono PCM audio in a WAV container."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(constants.PYAUDIO_CHANNELS)
+        wav_file.setsampwidth(_SAMPLE_WIDTH)
+        wav_file.setframerate(constants.PYAUDIO_RATE)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def _read_native_wav(path: Path) -> bytes | None:
+    """Read a WAV file that is already 16 kHz mono 16-bit, or return None."""
+    if path.suffix.lower() != ".wav":
+        return None
+    try:
+        with wave.open(str(path), "rb") as wav_file:
+            if (
+                wav_file.getframerate() != constants.PYAUDIO_RATE
+                or wav_file.getnchannels() != constants.PYAUDIO_CHANNELS
+                or wav_file.getsampwidth() != _SAMPLE_WIDTH
+            ):
+                return None
+            return wav_file.readframes(wav_file.getnframes())
+    except wave.Error:
+        return None  # E.g., a compressed or floating point WAV, which ffmpeg can read
+
+
+async def load_audio(path: Path) -> bytes:
+    """Load an audio file as 16 kHz mono 16-bit PCM.
+
+    WAV files in that format are read directly. Everything else is decoded and
+    resampled with ffmpeg.
+
+    Raises:
+        RuntimeError: If ffmpeg is needed but not installed, or fails to decode the file.
+
+    """
+    pcm = await asyncio.to_thread(_read_native_wav, path)
+    if pcm is not None:
+        return pcm
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        msg = f"ffmpeg is required to decode {path.name}; install it or convert to 16 kHz mono WAV."
+        raise RuntimeError(msg)
+    args = ["-nostdin", "-v", "error", "-i", str(path), "-f", "s16le", "-acodec", "pcm_s16le"]
+    args += ["-ac", str(constants.PYAUDIO_CHANNELS), "-ar", str(constants.PYAUDIO_RATE), "-"]
+    proc = await asyncio.create_subprocess_exec(
+        ffmpeg,
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        msg = f"ffmpeg failed to decode {path.name}: {stderr.decode(errors='replace').strip()}"
+        raise RuntimeError(msg)
+    return stdout
@@ -0,0 +1,67 @@
+"""Splitting text into chunks that fit a token budget, for batch LLM requests."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Average number of characters per token of English text, for a tokenizer-free estimate
+CHARS_PER_TOKEN = 4
+
+# Boundaries to split at, from the most to the least preferred: paragraphs, lines, sentences
+_BOUNDARIES = (r"\n[ \t]*\n\s*", r"\n", r"(?<=[.!?])\s+")
+
+
+class Chunk(NamedTuple):
+    """A piece of a text and the whitespace that separates it from the next one."""
+
+    text: str
+    separator: str
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text from its length."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_at(text: str, boundary: str) -> list[Chunk]:
+    parts = re.split(f"({boundary})", text)
+    parts.append("")  # The last piece has no separator
+    return [Chunk(parts[i], parts[i + 1]) for i in range(0, len(parts) - 1, 2)]
+
+
+def _units(text: str, max_tokens: int, level: int = 0) -> Iterator[Chunk]:
+    """Yield the paragraphs of a text, splitting those over the budget at finer boundaries."""
+    for unit in _split_at(text, _BOUNDARIES[level]):
+        if estimate_tokens(unit.text) <= max_tokens or level + 1 == len(_BOUNDARIES):
+            yield unit
+            continue
+        *pieces, last = _units(unit.text, max_tokens, level + 1)
+        yield from pieces
+        yield Chunk(last.text, unit.separator)
+
+
+def split_text(text: str, max_tokens: int, *, pack: bool = True) -> list[Chunk]:
+    """Split a text into chunks of whole paragraphs of at most `max_tokens` each.
+
+    Consecutive paragraphs are packed into one chunk while they fit, unless `pack`
+    is false, in which case every paragraph is a chunk of its own. A paragraph
+    that does not fit on its own is split at line breaks, and then at sentence
+    ends; a single sentence over the budget becomes a chunk of its own. Joining
+    the chunks with their separators gives back the original text.
+    """
+    chunks: list[Chunk] = []
+    text_so_far, separator = "", ""
+    for unit in _units(text, max_tokens):
+        candidate = text_so_far + separator + unit.text
+        if text_so_far and (not pack or estimate_tokens(candidate) > max_tokens):
+            chunks.append(Chunk(text_so_far, separator))
+            candidate = unit.text
+        text_so_far, separator = candidate, unit.separator
+    chunks.append(Chunk(text_so_far, separator))
+    # Trailing whitespace, e.g., the final newline of a file, belongs to the separator
+    return [Chunk(text.rstrip(), text[len(text.rstrip()) :] + sep) for text, sep in chunks]
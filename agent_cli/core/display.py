@@ -0,0 +1,111 @@
+"""The status line of the Rich `Live` display, rendered at a fixed frame rate.
+
+The agents show one status line at a time: a spinner with a timer while waiting
+for a service, or how much audio was recorded. Instead of building and handing
+a new renderable to `Live.update` for every audio chunk or timer tick, the code
+that reports progress sets a few attributes of the `StatusLine` that the `Live`
+display owns. The `Live` display's refresh thread turns that state into text
+only when it draws a frame, `FRAMES_PER_SECOND` times per second, however often
+the state changes. Without a display (`--quiet`), there is nothing to update.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from rich.spinner import Spinner
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    from rich.live import Live
+
+    from .utils import InteractiveStopEvent
+
+FRAMES_PER_SECOND = 4
+
+
+class StatusLine:
+    """The state of the status line, rendered when the display draws a frame."""
+
+    def __init__(self, message: str = "", *, style: str = "blue", spinner: bool = False) -> None:
+        """Show `message`, optionally after a spinner."""
+        self._spinner = Spinner("dots")
+        self.show(message, style=style, spinner=spinner)
+
+    def show(
+        self,
+        message: str,
+        *,
+        style: str = "blue",
+        spinner: bool = False,
+        timer: bool = False,
+        stop_event: InteractiveStopEvent | None = None,
+        ctrl_c_message: str = "",
+    ) -> None:
+        """Show `message`, replacing what was shown.
+
+        Args:
+            message: The text to show.
+            style: Rich style for the text.
+            spinner: Show a spinner before the text.
+            timer: Show the seconds since now after the text.
+            stop_event: Show `ctrl_c_message` instead, once Ctrl+C was pressed.
+            ctrl_c_message: The text to show after Ctrl+C.
+
+        """
+        self.message = message
+        self.style = style
+        self.spinner = spinner
+        self.started = time.monotonic() if timer else None
+        self.seconds: float | None = None
+        self.alert = ""
+        self.stop_event = stop_event
+        self.ctrl_c_message = ctrl_c_message
+
+    def progress(self, message: str, seconds: float, *, style: str = "blue") -> None:
+        """Show `message` with a number of seconds, e.g., of recorded audio.
+
+        This is called for every chunk of audio, so it only sets attributes.
+        """
+        self.message = message
+        self.seconds = seconds
+        self.style = style
+        self.spinner = False
+        self.started = self.stop_event = None
+        self.alert = ""
+
+    def warn(self, message: str) -> None:
+        """Show `message` in yellow until something else is shown."""
+        self.alert = message
+
+    def clear(self) -> None:
+        """Show nothing."""
+        self.show("")
+
+    def __rich__(self) -> RenderableType:
+        """Render the current state."""
+        if self.alert:
+            return Text(self.alert, style="yellow")
+        if self.stop_event is not None and self.stop_event.ctrl_c_pressed:
+            return Text(self.ctrl_c_message, style="yellow")
+        text = self.message
+        if self.started is not None:
+            text += f"... ({time.monotonic() - self.started:.1f}s)"
+        elif self.seconds is not None:
+            text += f"... ({self.seconds:.1f}s)"
+        if not self.spinner:
+            return Text(text, style=self.style)
+        self._spinner.update(text=Text(text, style=self.style))
+        return self._spinner
+
+
+def status_line(live: Live) -> StatusLine:
+    """Return the status line of a `Live` display, making it the display's renderable if needed."""
+    renderable = live.get_renderable()
+    if isinstance(renderable, StatusLine):
+        return renderable
+    status = StatusLine()
+    live.update(status)
+    return status
@@ -0,0 +1,113 @@
+"""JSON-lines request/response messaging over Unix domain sockets.
+
+Each connection carries exactly one request and one response, each encoded as a
+single line of JSON. The client side only uses the standard library so that thin
+clients (e.g., the hotkey client) start in milliseconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import socket
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+# Default location for sockets, shared with the PID files
+SOCKET_DIR = Path.home() / ".cache" / "agent-cli"
+
+# Large enough for long transcripts or clipboard contents
+_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+def socket_path(name: str) -> Path:
+    """Get the path to the Unix socket for a given name."""
+    return SOCKET_DIR / f"{name}.sock"
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    """Encode a message as a single line of JSON."""
+    return json.dumps(message).encode() + b"\n"
+
+
+def decode_message(line: bytes) -> dict[str, Any]:
+    """Decode a single line of JSON into a message."""
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        msg = f"Expected a JSON object, got {type(message).__name__}"
+        raise TypeError(msg)
+    return message
+
+
+def send_request(
+    path: Path,
+    request: dict[str, Any],
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Send a request to the server at `path` and wait for its response.
+
+    Raises:
+        OSError: If no server is listening on `path` or the connection fails.
+        TimeoutError: If no response arrives within `timeout` seconds.
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(encode_message(request))
+        with sock.makefile("rb") as f:
+            line = f.readline(_MAX_MESSAGE_BYTES)
+    if not line:
+        msg = f"Connection to {path} closed without a response"
+        raise ConnectionError(msg)
+    return decode_message(line)
+
+
+@asynccontextmanager
+async def unix_server(
+    path: Path,
+    handler: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+) -> AsyncGenerator[asyncio.Server, None]:
+    """Serve `handler` on a Unix socket at `path` for the duration of the context.
+
+    The handler receives each decoded request and returns the response. Invalid
+    requests and handler exceptions are answered with `{"ok": False, "error": ...}`.
+    """
+
+    async def on_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            try:
+                response = await handler(decode_message(line))
+            except Exception as e:  # noqa: BLE001
+                response = {"ok": False, "error": str(e)}
+            writer.write(encode_message(response))
+            await writer.drain()
+        except ConnectionError:
+            pass  # The client went away before reading the response
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)  # Stale socket from a crashed server
+    server = await asyncio.start_unix_server(
+        on_connection,
+        path=str(path),
+        limit=_MAX_MESSAGE_BYTES,
+    )
+    path.chmod(0o600)
+    try:
+        yield server
+    finally:
+        server.close()
+        await server.wait_closed()
+        path.unlink(missing_ok=True)
@@ -0,0 +1,225 @@
+"""Detection of the code that blocks the event loop, for `--debug-loop`.
+
+While a command runs inside `run_with_monitor`, three things watch the loop:
+
+- A probe task wakes up every `PROBE_INTERVAL_SECONDS` and records how late it
+  is, which is the scheduling lag that every other task sees as well.
+- A watchdog thread samples the stack of the event loop's thread while the probe
+  is overdue by more than `SLOW_SECONDS`, and attributes the blocked time to the
+  innermost function of agent-cli on the stack, and the function it was in.
+- asyncio's debug mode logs the callbacks that take longer than `SLOW_SECONDS`,
+  with the traceback of where their task was created; these are collected too.
+
+A function that blocks while holding the GIL (e.g., a large `json.dumps`) keeps
+the watchdog from sampling it, but still shows up as a slow callback.
+
+When the command ends, the lag and the functions that blocked the loop the
+longest are printed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import sys
+import threading
+import time
+import traceback
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from rich.table import Table
+
+from .utils import console
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from types import FrameType
+
+LOGGER = logging.getLogger(__name__)
+
+# Interval of the probe task
+PROBE_INTERVAL_SECONDS = 0.01
+# Blocking longer than this is reported; a chunk of audio is 64 ms
+SLOW_SECONDS = 0.05
+# Rows in the tables of the summary
+_TOP = 10
+
+T = TypeVar("T")
+
+
+@dataclass
+class Blocker:
+    """A function that was seen running while the event loop was blocked."""
+
+    where: str  # The innermost function of agent-cli, or else the innermost function
+    via: str  # The innermost function, e.g., in a library that `where` called
+    seconds: float = 0.0
+    stalls: int = 0
+
+
+@dataclass
+class SlowCallback:
+    """A callback reported by asyncio's debug mode, e.g., a step of a task."""
+
+    description: str
+    seconds: float = 0.0
+    count: int = 0
+
+
+def _location(frame: traceback.FrameSummary) -> str:
+    parts = Path(frame.filename).parts
+    short = "/".join(parts[parts.index("agent_cli") :] if "agent_cli" in parts else parts[-2:])
+    return f"{short}:{frame.lineno} in {frame.name}"
+
+
+def _attribute(frame: FrameType) -> tuple[str, str]:
+    """Return the `where` and `via` of a `Blocker` for the innermost frame of a stack."""
+    stack = traceback.extract_stack(frame)
+    own = [
+        f
+        for f in stack
+        if "agent_cli" in Path(f.filename).parts and not f.filename.endswith("loop_monitor.py")
+    ]
+    via = _location(stack[-1])
+    return (_location(own[-1]) if own else via), via
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """Collects the "Executing <handle> took 0.123 seconds" warnings of asyncio's debug mode."""
+
+    def __init__(self, slow_callbacks: dict[str, SlowCallback]) -> None:
+        super().__init__(level=logging.WARNING)
+        self.slow_callbacks = slow_callbacks
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not str(record.msg).startswith("Executing") or len(record.args or ()) != 2:  # noqa: PLR2004
+            return
+        description, seconds = record.args  # type: ignore[misc]
+        slow = self.slow_callbacks.setdefault(str(description), SlowCallback(str(description)))
+        slow.seconds += float(seconds)
+        slow.count += 1
+
+
+class LoopMonitor:
+    """Measures the lag of an event loop and finds what blocks it."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        slow_seconds: float = SLOW_SECONDS,
+    ) -> None:
+        """Prepare to monitor `loop`, which must run in the current thread."""
+        self.loop = loop
+        self.slow_seconds = slow_seconds
+        self.lags = array("d")
+        self.blockers: dict[tuple[str, str], Blocker] = {}
+        self.slow_callbacks: dict[str, SlowCallback] = {}
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._probe: asyncio.Task | None = None
+        self._stop_watchdog = threading.Event()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._handler = _SlowCallbackHandler(self.slow_callbacks)
+        self._saved_debug = (loop.get_debug(), loop.slow_callback_duration)
+
+    async def _probe_lag(self) -> None:
+        while True:
+            expected = time.monotonic() + PROBE_INTERVAL_SECONDS
+            await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+            self._last_tick = time.monotonic()
+            self.lags.append(max(0.0, self._last_tick - expected))
+
+    def _watch(self) -> None:
+        """Sample the stack of the loop's thread while the probe is overdue."""
+        sample_interval = self.slow_seconds / 5
+        stalled_tick = last_sample = 0.0
+        while not self._stop_watchdog.wait(sample_interval):
+            last_tick = self._last_tick
+            now = time.monotonic()
+            if now - last_tick - PROBE_INTERVAL_SECONDS < self.slow_seconds:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            key = _attribute(frame)
+            blocker = self.blockers.setdefault(key, Blocker(*key))
+            if stalled_tick != last_tick:  # A new stall, blocked since the last tick
+                stalled_tick = last_tick
+                blocker.stalls += 1
+                blocker.seconds += now - last_tick
+            else:
+                blocker.seconds += now - last_sample
+            last_sample = now
+
+    def start(self) -> None:
+        """Start the probe, the watchdog, and asyncio's debug mode."""
+        self.loop.set_debug(True)
+        self.loop.slow_callback_duration = self.slow_seconds
+        logging.getLogger("asyncio").addHandler(self._handler)
+        self._last_tick = time.monotonic()
+        self._probe = self.loop.create_task(self._probe_lag())
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop monitoring and restore the debug settings of the loop."""
+        self._stop_watchdog.set()
+        self._watchdog.join()
+        if self._probe is not None:
+            self._probe.cancel()
+        logging.getLogger("asyncio").removeHandler(self._handler)
+        self.loop.set_debug(self._saved_debug[0])
+        self.loop.slow_callback_duration = self._saved_debug[1]
+
+    def print_summary(self) -> None:
+        """Print the lag and the top blocking functions and slow callbacks."""
+        lags = list(self.lags) or [0.0]
+        p99 = (
+            statistics.quantiles(lags, n=100, method="inclusive")[98] if len(lags) > 1 else lags[0]
+        )
+        console.print(
+            f"\n[bold]⏱️ Event loop lag[/bold] over {len(self.lags)} probes:"
+            f" p50 {statistics.median(lags) * 1e3:.1f} ms, p99 {p99 * 1e3:.1f} ms,"
+            f" max {max(lags) * 1e3:.1f} ms",
+        )
+        if self.blockers:
+            threshold_ms = self.slow_seconds * 1e3
+            table = Table(
+                title=f"Functions that blocked the event loop for over {threshold_ms:.0f} ms",
+            )
+            table.add_column("Function")
+            table.add_column("Via")
+            table.add_column("Blocked (s)", justify="right")
+            table.add_column("Stalls", justify="right")
+            for blocker in sorted(self.blockers.values(), key=lambda b: -b.seconds)[:_TOP]:
+                via = "" if blocker.via == blocker.where else blocker.via
+                table.add_row(blocker.where, via, f"{blocker.seconds:.3f}", str(blocker.stalls))
+            console.print(table)
+        if self.slow_callbacks:
+            table = Table(title="Slow callbacks reported by asyncio")
+            table.add_column("Callback", overflow="fold")
+            table.add_column("Total (s)", justify="right")
+            table.add_column("Count", justify="right")
+            for slow in sorted(self.slow_callbacks.values(), key=lambda s: -s.seconds)[:_TOP]:
+                table.add_row(slow.description, f"{slow.seconds:.3f}", str(slow.count))
+            console.print(table)
+        if not self.blockers and not self.slow_callbacks:
+            console.print("✅ Nothing blocked the event loop for longer than the threshold.")
+
+
+async def run_with_monitor(main: Awaitable[T], *, enabled: bool) -> T:
+    """Run `main`, monitoring the event loop and printing a summary at the end if `enabled`."""
+    if not enabled:
+        return await main
+    monitor = LoopMonitor(asyncio.get_running_loop())
+    monitor.start()
+    LOGGER.info("Monitoring the event loop for blocking longer than %.3f s", monitor.slow_seconds)
+    try:
+        return await main
+    finally:
+        monitor.stop()
+        monitor.print_summary()
@@ -0,0 +1,248 @@
+"""Prometheus metrics for long-running agents, without a client library.
+
+The metrics are always collected, which costs a dictionary update per sample,
+and are only exposed while a command runs inside `exporter`: over HTTP at
+`http://127.0.0.1:<port>/metrics`, and/or as a file for the textfile collector
+of the node exporter, rewritten every `TEXTFILE_INTERVAL_SECONDS`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import os
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds between rewrites of the textfile
+TEXTFILE_INTERVAL_SECONDS = 15.0
+# Histogram buckets for the latencies of the services, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_Labels = tuple[tuple[str, str], ...]
+T = TypeVar("T")
+
+
+def _labels(labels: dict[str, object]) -> _Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format(name: str, labels: _Labels, value: float) -> str:
+    if labels:
+        label_text = ",".join(f"{key}={json.dumps(label)}" for key, label in labels)
+        name = f"{name}{{{label_text}}}"
+    return f"{name} {value:g}"
+
+
+class _Metric(ABC):
+    kind: str
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = f"agent_cli_{name}"
+        self.help_text = help_text
+        _REGISTRY.append(self)
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Return the sample lines in the exposition format."""
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.help_text}\n# TYPE {self.name} {self.kind}\n"
+        return header + "".join(line + "\n" for line in self.samples())
+
+
+class Counter(_Metric):
+    """A count that only goes up, such as the number of errors."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        """Register the counter; the `_total` suffix is added to the name."""
+        super().__init__(f"{name}_total", help_text)
+        self.values: dict[_Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Add `amount` to the count with the given labels."""
+        key = _labels(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def get(self, **labels: object) -> float:
+        """Return the count with the given labels."""
+        return self.values.get(_labels(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        """Return a line per label set."""
+        return [_format(self.name, labels, value) for labels, value in self.values.items()]
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, read from a function when the metrics are exposed."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        """Register the gauge."""
+        super().__init__(name, help_text)
+        self.functions: dict[_Labels, Callable[[], float]] = {}
+
+    def set_function(self, function: Callable[[], float], **labels: object) -> None:
+        """Read the value with the given labels from `function`."""
+        self.functions[_labels(labels)] = function
+
+    def remove(self, **labels: object) -> None:
+        """Stop reporting the value with the given labels."""
+        self.functions.pop(_labels(labels), None)
+
+    def samples(self) -> list[str]:
+        """Return a line per label set, calling its function."""
+        return [_format(self.name, labels, f()) for labels, f in self.functions.items()]
+
+
+class Histogram(_Metric):
+    """The distribution of observed values, such as latencies, in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Register the histogram with the given upper bounds of the buckets."""
+        super().__init__(name, help_text)
+        self.buckets = (*sorted(buckets), math.inf)
+        self.counts: dict[_Labels, list[int]] = {}
+        self.sums: dict[_Labels, float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Add an observation with the given labels."""
+        key = _labels(labels)
+        counts = self.counts.setdefault(key, [0] * len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        self.sums[key] = self.sums.get(key, 0.0) + value
+
+    def samples(self) -> list[str]:
+        """Return the bucket, sum, and count lines per label set."""
+        lines = []
+        for labels, counts in self.counts.items():
+            for bound, count in zip(self.buckets, counts, strict=True):
+                le = "+Inf" if math.isinf(bound) else f"{bound:g}"
+                lines.append(_format(f"{self.name}_bucket", (*labels, ("le", le)), count))
+            lines.append(_format(f"{self.name}_sum", labels, self.sums[labels]))
+            lines.append(_format(f"{self.name}_count", labels, counts[-1]))
+        return lines
+
+
+_REGISTRY: list[_Metric] = []
+
+ASR_SECONDS = Histogram("asr_seconds", "Time from the end of the recording to the transcript.")
+LLM_SECONDS = Histogram("llm_seconds", "Time to get a complete response from the LLM.")
+TTS_SECONDS = Histogram("tts_seconds", "Time to synthesize speech.")
+WAKE_WORD_DETECTIONS = Counter("wake_word_detections", "Wake word detections.")
+DROPPED_AUDIO_CHUNKS = Counter(
+    "dropped_audio_chunks",
+    "Audio chunks dropped because a consumer fell behind.",
+)
+RECONNECTS = Counter("reconnects", "Reconnections to a server after the connection was lost.")
+LLM_CACHE_LOOKUPS = Counter("llm_cache_lookups", "Lookups in the LLM response cache, by result.")
+ERRORS = Counter("errors", "Errors, by stage.")
+AUDIO_QUEUE_DEPTH = Gauge(
+    "audio_queue_depth",
+    "Audio chunks waiting in the fullest consumer queue of the audio tee.",
+)
+
+
+def render() -> str:
+    """Return all metrics in the Prometheus text exposition format."""
+    return "".join(metric.render() for metric in _REGISTRY)
+
+
+def write_textfile(path: Path) -> None:
+    """Write the metrics to `path` atomically, as the textfile collector expects."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(render(), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+async def _handle_http(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = await reader.readline()
+        while (await reader.readline()).strip():  # Skip the headers
+            pass
+        parts = request_line.decode(errors="replace").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":  # noqa: PLR2004
+            status, body = "200 OK", render().encode()
+        else:
+            status, body = "404 Not Found", b"Not found\n"
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode()
+            + body,
+        )
+        await writer.drain()
+    except (ConnectionError, UnicodeDecodeError):
+        LOGGER.debug("Metrics request failed", exc_info=True)
+    finally:
+        writer.close()
+
+
+@asynccontextmanager
+async def exporter(
+    *,
+    port: int | None = None,
+    textfile: Path | None = None,
+) -> AsyncGenerator[None, None]:
+    """Expose the metrics over HTTP on localhost and/or in a textfile, for the duration of the context."""
+    server = None
+    if port is not None:
+        server = await asyncio.start_server(_handle_http, "127.0.0.1", port)
+        LOGGER.info("Serving metrics at http://127.0.0.1:%d/metrics", port)
+    writer_task = None
+    stop_writing = asyncio.Event()
+    if textfile is not None:
+
+        async def write_periodically() -> None:
+            while not stop_writing.is_set():
+                await asyncio.to_thread(write_textfile, textfile)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stop_writing.wait(), timeout=TEXTFILE_INTERVAL_SECONDS)
+            # Not cancelled mid-write, so the final write is the last one to land
+            await asyncio.to_thread(write_textfile, textfile)
+
+        writer_task = asyncio.create_task(write_periodically())
+    try:
+        yield
+    finally:
+        if writer_task is not None:
+            stop_writing.set()
+            await writer_task
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+
+async def run_with_exporter(
+    main: Awaitable[T],
+    *,
+    port: int | None = None,
+    textfile: Path | None = None,
+) -> T:
+    """Run `main` while exposing the metrics, see `exporter`."""
+    async with exporter(port=port, textfile=textfile):
+        return await main
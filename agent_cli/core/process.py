@@ -1,14 +1,23 @@
-"""Process management utilities for Agent CLI tools."""
+"""Process management utilities for Agent CLI tools.
+
+Each running agent registers itself in a PID file that stores its PID, its start
+time, and optionally the path of its control socket. The start time (read from
+`/proc/<pid>/stat` on Linux) guards against PID reuse: a PID file whose process
+has exited is detected as stale even if the PID now belongs to another process.
+"""
 
 from __future__ import annotations
 
+import functools
+import json
 import os
+import select
 import signal
 import sys
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -16,33 +25,82 @@ if TYPE_CHECKING:
 # Default location for PID files
 PID_DIR = Path.home() / ".cache" / "agent-cli"
 
+# How long `kill_process` waits for the process to exit after SIGTERM
+KILL_TIMEOUT = 1.0
+
+
+class ProcessInfo(NamedTuple):
+    """A registered process, as stored in its PID file."""
+
+    pid: int
+    start_time: int | None = None  # In clock ticks since boot, None if unknown
+    control_socket: str | None = None
+
+
+@functools.cache
+def _ensure_dir(path: Path) -> Path:
+    """Create `path` once per process instead of on every lookup."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 
 def _get_pid_file(process_name: str) -> Path:
     """Get the path to the PID file for a given process name."""
-    PID_DIR.mkdir(parents=True, exist_ok=True)
-    return PID_DIR / f"{process_name}.pid"
+    return _ensure_dir(PID_DIR) / f"{process_name}.pid"
 
 
-def _get_running_pid(process_name: str) -> int | None:
-    """Get PID if process is running, None otherwise. Cleans up stale files."""
+def _process_start_time(pid: int) -> int | None:
+    """Get the start time of a process from /proc, or None if unavailable (e.g., macOS)."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_bytes()
+    except OSError:
+        return None
+    # The command name (field 2) may contain spaces, so split after its closing paren.
+    # `starttime` is field 22, i.e., the 20th field after the command name.
+    fields = stat[stat.rindex(b")") + 2 :].split()
+    return int(fields[19])
+
+
+def _parse_pid_file(content: str) -> ProcessInfo:
+    """Parse a PID file, which is either JSON or a bare PID (older versions)."""
+    content = content.strip()
+    if content.isdigit():
+        return ProcessInfo(int(content))
+    data = json.loads(content)
+    return ProcessInfo(int(data["pid"]), data.get("start_time"), data.get("control_socket"))
+
+
+def _is_alive(info: ProcessInfo) -> bool:
+    """Check that the process exists and is the one that wrote the PID file."""
+    os.kill(info.pid, 0)  # Raises if the process does not exist
+    if info.start_time is None:
+        return True
+    start_time = _process_start_time(info.pid)
+    return start_time is None or start_time == info.start_time
+
+
+def read_process_info(process_name: str) -> ProcessInfo | None:
+    """Get the registered process if it is running, None otherwise. Cleans up stale files."""
     pid_file = _get_pid_file(process_name)
 
-    if not pid_file.exists():
+    try:
+        info = _parse_pid_file(pid_file.read_text())
+        if _is_alive(info):
+            return info
+    except FileNotFoundError:
         return None
+    except (ValueError, KeyError, TypeError, ProcessLookupError, PermissionError):
+        pass
 
-    try:
-        with pid_file.open() as f:
-            pid = int(f.read().strip())
+    # Clean up stale/invalid PID file
+    pid_file.unlink(missing_ok=True)
+    return None
 
-        # Check if process is actually running
-        os.kill(pid, 0)
-        return pid
 
-    except (FileNotFoundError, ValueError, ProcessLookupError, PermissionError):
-        # Clean up stale/invalid PID file
-        if pid_file.exists():
-            pid_file.unlink()
-        return None
+def _get_running_pid(process_name: str) -> int | None:
+    """Get PID if process is running, None otherwise. Cleans up stale files."""
+    info = read_process_info(process_name)
+    return info.pid if info is not None else None
 
 
 def is_process_running(process_name: str) -> bool:
@@ -55,6 +113,36 @@ def read_pid_file(process_name: str) -> int | None:
     return _get_running_pid(process_name)
 
 
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait until the process exits. Returns False on timeout.
+
+    Uses a pidfd (Linux 5.3+), which becomes readable when the process exits, and
+    falls back to polling elsewhere.
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass  # E.g., not supported by the kernel; poll instead
+        else:
+            try:
+                readable, _, _ = select.select([fd], [], [], timeout)
+                return bool(readable)
+            finally:
+                os.close(fd)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.01)
+    return False
+
+
 def kill_process(process_name: str) -> bool:
     """Kill a process by name. Returns True if killed or cleaned up, False if not found."""
     pid_file = _get_pid_file(process_name)
@@ -73,39 +161,42 @@ def kill_process(process_name: str) -> bool:
     # Kill the running process
     try:
         os.kill(pid, signal.SIGTERM)
-        # Wait for process to terminate
-        for _ in range(10):  # 1 second max
-            if not is_process_running(process_name):
-                break
-            time.sleep(0.1)
+        _wait_for_exit(pid, KILL_TIMEOUT)
     except (ProcessLookupError, PermissionError):
         pass  # Process dead or no permission - we'll clean up regardless
 
     # Clean up PID file
-    if pid_file.exists():
-        pid_file.unlink()
+    pid_file.unlink(missing_ok=True)
 
     return True
 
 
 @contextmanager
-def pid_file_context(process_name: str) -> Generator[Path, None, None]:
+def pid_file_context(
+    process_name: str,
+    control_socket: Path | None = None,
+) -> Generator[Path, None, None]:
     """Context manager for PID file lifecycle.
 
     Creates PID file on entry, cleans up on exit.
     Exits with error if process already running.
     """
-    if is_process_running(process_name):
-        existing_pid = _get_running_pid(process_name)
-        print(f"Process {process_name} is already running (PID: {existing_pid})")
+    existing = read_process_info(process_name)
+    if existing is not None:
+        print(f"Process {process_name} is already running (PID: {existing.pid})")
         sys.exit(1)
 
+    PID_DIR.mkdir(parents=True, exist_ok=True)
     pid_file = _get_pid_file(process_name)
-    with pid_file.open("w") as f:
-        f.write(str(os.getpid()))
+    pid = os.getpid()
+    info = ProcessInfo(
+        pid,
+        _process_start_time(pid),
+        str(control_socket) if control_socket is not None else None,
+    )
+    pid_file.write_text(json.dumps(info._asdict()))
 
     try:
         yield pid_file
     finally:
-        if pid_file.exists():
-            pid_file.unlink()
+        pid_file.unlink(missing_ok=True)
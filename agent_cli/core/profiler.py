@@ -0,0 +1,168 @@
+"""A sampling profiler for whole sessions, for `--profile`.
+
+A background thread takes the stacks of all other threads every
+`SAMPLE_INTERVAL_SECONDS` with `sys._current_frames()`, much like py-spy does
+from outside the process, and counts the identical stacks. This needs no
+external tool or permissions, works for the audio threads as well as the event
+loop, and costs well under a percent of a core. Nothing runs unless a command
+runs inside `profiling(profile_file)`.
+
+When the session ends, the profile is written as collapsed stacks, one
+`thread;outer;...;inner count` line per distinct stack (for `flamegraph.pl`,
+speedscope, and most flame graph tools), or, if the file name ends in `.json`,
+in the speedscope format with one profile per thread.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import CodeType
+
+LOGGER = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL_SECONDS = 0.01
+
+
+def _short_path(filename: str) -> str:
+    """Shorten a path to the part after `site-packages`, `agent_cli`'s parent, or the stdlib."""
+    parts = Path(filename).parts
+    for marker in ("site-packages", "dist-packages"):
+        if marker in parts:
+            return "/".join(parts[parts.index(marker) + 1 :])
+    if "agent_cli" in parts:
+        return "/".join(parts[parts.index("agent_cli") :])
+    return "/".join(parts[-2:])
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads from a background thread."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS) -> None:
+        """Prepare to take a sample every `interval` seconds."""
+        self.interval = interval
+        self.frames: list[dict[str, Any]] = []  # Speedscope frames, indexed by the stacks
+        self.samples: Counter[tuple[str, tuple[int, ...]]] = Counter()  # (thread, stack)
+        self.duration = 0.0
+        self._frame_indices: dict[CodeType, int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def _frame_index(self, code: CodeType) -> int:
+        index = self._frame_indices.get(code)
+        if index is None:
+            index = self._frame_indices[code] = len(self.frames)
+            self.frames.append(
+                {
+                    "name": code.co_qualname,
+                    "file": _short_path(code.co_filename),
+                    "line": code.co_firstlineno,
+                },
+            )
+        return index
+
+    def _sample(self) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == self._thread.ident:
+                continue
+            stack = []
+            current = frame
+            while current is not None:
+                stack.append(self._frame_index(current.f_code))
+                current = current.f_back
+            stack.reverse()
+            self.samples[names.get(ident, str(ident)), tuple(stack)] += 1
+
+    def _run(self) -> None:
+        start = time.monotonic()
+        while not self._stop.wait(self.interval):
+            self._sample()
+        self.duration = time.monotonic() - start
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+    def _label(self, index: int) -> str:
+        frame = self.frames[index]
+        return f"{frame['name']} ({frame['file']}:{frame['line']})"
+
+    def to_collapsed(self) -> str:
+        """Return the profile as collapsed stacks, one line per distinct stack."""
+        lines = [
+            ";".join([thread, *(self._label(index) for index in stack)]) + f" {count}"
+            for (thread, stack), count in sorted(self.samples.items())
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def to_speedscope(self) -> dict[str, Any]:
+        """Return the profile in the speedscope format, with one sampled profile per thread."""
+        by_thread: dict[str, list[tuple[tuple[int, ...], int]]] = {}
+        for (thread, stack), count in self.samples.items():
+            by_thread.setdefault(thread, []).append((stack, count))
+        profiles = []
+        for thread, stacks in sorted(by_thread.items()):
+            weights = [count * self.interval for _, count in stacks]
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": thread,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": [list(stack) for stack, _ in stacks],
+                    "weights": weights,
+                },
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": "agent-cli",
+            "exporter": "agent-cli",
+            "shared": {"frames": self.frames},
+            "profiles": profiles,
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the profile to `path`, in the speedscope format for `.json` files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".json":
+            path.write_text(json.dumps(self.to_speedscope()))
+        else:
+            path.write_text(self.to_collapsed())
+
+
+@contextlib.contextmanager
+def profiling(profile_file: Path | None) -> Iterator[SamplingProfiler | None]:
+    """Profile the enclosed block and write the profile to `profile_file`, if given."""
+    if profile_file is None:
+        yield None
+        return
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.write(profile_file)
+        LOGGER.info(
+            "Wrote %d sample(s) over %.1f s to %s",
+            profiler.samples.total(),
+            profiler.duration,
+            profile_file,
+        )
@@ -0,0 +1,75 @@
+"""Measure the import cost of the agent-cli entry point and its subcommands."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import NamedTuple
+
+from rich.table import Table
+
+from agent_cli.core.utils import console
+
+_TOP_N = 25
+
+
+class ImportTiming(NamedTuple):
+    """Import time of a single module as reported by `python -X importtime`."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def _import_script(command: str | None) -> str:
+    # `-X importtime` only reports `import` statements, not `importlib.import_module`.
+    from agent_cli.cli import _LAZY_COMMANDS  # noqa: PLC0415
+
+    script = "import agent_cli.cli"
+    if command in _LAZY_COMMANDS:
+        script += f"; import {_LAZY_COMMANDS[command][0]}"
+    return script
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse the `-X importtime` report written to stderr."""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():  # noqa: PLR2004
+            continue  # The header line
+        timings.append(
+            ImportTiming(fields[2].strip(), int(fields[0]), int(fields[1])),
+        )
+    return timings
+
+
+def measure_imports(command: str | None) -> list[ImportTiming]:
+    """Import the CLI (and the module of `command`) in a fresh interpreter and time it."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _import_script(command)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def print_import_profile(command: str | None) -> None:
+    """Print the slowest imports needed to start `agent-cli [command]`."""
+    timings = measure_imports(command)
+    total_ms = sum(t.self_us for t in timings) / 1000
+    target = f"agent-cli {command}" if command else "agent-cli"
+    table = Table(title=f"⏱️ Startup imports for '{target}' ({total_ms:.1f} ms total)")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right", style="bold")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:_TOP_N]:
+        table.add_row(
+            timing.module,
+            f"{timing.self_us / 1000:.1f}",
+            f"{timing.cumulative_us / 1000:.1f}",
+        )
+    console.print(table)
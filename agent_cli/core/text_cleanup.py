@@ -0,0 +1,101 @@
+"""Rule-based cleanup of short transcripts, a fast path that skips the LLM."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import re
+from typing import NamedTuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Transcripts with more words than this are left to the LLM
+MAX_FAST_PATH_WORDS = 8
+
+FILLER_WORDS = frozenset({"ah", "eh", "er", "erm", "hm", "hmm", "mm", "uh", "uhm", "um", "umm"})
+
+_QUESTION_WORDS = frozenset(
+    {
+        "are",
+        "can",
+        "could",
+        "did",
+        "do",
+        "does",
+        "how",
+        "is",
+        "should",
+        "what",
+        "when",
+        "where",
+        "which",
+        "who",
+        "why",
+        "will",
+        "would",
+    },
+)
+# A standalone "i", also in contractions like "i'm" and "i'll"
+_LOWERCASE_I = re.compile(r"\bi\b(?=$|[\s',.!?;:])")
+# Punctuation inside the text, which the rules do not check
+_INNER_PUNCTUATION = re.compile(r"[.!?;:]\s")
+
+# How many transcripts were cleaned up by the rules, and how many by the LLM
+stats = {"fast_path": 0, "llm": 0}
+
+
+class Cleanup(NamedTuple):
+    """The result of the rule-based cleanup."""
+
+    text: str
+    confident: bool  # Whether the text can be used without asking the LLM
+    reason: str = ""  # Why the LLM is needed, if not confident
+
+
+def _normalize(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def heuristic_cleanup(text: str, *, max_words: int = MAX_FAST_PATH_WORDS) -> Cleanup:
+    """Remove filler and repeated words, and fix capitalization and final punctuation.
+
+    The rules are only trusted for short, single-sentence transcripts; for anything
+    longer or with punctuation inside, the result is flagged as not confident.
+    """
+    words: list[str] = []
+    for word in text.split():
+        if _normalize(word) not in FILLER_WORDS:
+            words.append(word)
+        elif words:
+            words[-1] = words[-1].rstrip(",")  # "I, um, think" -> "I think"
+    # Collapse stutters like "the the", but keep deliberate repeats like "no, no"
+    words = [
+        w
+        for w, next_word in itertools.pairwise([*words, None])
+        if next_word is None or _normalize(w) != _normalize(next_word) or w[-1] in ",;:"
+    ]
+    cleaned = " ".join(words).rstrip(",;: ")
+    if not any(c.isalnum() for c in cleaned):
+        return Cleanup(cleaned, confident=False, reason="no words besides filler")
+    if len(words) > max_words:
+        return Cleanup(cleaned, confident=False, reason=f"more than {max_words} words")
+    if _INNER_PUNCTUATION.search(cleaned):
+        return Cleanup(cleaned, confident=False, reason="several sentences")
+
+    cleaned = _LOWERCASE_I.sub("I", cleaned)
+    cleaned = cleaned[0].upper() + cleaned[1:]
+    if cleaned[-1] not in ".!?":
+        cleaned += "?" if _normalize(words[0]) in _QUESTION_WORDS else "."
+    return Cleanup(cleaned, confident=True)
+
+
+def record(*, fast_path: bool) -> None:
+    """Count a cleaned up transcript, and log the share that skipped the LLM."""
+    stats["fast_path" if fast_path else "llm"] += 1
+    total = stats["fast_path"] + stats["llm"]
+    LOGGER.info(
+        "Rule-based cleanup handled %d of %d transcript(s) (%.0f%% skipped the LLM)",
+        stats["fast_path"],
+        total,
+        100 * stats["fast_path"] / total,
+    )
@@ -0,0 +1,194 @@
+"""Latency tracing of the stages of a turn: capture, ASR, LLM, and TTS.
+
+Tracing is off unless a command runs inside `tracing(trace_file)`, so the `span`
+and `event` calls in the services cost next to nothing by default. Spans nest
+through a context variable, which asyncio copies into the tasks it creates, so
+the spans of concurrent tasks get the right parent.
+
+The trace is written as a Chrome trace (for `chrome://tracing` or Perfetto), or,
+if the file name ends in `.jsonl`, as one OpenTelemetry-style span per line.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """A timed stage, or an instant event if it has no duration."""
+
+    name: str
+    start_ns: int  # Unix time
+    parent_id: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    end_ns: int | None = None
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+
+    def set(self, **attributes: Any) -> None:
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+
+class Tracer:
+    """Collects the spans of one command run."""
+
+    def __init__(self) -> None:
+        """Start the trace."""
+        self.trace_id = os.urandom(16).hex()
+        self.spans: list[Span] = []
+        self._epoch_ns = time.time_ns() - time.perf_counter_ns()
+
+    def now_ns(self) -> int:
+        """Return the Unix time in nanoseconds, with the precision of the performance counter."""
+        return self._epoch_ns + time.perf_counter_ns()
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format, one track per span category."""
+        tracks: dict[str, int] = {}
+        events = []
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            category = span.name.split(".")[0]
+            event = {
+                "name": span.name,
+                "cat": category,
+                "ts": span.start_ns / 1000,
+                "pid": os.getpid(),
+                "tid": tracks.setdefault(category, len(tracks) + 1),
+                "args": span.attributes,
+            }
+            if span.end_ns == span.start_ns:
+                event.update(ph="i", s="t")
+            else:
+                event.update(ph="X", dur=((span.end_ns or span.start_ns) - span.start_ns) / 1000)
+            events.append(event)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for name, tid in tracks.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def to_otel_spans(self) -> list[dict[str, Any]]:
+        """Return the spans in the OpenTelemetry (OTLP JSON) span format."""
+        return [
+            {
+                "traceId": self.trace_id,
+                "spanId": span.span_id,
+                "parentSpanId": span.parent_id or "",
+                "name": span.name,
+                "kind": "SPAN_KIND_INTERNAL",
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": [
+                    {"key": key, "value": _otel_value(value)}
+                    for key, value in span.attributes.items()
+                ],
+            }
+            for span in self.spans
+        ]
+
+    def write(self, path: Path) -> None:
+        """Write the trace, as OpenTelemetry JSONL if the path ends in `.jsonl`."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            if path.suffix == ".jsonl":
+                f.writelines(json.dumps(span) + "\n" for span in self.to_otel_spans())
+            else:
+                json.dump(self.to_chrome_trace(), f)
+
+
+def _otel_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_tracer: ContextVar[Tracer | None] = ContextVar("tracer", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Time the enclosed block as a span, if tracing is on.
+
+    Yields the span, so attributes known only later can be added with `set`, or
+    None if tracing is off. An exception is recorded as the `error` attribute.
+    """
+    tracer = _tracer.get()
+    if tracer is None:
+        yield None
+        return
+    parent = _current_span.get()
+    new_span = Span(
+        name,
+        tracer.now_ns(),
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+    )
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as e:
+        new_span.set(error=repr(e))
+        raise
+    finally:
+        new_span.end_ns = tracer.now_ns()
+        _current_span.reset(token)
+        tracer.spans.append(new_span)
+
+
+def event(name: str, **attributes: Any) -> None:
+    """Record an instant event, such as the first partial transcript, if tracing is on."""
+    tracer = _tracer.get()
+    if tracer is None:
+        return
+    parent = _current_span.get()
+    now = tracer.now_ns()
+    tracer.spans.append(
+        Span(
+            name,
+            now,
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+            end_ns=now,
+        ),
+    )
+
+
+@contextlib.contextmanager
+def tracing(trace_file: Path | None) -> Iterator[Tracer | None]:
+    """Trace the enclosed block and write the trace to `trace_file`, if given."""
+    if trace_file is None:
+        yield None
+        return
+    tracer = Tracer()
+    token = _tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracer.reset(token)
+        tracer.write(trace_file)
+        LOGGER.info("Wrote %d span(s) to %s", len(tracer.spans), trace_file)
@@ -3,37 +3,48 @@
 from __future__ import annotations
 
 import asyncio
+import glob
 import logging
+import os
 import signal
 import sys
-import time
 from contextlib import (
     AbstractContextManager,
     asynccontextmanager,
     contextmanager,
     nullcontext,
-    suppress,
 )
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pyperclip
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
-from rich.spinner import Spinner
 from rich.status import Status
 from rich.table import Table
 from rich.text import Text
 
-from . import process
+from . import ipc, process
+from .display import FRAMES_PER_SECOND, StatusLine, status_line
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Coroutine, Generator
+    from collections.abc import (
+        AsyncGenerator,
+        Awaitable,
+        Callable,
+        Collection,
+        Coroutine,
+        Generator,
+    )
     from datetime import timedelta
     from logging import Handler
 
 console = Console()
 
+# How long `--stop` and `--flush` wait for the result through the control socket
+CONTROL_STOP_TIMEOUT = 300.0
+
 
 class InteractiveStopEvent:
     """A stop event with reset capability for chat agents."""
@@ -52,6 +63,10 @@ class InteractiveStopEvent:
         """Set the stop event."""
         self._event.set()
 
+    async def wait(self) -> None:
+        """Wait until the stop event is set."""
+        await self._event.wait()
+
     def clear(self) -> None:
         """Clear the stop event and reset interrupt count for next iteration."""
         self._event.clear()
@@ -86,11 +101,6 @@ def format_timedelta_to_ago(td: timedelta) -> str:
     return f"{seconds} second{'s' if seconds != 1 else ''} ago"
 
 
-def _create_spinner(text: str, style: str) -> Spinner:
-    """Creates a default spinner."""
-    return Spinner("dots", text=Text(text, style=style))
-
-
 def create_status(text: str, style: str = "bold yellow") -> Status:
     """Creates a default status with spinner."""
     spinner_text = Text(text, style=style)
@@ -138,6 +148,29 @@ def print_device_index(input_device_index: int | None, input_device_name: str |
         print_with_style(f"Using {name} device with index {input_device_index}")
 
 
+def find_files(inputs: list[str], extensions: Collection[str]) -> list[Path]:
+    """Expand files, glob patterns and directories (recursively) into a list of files.
+
+    The result is sorted and free of duplicates. Explicitly named files are kept
+    regardless of their extension; directories and globs only yield files with
+    one of the (lowercase) `extensions`.
+    """
+    found: set[Path] = set()
+    for item in inputs:
+        path = Path(item).expanduser()
+        if path.is_dir():
+            candidates = [p for p in path.rglob("*") if p.is_file()]
+        elif path.is_file():
+            found.add(path.resolve())
+            continue
+        else:
+            candidates = [Path(p) for p in glob.glob(str(path), recursive=True)]  # noqa: PTH207
+        found.update(
+            p.resolve() for p in candidates if p.is_file() and p.suffix.lower() in extensions
+        )
+    return sorted(found)
+
+
 def get_clipboard_text(*, quiet: bool = False) -> str | None:
     """Get text from clipboard, with an optional status message."""
     text = pyperclip.paste()
@@ -198,6 +231,127 @@ def signal_handling_context(
         pass
 
 
+async def run_with_control_socket(
+    control_socket: Path,
+    main: Callable[[InteractiveStopEvent], Awaitable[str | None]],
+    logger: logging.Logger,
+    *,
+    quiet: bool = False,
+    flush_requests: asyncio.Queue[asyncio.Future[str | None]] | None = None,
+) -> str | None:
+    """Run `main` while serving a control socket that other processes can use to stop it.
+
+    The socket accepts JSON requests with an `action` of:
+    - `stop`: stop recording and reply with the final result once it is ready
+    - `status`: reply with the PID
+    - `flush`: only if `main` takes `flush_requests`, which gets a future per
+      request; `main` finishes the current utterance, keeps recording, and
+      resolves the future with the result so far, which is the reply
+
+    SIGINT and SIGTERM keep working as with `signal_handling_context`.
+    """
+    with signal_handling_context(logger, quiet) as stop_event:
+        result: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+
+        async def handle(request: dict[str, Any]) -> dict[str, Any]:
+            action = request.get("action")
+            logger.info("Control socket request: %s", action)
+            if action == "status":
+                return {"ok": True, "running": True, "pid": os.getpid()}
+            if action == "stop":
+                stop_event.set()
+                return {"ok": True, "result": await asyncio.shield(result)}
+            if action == "flush" and flush_requests is not None and not result.done():
+                flushed: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+                flush_requests.put_nowait(flushed)
+                return {"ok": True, "result": await asyncio.shield(flushed)}
+            if action == "flush":
+                return {"ok": False, "error": "This session cannot flush."}
+            return {"ok": False, "error": f"Unknown action: {action!r}"}
+
+        async with ipc.unix_server(control_socket, handle):
+            output = None
+            try:
+                output = await main(stop_event)
+            finally:
+                # Answer pending `stop` and `flush` requests before the server shuts down
+                result.set_result(output)
+                while flush_requests is not None and not flush_requests.empty():
+                    flushed = flush_requests.get_nowait()
+                    if not flushed.done():
+                        flushed.set_result(output)
+        return output
+
+
+def _stop_via_control_socket(process_name: str) -> dict[str, Any] | None:
+    """Stop a process through its control socket, or return None if that is not possible."""
+    info = process.read_process_info(process_name)
+    if info is None or info.control_socket is None:
+        return None
+    try:
+        response = ipc.send_request(
+            Path(info.control_socket),
+            {"action": "stop"},
+            timeout=CONTROL_STOP_TIMEOUT,
+        )
+    except OSError:
+        return None  # Fall back to SIGTERM
+    return response if response.get("ok") else None
+
+
+def _stop_process(process_name: str, which: str, *, quiet: bool) -> bool:
+    """Stop a process, preferring its control socket over SIGTERM.
+
+    Through the control socket, the final result of the process is printed as well.
+    Returns False if the process was not found.
+    """
+    response = _stop_via_control_socket(process_name)
+    if response is None and not process.kill_process(process_name):
+        return False
+    result = response.get("result") if response is not None else None
+    if quiet:
+        if result:
+            print(result)
+        return True
+    print_with_style(f"✅ {which.capitalize()} stopped.")
+    if result:
+        print_output_panel(result, title="📝 Result")
+    return True
+
+
+def flush_process(process_name: str, which: str, *, quiet: bool = False) -> bool:
+    """Print the result so far of a running process, which keeps running.
+
+    Returns False if the process is not running or cannot flush.
+    """
+    info = process.read_process_info(process_name)
+    if info is None or info.control_socket is None:
+        if not quiet:
+            print_with_style(f"⚠️ No {which} is running.", style="yellow")
+        return False
+    try:
+        response = ipc.send_request(
+            Path(info.control_socket),
+            {"action": "flush"},
+            timeout=CONTROL_STOP_TIMEOUT,
+        )
+    except OSError as e:
+        print_error_message(f"Could not reach the {which}: {e}")
+        return False
+    if not response.get("ok"):
+        print_error_message(f"Could not flush the {which}: {response.get('error')}")
+        return False
+    result = response.get("result")
+    if quiet:
+        if result:
+            print(result)
+    elif result:
+        print_output_panel(result, title="📝 Result so far")
+    else:
+        print_with_style("No result yet.", style="yellow")
+    return True
+
+
 def stop_or_status_or_toggle(
     process_name: str,
     which: str,
@@ -209,10 +363,7 @@ def stop_or_status_or_toggle(
 ) -> bool:
     """Handle process control for a given process name."""
     if stop:
-        if process.kill_process(process_name):
-            if not quiet:
-                print_with_style(f"✅ {which.capitalize()} stopped.")
-        elif not quiet:
+        if not _stop_process(process_name, which, quiet=quiet) and not quiet:
             print_with_style(f"⚠️  No {which} is running.", style="yellow")
         return True
 
@@ -227,8 +378,7 @@ def stop_or_status_or_toggle(
 
     if toggle:
         if process.is_process_running(process_name):
-            if process.kill_process(process_name) and not quiet:
-                print_with_style(f"✅ {which.capitalize()} stopped.")
+            _stop_process(process_name, which, quiet=quiet)
             return True
         if not quiet:
             print_with_style(f"⚠️ {which.capitalize()} is not running.", style="yellow")
@@ -236,10 +386,23 @@ def stop_or_status_or_toggle(
     return False
 
 
-def maybe_live(use_live: bool) -> AbstractContextManager[Live | None]:
-    """Create a live context manager if use_live is True."""
+def maybe_live(
+    use_live: bool,
+    *,
+    frames_per_second: float = FRAMES_PER_SECOND,
+) -> AbstractContextManager[Live | None]:
+    """Create a live context manager if use_live is True.
+
+    The display owns a `StatusLine`, which it renders `frames_per_second` times
+    per second; see `agent_cli.core.display`.
+    """
     if use_live:
-        return Live(_create_spinner("Initializing", "blue"), console=console, transient=True)
+        return Live(
+            StatusLine("Initializing", spinner=True),
+            console=console,
+            transient=True,
+            refresh_per_second=frames_per_second,
+        )
     return nullcontext()
 
 
@@ -271,38 +434,20 @@ async def live_timer(
         yield
         return
 
-    # Start the timer task
-    start_time = time.monotonic()
-
-    async def update_timer() -> None:
-        """Update the timer display."""
-        while True:
-            elapsed = time.monotonic() - start_time
-
-            # Check if Ctrl+C was pressed
-            if stop_event and stop_event.ctrl_c_pressed:
-                ctrl_c_text = Text(
-                    "Ctrl+C pressed. Processing transcription... (Press Ctrl+C again to force exit)",
-                    style="yellow",
-                )
-                live.update(ctrl_c_text)
-            else:
-                spinner = _create_spinner(f"{base_message}... ({elapsed:.1f}s)", style)
-                live.update(spinner)
-
-            await asyncio.sleep(0.1)
-
-    timer_task = asyncio.create_task(update_timer())
-
+    # The display renders the elapsed time and Ctrl+C message when it draws a frame
+    status = status_line(live)
+    status.show(
+        base_message,
+        style=style,
+        spinner=True,
+        timer=True,
+        stop_event=stop_event,
+        ctrl_c_message="Ctrl+C pressed. Processing transcription... (Press Ctrl+C again to force exit)",
+    )
     try:
         yield
     finally:
-        # Clean up timer task automatically
-        timer_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await timer_task
-        if not quiet:
-            live.update("")
+        status.clear()
 
 
 def setup_logging(log_level: str, log_file: str | None, *, quiet: bool) -> None:
@@ -340,14 +485,13 @@ async def manage_send_receive_tasks(
     send_task = asyncio.create_task(send_task_coro)
     recv_task = asyncio.create_task(receive_task_coro)
 
-    done, pending = await asyncio.wait(
-        [send_task, recv_task],
-        return_when=return_when,
-    )
-
-    # Cancel any pending tasks
-    for task in pending:
-        task.cancel()
+    try:
+        await asyncio.wait([send_task, recv_task], return_when=return_when)
+    finally:
+        # Cancel any pending tasks, also when the caller itself is cancelled
+        for task in (send_task, recv_task):
+            if not task.done():
+                task.cancel()
 
     return send_task, recv_task
 
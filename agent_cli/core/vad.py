@@ -0,0 +1,195 @@
+"""Lightweight energy-based voice activity detection for 16-bit PCM audio.
+
+This only processes audio, so it does not import PyAudio.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+import sys
+from array import array
+from collections import deque
+
+from agent_cli import constants
+from agent_cli.constants import seconds_to_chunks
+
+
+def rms(chunk: bytes) -> float:
+    """Return the root mean square amplitude of a chunk of 16-bit mono PCM audio."""
+    samples = array("h", chunk[: len(chunk) - len(chunk) % 2])
+    if not samples:
+        return 0.0
+    if sys.byteorder == "big":
+        samples.byteswap()  # PCM audio is little-endian
+    return math.sqrt(sum(map(operator.mul, samples, samples)) / len(samples))
+
+
+class EnergyGate:
+    """Pass audio through only while its energy is above an adaptive noise floor.
+
+    The noise floor follows the RMS of the input: it drops quickly to quiet input
+    and rises slowly, so speech barely moves it while a new steady background noise
+    (e.g., a fan) is absorbed within several seconds. The gate opens when a chunk is
+    `ratio` times louder than the floor, and then also releases the `preroll` that
+    came before it, so the onset of a word is not cut off. It closes again after
+    `hangover` seconds below the threshold.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 3.0,
+        min_floor: float = 30.0,
+        preroll: float = 0.5,
+        hangover: float = 1.0,
+        rise_rate: float = 0.01,
+        fall_rate: float = 0.1,
+    ) -> None:
+        """Initialize the gate; durations are in seconds."""
+        self.ratio = ratio
+        self.min_floor = min_floor
+        self.hangover_chunks = seconds_to_chunks(hangover)
+        self.rise_rate = rise_rate
+        self.fall_rate = fall_rate
+        self.noise_floor: float | None = None
+        self.chunks_in = 0
+        self.chunks_out = 0
+        self.loud = False  # Whether the last chunk was above the threshold
+        self._preroll: deque[bytes] = deque(maxlen=seconds_to_chunks(preroll))
+        self._open_for = 0  # Remaining chunks until the gate closes
+
+    def process(self, chunk: bytes) -> list[bytes]:
+        """Return the chunks to pass on for this input chunk (possibly none)."""
+        self.chunks_in += 1
+        level = rms(chunk)
+        floor = self.noise_floor if self.noise_floor is not None else level
+        rate = self.rise_rate if level > floor else self.fall_rate
+        self.noise_floor = floor + rate * (level - floor)
+
+        self.loud = level > max(floor, self.min_floor) * self.ratio
+        if self.loud:
+            self._open_for = self.hangover_chunks
+            out = [*self._preroll, chunk]
+            self._preroll.clear()
+        elif self._open_for > 0:
+            self._open_for -= 1
+            out = [chunk]
+        else:
+            self._preroll.append(chunk)
+            out = []
+        self.chunks_out += len(out)
+        return out
+
+    def summary(self) -> str:
+        """Describe how much audio the gate has held back."""
+        if not self.chunks_in:
+            return "Energy gate saw no audio"
+        saved = 1 - self.chunks_out / self.chunks_in
+        return (
+            f"Energy gate passed {self.chunks_out} of {self.chunks_in} chunks"
+            f" ({saved:.0%} suppressed, noise floor {self.noise_floor:.0f})"
+        )
+
+
+class UtteranceSegmenter:
+    """Split a continuous stream of audio into utterances at pauses, with an `EnergyGate`.
+
+    An utterance starts when the gate has passed `min_speech` seconds of loud
+    chunks, so a click or a cough is dropped, and ends when the gate closes after
+    a `pause`. Its chunks are released as soon as they are known to be speech, so
+    they can be transcribed while the utterance is still being spoken. Utterances
+    are cut after `max_utterance` seconds, for speech without pauses.
+    """
+
+    def __init__(
+        self,
+        *,
+        pause: float = 0.8,
+        min_speech: float = 0.15,
+        max_utterance: float = 30.0,
+        **gate_kwargs: float,
+    ) -> None:
+        """Initialize the segmenter; durations are in seconds, `gate_kwargs` go to the gate."""
+        self.gate = EnergyGate(hangover=pause, **gate_kwargs)
+        self.min_speech_chunks = seconds_to_chunks(min_speech)
+        self.max_chunks = seconds_to_chunks(max_utterance)
+        self.utterances = 0
+        self._pending: list[bytes] = []  # Chunks of a possible utterance
+        self._loud_chunks = 0
+        self._length = 0  # Chunks released of the current utterance
+        self._started = False
+
+    def _reset(self) -> None:
+        self._pending = []
+        self._loud_chunks = self._length = 0
+        self._started = False
+
+    def process(self, chunk: bytes) -> list[bytes | None]:
+        """Return the chunks of the current utterance for this input chunk.
+
+        `None` marks the end of an utterance, like the end of an audio queue.
+        """
+        passed = self.gate.process(chunk)
+        if not passed:
+            return self.flush()
+        self._loud_chunks += self.gate.loud
+        self._pending.extend(passed)
+        if not self._started:
+            if self._loud_chunks < self.min_speech_chunks:
+                return []
+            self._started = True
+            self.utterances += 1
+        out: list[bytes | None] = [*self._pending]
+        self._length += len(self._pending)
+        self._pending = []
+        if self._length >= self.max_chunks:
+            out.append(None)
+            self._reset()
+        return out
+
+    def flush(self) -> list[bytes | None]:
+        """End the current utterance, e.g., at the end of the stream, dropping mere noise."""
+        out: list[bytes | None] = [None] if self._started else []
+        self._reset()
+        return out
+
+
+def split_at_silences(
+    pcm: bytes,
+    *,
+    window_seconds: float,
+    overlap_seconds: float = 0.0,
+    search_seconds: float | None = None,
+) -> list[tuple[int, int]]:
+    """Split 16 kHz mono PCM audio into windows of at most `window_seconds`.
+
+    Each window is cut at the quietest 30 ms frame within the last `search_seconds`
+    (by default a third) of the window, so that cuts fall between words where
+    possible. Every window after the first also starts `overlap_seconds` before
+    the previous cut, so a word cut in half is complete in one of the windows.
+
+    Returns:
+        The `(start, end)` byte offsets of the windows.
+
+    """
+    bytes_per_second = constants.PYAUDIO_RATE * 2
+    frame = bytes_per_second * 30 // 1000
+
+    def to_bytes(seconds: float) -> int:
+        return int(seconds * bytes_per_second) // frame * frame
+
+    window = max(to_bytes(window_seconds), frame)
+    search = to_bytes(search_seconds if search_seconds is not None else window_seconds / 3)
+    search = min(max(search, frame), window)
+    overlap = to_bytes(overlap_seconds)
+
+    windows = []
+    start = 0
+    while len(pcm) - start > window:
+        frames = range(start + window - search, start + window, frame)
+        cut = min(frames, key=lambda i: rms(pcm[i : i + frame])) + frame // 2
+        windows.append((max(start - overlap, 0), cut))
+        start = cut
+    windows.append((max(start - overlap, 0), len(pcm)))
+    return windows
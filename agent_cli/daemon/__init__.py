@@ -0,0 +1,5 @@
+"""Resident daemon and thin client for hotkey-triggered commands."""
+
+from __future__ import annotations
+
+__all__ = ["client", "server"]
@@ -0,0 +1,107 @@
+"""Thin client that sends a request to the running `agent-cli daemon`.
+
+Only the standard library is imported, so a hotkey press reaches the daemon in a
+few milliseconds instead of paying the full `agent-cli` startup cost.
+
+Examples:
+    agent-cli-send transcribe --toggle -o llm=true
+    agent-cli-send voice-edit --toggle
+    agent-cli-send autocorrect "this is incorect"
+    agent-cli-send speak
+    agent-cli-send daemon --status
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any
+
+from agent_cli.core import ipc
+
+DAEMON_NAME = "daemon"
+COMMANDS = ("transcribe", "voice-edit", "autocorrect", "speak", DAEMON_NAME)
+ACTIONS = ("start", "stop", "toggle", "status")
+
+
+def _parse_option(value: str) -> tuple[str, Any]:
+    """Parse `KEY=VALUE`, where VALUE is decoded as JSON if possible."""
+    key, sep, raw = value.partition("=")
+    if not sep or not key:
+        msg = f"Expected KEY=VALUE, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    try:
+        return key, json.loads(raw)
+    except json.JSONDecodeError:
+        return key, raw
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="agent-cli-send",
+        description="Send a request to the running `agent-cli daemon`.",
+    )
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument(
+        "text",
+        nargs="?",
+        help="Text for autocorrect or speak. Reads from clipboard if not provided.",
+    )
+    actions = parser.add_mutually_exclusive_group()
+    for action in ACTIONS:
+        actions.add_argument(
+            f"--{action}",
+            dest="action",
+            action="store_const",
+            const=action,
+            help=f"{action.capitalize()} the recording (transcribe, voice-edit) or the daemon.",
+        )
+    parser.add_argument(
+        "-o",
+        "--option",
+        dest="options",
+        action="append",
+        type=_parse_option,
+        default=[],
+        metavar="KEY=VALUE",
+        help="Override a command option, e.g., `-o llm=true` or `-o llm-provider=openai`.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for the daemon's response (default: wait indefinitely).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Send a single request to the daemon, print the result, and return the exit code."""
+    args = _parser().parse_args(argv)
+    request = {
+        "command": args.command,
+        "action": args.action,
+        "text": args.text,
+        "options": dict(args.options),
+    }
+    try:
+        response = ipc.send_request(ipc.socket_path(DAEMON_NAME), request, timeout=args.timeout)
+    except OSError as e:
+        print(f"❌ Could not reach the agent-cli daemon: {e}", file=sys.stderr)
+        return 1
+
+    if not response.get("ok"):
+        print(f"❌ {response.get('error')}", file=sys.stderr)
+        return 1
+    if args.action == "status":
+        print("running" if response.get("running") else "not running")
+        return 0 if response.get("running") else 1
+    if response.get("result"):
+        print(response["result"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
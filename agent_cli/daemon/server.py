@@ -0,0 +1,384 @@
+"""Resident daemon that serves hotkey requests without paying the startup cost each time.
+
+A regular `agent-cli transcribe` run imports all dependencies, initializes PyAudio,
+enumerates the audio devices, and connects to the servers before the first sample is
+recorded. The daemon does the expensive parts once and then accepts requests from the
+thin client (`agent-cli-send`, see `agent_cli.daemon.client`) over a Unix socket, e.g.:
+
+    {"command": "transcribe", "action": "toggle", "options": {"llm": true}}
+
+Each command is configured like its CLI counterpart: the option defaults, then the
+`[defaults]` and `[<command>]` sections of the config file, then the request's `options`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import pyperclip
+from typer.models import OptionInfo
+
+from agent_cli import config, opts
+from agent_cli.agents import autocorrect, speak, transcribe, voice_edit
+from agent_cli.cli import app
+from agent_cli.core import ipc, process, profiler, text_cleanup
+from agent_cli.core.audio import _get_all_devices, pyaudio_context, setup_devices
+from agent_cli.core.utils import (
+    InteractiveStopEvent,
+    print_command_line_args,
+    print_with_style,
+    setup_logging,
+    signal_handling_context,
+    stop_or_status_or_toggle,
+)
+from agent_cli.daemon.client import DAEMON_NAME
+from agent_cli.services.llm import ResponseCache, get_response_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    import pyaudio
+    from pydantic import BaseModel
+
+LOGGER = logging.getLogger()
+
+_Model = TypeVar("_Model", bound="BaseModel")
+
+# Modules that the LLM services import on first use, preloaded so requests start warm
+_WARM_MODULES = (
+    "pydantic_ai",
+    "pydantic_ai.models.openai",
+    "pydantic_ai.providers.openai",
+    "pydantic_ai.models.gemini",
+    "pydantic_ai.providers.google_gla",
+)
+
+# Keyword argument name of each config model, as used by the agents' `_async_main`
+_CONFIG_MODELS: dict[str, type[BaseModel]] = {
+    "provider_cfg": config.ProviderSelection,
+    "general_cfg": config.General,
+    "audio_in_cfg": config.AudioInput,
+    "wyoming_asr_cfg": config.WyomingASR,
+    "openai_asr_cfg": config.OpenAIASR,
+    "ollama_cfg": config.Ollama,
+    "openai_llm_cfg": config.OpenAILLM,
+    "gemini_llm_cfg": config.GeminiLLM,
+    "audio_out_cfg": config.AudioOutput,
+    "wyoming_tts_cfg": config.WyomingTTS,
+    "openai_tts_cfg": config.OpenAITTS,
+    "kokoro_tts_cfg": config.KokoroTTS,
+    "piper_tts_cfg": config.PiperTTS,
+}
+_LLM_CONFIGS = ("provider_cfg", "ollama_cfg", "openai_llm_cfg", "gemini_llm_cfg")
+_ASR_CONFIGS = ("audio_in_cfg", "wyoming_asr_cfg", "openai_asr_cfg")
+_TTS_CONFIGS = (
+    "audio_out_cfg",
+    "wyoming_tts_cfg",
+    "openai_tts_cfg",
+    "kokoro_tts_cfg",
+    "piper_tts_cfg",
+)
+
+
+def _option_defaults() -> dict[str, Any]:
+    """Return the defaults of the shared CLI options, keyed by their config name."""
+    defaults = {}
+    for name, option in vars(opts).items():
+        if not isinstance(option, OptionInfo):
+            continue
+        value = option.default
+        if isinstance(option.envvar, str) and option.envvar in os.environ:
+            value = os.environ[option.envvar]
+        defaults[name.lower()] = value
+    return defaults
+
+
+def command_settings(
+    file_config: dict[str, Any],
+    command: str,
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    """Resolve the settings of a command like the CLI does.
+
+    Output is always quiet because the daemon has no terminal to render to; the
+    result is returned to the client instead.
+    """
+    return {
+        **_option_defaults(),
+        **file_config.get("defaults", {}),
+        **file_config.get(command, {}),
+        **{key.replace("-", "_"): value for key, value in options.items()},
+        "quiet": True,
+        "list_devices": False,
+    }
+
+
+def _build_config(model: type[_Model], settings: dict[str, Any]) -> _Model:
+    return model(**{key: settings[key] for key in model.model_fields if key in settings})
+
+
+def _configs(settings: dict[str, Any], *names: str) -> dict[str, Any]:
+    return {name: _build_config(_CONFIG_MODELS[name], settings) for name in names}
+
+
+async def _record_transcribe(
+    p: pyaudio.PyAudio,
+    cache: ResponseCache,
+    settings: dict[str, Any],
+    stop_event: InteractiveStopEvent,
+) -> str | None:
+    cfgs = _configs(settings, "general_cfg", *_LLM_CONFIGS, *_ASR_CONFIGS)
+    device_info = setup_devices(p, cfgs["general_cfg"], cfgs["audio_in_cfg"], None)
+    assert device_info is not None  # Only None when listing devices
+    cfgs["audio_in_cfg"].input_device_index = device_info[0]
+    transcription_log = settings.get("transcription_log")
+    return await transcribe._async_main(
+        **cfgs,
+        extra_instructions=settings.get("extra_instructions"),
+        llm_enabled=bool(settings["llm"]),
+        transcription_log=Path(transcription_log).expanduser() if transcription_log else None,
+        p=p,
+        stop_event=stop_event,
+        llm_cache=cache if settings["llm_cache"] else None,
+        llm_fast_path_words=int(settings["llm_fast_path_words"]),
+    )
+
+
+async def _record_voice_edit(
+    p: pyaudio.PyAudio,
+    cache: ResponseCache,  # noqa: ARG001
+    settings: dict[str, Any],
+    stop_event: InteractiveStopEvent,
+) -> str | None:
+    return await voice_edit._async_main(
+        **_configs(settings, "general_cfg", *_LLM_CONFIGS, *_ASR_CONFIGS, *_TTS_CONFIGS),
+        p=p,
+        stop_event=stop_event,
+    )
+
+
+async def _run_autocorrect(
+    p: pyaudio.PyAudio,  # noqa: ARG001
+    cache: ResponseCache,
+    settings: dict[str, Any],
+    text: str | None,
+) -> str | None:
+    text = text or pyperclip.paste()
+    if not text:
+        msg = "Clipboard is empty."
+        raise ValueError(msg)
+    corrected_text, _ = await autocorrect._process_text(
+        text,
+        **_configs(settings, *_LLM_CONFIGS),
+        cache=cache if settings["llm_cache"] else None,
+    )
+    pyperclip.copy(corrected_text)
+    return corrected_text
+
+
+async def _run_speak(
+    p: pyaudio.PyAudio,
+    cache: ResponseCache,  # noqa: ARG001
+    settings: dict[str, Any],
+    text: str | None,
+) -> str | None:
+    await speak._async_main(
+        **_configs({**settings, "enable_tts": True}, "general_cfg", "provider_cfg", *_TTS_CONFIGS),
+        text=text,  # Reads from the clipboard if None
+        p=p,
+    )
+    return None
+
+
+_RECORDERS: dict[
+    str,
+    Callable[
+        [pyaudio.PyAudio, ResponseCache, dict[str, Any], InteractiveStopEvent],
+        Awaitable[str | None],
+    ],
+] = {
+    "transcribe": _record_transcribe,
+    "voice-edit": _record_voice_edit,
+}
+_ONE_SHOTS: dict[
+    str,
+    Callable[
+        [pyaudio.PyAudio, ResponseCache, dict[str, Any], str | None],
+        Awaitable[str | None],
+    ],
+] = {
+    "autocorrect": _run_autocorrect,
+    "speak": _run_speak,
+}
+
+
+def _error(message: str) -> dict[str, Any]:
+    return {"ok": False, "error": message}
+
+
+@dataclass
+class _Recording:
+    """A recording that runs until its stop event is set."""
+
+    stop_event: InteractiveStopEvent
+    task: asyncio.Task[str | None]
+
+
+class _Daemon:
+    """Dispatches client requests to the agents, sharing one PyAudio instance and LLM cache."""
+
+    def __init__(
+        self,
+        p: pyaudio.PyAudio,
+        file_config: dict[str, Any],
+        shutdown_event: InteractiveStopEvent,
+    ) -> None:
+        self.p = p
+        self.file_config = file_config
+        self.shutdown_event = shutdown_event
+        self.recordings: dict[str, _Recording] = {}
+        self.cache = get_response_cache()
+
+    async def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle a single request from the client."""
+        # The PID file advertises this socket as the daemon's control socket, so
+        # `agent-cli daemon --stop` sends a bare `{"action": "stop"}` to it
+        command = request.get("command", DAEMON_NAME)
+        action = request.get("action")
+        LOGGER.info("Daemon request: command=%s action=%s", command, action)
+        if command == DAEMON_NAME:
+            return self._daemon_action(action)
+        if command not in _RECORDERS and command not in _ONE_SHOTS:
+            return _error(f"Unknown command: {command!r}")
+        settings = command_settings(self.file_config, command, request.get("options") or {})
+        if command in _RECORDERS:
+            return await self._recording_action(command, action or "toggle", settings)
+        result = await _ONE_SHOTS[command](self.p, self.cache, settings, request.get("text"))
+        return {"ok": True, "result": result}
+
+    def _daemon_action(self, action: str | None) -> dict[str, Any]:
+        if action == "stop":
+            self.shutdown_event.set()
+            return {"ok": True, "running": False}
+        if action in (None, "status"):
+            recording = [name for name, rec in self.recordings.items() if not rec.task.done()]
+            return {
+                "ok": True,
+                "running": True,
+                "pid": os.getpid(),
+                "recording": recording,
+                # How many transcripts skipped the LLM thanks to the rule-based cleanup
+                "cleanup": dict(text_cleanup.stats),
+            }
+        return _error(f"Unknown daemon action: {action!r}")
+
+    async def _recording_action(
+        self,
+        command: str,
+        action: str,
+        settings: dict[str, Any],
+    ) -> dict[str, Any]:
+        recording = self.recordings.get(command)
+        running = recording is not None and not recording.task.done()
+        if action == "status":
+            return {"ok": True, "running": running}
+        if action == "start" or (action == "toggle" and recording is None):
+            if running:
+                return _error(f"{command} is already running")
+            stop_event = InteractiveStopEvent()
+            task = asyncio.create_task(
+                _RECORDERS[command](self.p, self.cache, settings, stop_event),
+            )
+            self.recordings[command] = _Recording(stop_event, task)
+            return {"ok": True, "running": True}
+        if action in ("stop", "toggle"):
+            if recording is None:
+                return _error(f"{command} is not running")
+            # A recording that already finished (e.g., the server was unreachable)
+            # is collected here, so its result or error reaches the client.
+            del self.recordings[command]
+            recording.stop_event.set()
+            return {"ok": True, "running": False, "result": await recording.task}
+        return _error(f"Unknown action: {action!r}")
+
+    async def close(self) -> None:
+        """Stop all recordings, wait for them to finish, and close the LLM cache."""
+        for recording in self.recordings.values():
+            recording.stop_event.set()
+        await asyncio.gather(
+            *(recording.task for recording in self.recordings.values()),
+            return_exceptions=True,
+        )
+        self.recordings.clear()
+        self.cache.close()
+
+
+def _warm_up() -> None:
+    for module in _WARM_MODULES:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(module)
+
+
+async def _async_main(*, config_file: str | None, quiet: bool) -> None:
+    file_config = config.load_config(config_file)
+    _warm_up()
+    with pyaudio_context() as p:
+        _get_all_devices(p)  # Enumerate once; every request hits the cache
+        with signal_handling_context(LOGGER, quiet) as shutdown_event:
+            daemon = _Daemon(p, file_config, shutdown_event)
+            path = ipc.socket_path(DAEMON_NAME)
+            async with ipc.unix_server(path, daemon.handle):
+                if not quiet:
+                    print_with_style(f"✅ Daemon listening on {path}")
+                await shutdown_event.wait()
+                await daemon.close()
+    if not quiet:
+        print_with_style("👋 Daemon stopped.")
+
+
+@app.command("daemon")
+def daemon(
+    *,
+    # --- Process Management ---
+    stop: bool = opts.STOP,
+    status: bool = opts.STATUS,
+    # --- General Options ---
+    log_level: str = opts.LOG_LEVEL,
+    log_file: str | None = opts.LOG_FILE,
+    profile_file: Path | None = opts.PROFILE,
+    quiet: bool = opts.QUIET,
+    config_file: str | None = opts.CONFIG_FILE,
+    print_args: bool = opts.PRINT_ARGS,
+) -> None:
+    """Run a resident daemon that serves requests from the `agent-cli-send` client.
+
+    The daemon keeps PyAudio, the audio device list, and the LLM clients loaded, so
+    hotkey-triggered commands start recording almost immediately.
+
+    Usage:
+    - Start the daemon: agent-cli daemon &
+    - Toggle transcription: agent-cli-send transcribe --toggle -o llm=true
+    - Voice edit the clipboard: agent-cli-send voice-edit --toggle
+    - Correct the clipboard: agent-cli-send autocorrect
+    - Stop the daemon: agent-cli daemon --stop
+    - Profile the requests until the daemon stops: agent-cli daemon --profile daemon.json
+    """
+    if print_args:
+        print_command_line_args(locals())
+    setup_logging(log_level, log_file, quiet=quiet)
+    if stop_or_status_or_toggle(DAEMON_NAME, "daemon", stop, status, False, quiet=quiet):  # noqa: FBT003
+        return
+
+    with (
+        process.pid_file_context(DAEMON_NAME, control_socket=ipc.socket_path(DAEMON_NAME)),
+        contextlib.suppress(KeyboardInterrupt),
+        profiler.profiling(profile_file),
+    ):
+        asyncio.run(_async_main(config_file=config_file, quiet=quiet))
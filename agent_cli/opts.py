@@ -32,6 +32,25 @@ LLM: bool = typer.Option(
     help="Use an LLM to process the transcript.",
     rich_help_panel="LLM Configuration",
 )
+LLM_FAST_PATH_WORDS: int = typer.Option(
+    0,
+    "--llm-fast-path-words",
+    min=0,
+    help="Clean up transcripts of at most this many words (e.g., 8) with built-in English rules instead of the LLM, when the rules are confident. 0 (the default) always uses the LLM.",
+    rich_help_panel="LLM Configuration",
+)
+LLM_CACHE: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--llm-cache/--no-llm-cache",
+    help="Reuse the response to an identical earlier LLM request (kept in ~/.cache/agent-cli) instead of sending it again. The model samples its responses, so asking again could give a different one; with the cache, you get the earlier one for 30 days.",
+    rich_help_panel="LLM Configuration",
+)
+INCREMENTAL: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--incremental",
+    help="Correct paragraph by paragraph and keep the corrections in the LLM response cache (even without `--llm-cache`), so that only paragraphs that are new or edited since an earlier run are sent to the LLM.",
+    rich_help_panel="LLM Configuration",
+)
 # Ollama (local service)
 LLM_OLLAMA_MODEL: str = typer.Option(
     "qwen3:4b",
@@ -130,10 +149,26 @@ WAKE_SERVER_PORT: int = typer.Option(
     help="Wyoming wake word server port.",
     rich_help_panel="Wake Word Options",
 )
-WAKE_WORD: str = typer.Option(
-    "ok_nabu",
+WAKE_WORD_PROVIDER: str = typer.Option(
+    "local",
+    "--wake-word-provider",
+    help="The wake word provider to use ('local' for a Wyoming server, 'openwakeword' to run"
+    " openWakeWord in-process, requires `pip install openwakeword`).",
+    rich_help_panel="Wake Word Options",
+)
+WAKE_WORD: str | None = typer.Option(
+    None,
     "--wake-word",
-    help="Name of wake word to detect (e.g., 'ok_nabu', 'hey_jarvis').",
+    help="Name of wake word to detect (e.g., 'ok_nabu', 'hey_jarvis'). With the 'openwakeword'"
+    " provider, this is one of its pretrained models or the path to a model file. Defaults to"
+    " 'ok_nabu' for the Wyoming server and 'hey_jarvis' for openWakeWord.",
+    rich_help_panel="Wake Word Options",
+)
+ENERGY_GATE: bool = typer.Option(
+    True,  # noqa: FBT003
+    "--energy-gate/--no-energy-gate",
+    help="Only stream audio to the wake word detector while it is louder than the background"
+    " noise, which saves CPU and bandwidth while the room is quiet.",
     rich_help_panel="Wake Word Options",
 )
 
@@ -275,6 +310,46 @@ TTS_PIPER_NOISE_W_SCALE: float | None = typer.Option(
 )
 
 
+# --- Batch Options ---
+CONCURRENCY: int = typer.Option(
+    4,
+    "--concurrency",
+    "-j",
+    min=1,
+    help="Maximum number of requests to the ASR or LLM service in flight at once.",
+    rich_help_panel="Batch Options",
+)
+MAX_CHUNK_TOKENS: int = typer.Option(
+    500,
+    "--max-chunk-tokens",
+    min=1,
+    help="Approximate token budget of the text sent in each LLM request; paragraphs are not split unless they exceed it.",
+    rich_help_panel="Batch Options",
+)
+RESUME: bool = typer.Option(
+    True,  # noqa: FBT003
+    "--resume/--no-resume",
+    help="Skip inputs that already have results from a previous run.",
+    rich_help_panel="Batch Options",
+)
+
+
+# --- Dictation Options ---
+CONTINUOUS: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--continuous",
+    help="Keep listening until stopped, and transcribe each utterance (split at pauses) while"
+    " the next one is spoken. The clipboard holds everything dictated so far.",
+    rich_help_panel="Dictation Options",
+)
+OUTPUT_FILE: Path | None = typer.Option(
+    None,
+    "--output-file",
+    help="With `--continuous`, append each transcribed utterance to this file as a line.",
+    rich_help_panel="Dictation Options",
+)
+
+
 # --- Process Management Options ---
 STOP: bool = typer.Option(
     False,  # noqa: FBT003
@@ -288,6 +363,13 @@ STATUS: bool = typer.Option(
     help="Check if a background process is running.",
     rich_help_panel="Process Management Options",
 )
+FLUSH: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--flush",
+    help="Print the transcript so far of the running `--continuous` session, which ends the"
+    " current utterance and keeps recording.",
+    rich_help_panel="Process Management Options",
+)
 TOGGLE: bool = typer.Option(
     False,  # noqa: FBT003
     "--toggle",
@@ -341,6 +423,43 @@ LOG_FILE: str | None = typer.Option(
     help="Path to a file to write logs to.",
     rich_help_panel="General Options",
 )
+METRICS_PORT: int | None = typer.Option(
+    None,
+    "--metrics-port",
+    help="Serve Prometheus metrics (latencies, wake word detections, dropped audio, errors)"
+    " at http://127.0.0.1:<port>/metrics while running.",
+    rich_help_panel="General Options",
+)
+METRICS_FILE: Path | None = typer.Option(
+    None,
+    "--metrics-file",
+    help="Write Prometheus metrics to this file every 15 seconds, for the textfile collector"
+    " of the node exporter (use a `.prom` file in its directory).",
+    rich_help_panel="General Options",
+)
+TRACE_FILE: Path | None = typer.Option(
+    None,
+    "--trace-file",
+    help="Write a timeline of the stages (capture, ASR, LLM, TTS) to this file when done,"
+    " as a Chrome trace (open in Perfetto or chrome://tracing), or, for a `.jsonl` file,"
+    " as OpenTelemetry spans.",
+    rich_help_panel="General Options",
+)
+PROFILE: Path | None = typer.Option(
+    None,
+    "--profile",
+    help="Profile the session with a sampling profiler and write the result to this file when"
+    " done: collapsed stacks for flame graphs, or, for a `.json` file, a profile for"
+    " https://www.speedscope.app.",
+    rich_help_panel="General Options",
+)
+DEBUG_LOOP: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--debug-loop",
+    help="Monitor the event loop and, when done, report its lag and the functions that"
+    " blocked it for more than 50 ms, to find code that delays the audio and the display.",
+    rich_help_panel="General Options",
+)
 QUIET: bool = typer.Option(
     False,  # noqa: FBT003
     "-q",
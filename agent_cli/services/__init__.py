@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import io
+import time
 from typing import TYPE_CHECKING
 
+from agent_cli.core import metrics
+
 if TYPE_CHECKING:
     import logging
 
@@ -36,10 +39,12 @@ async def transcribe_audio_openai(
     client = _get_openai_client(api_key=openai_asr_cfg.openai_api_key)
     audio_file = io.BytesIO(audio_data)
     audio_file.name = "audio.wav"
+    start_time = time.monotonic()
     response = await client.audio.transcriptions.create(
         model=openai_asr_cfg.asr_openai_model,
         file=audio_file,
     )
+    metrics.ASR_SECONDS.observe(time.monotonic() - start_time, provider="openai")
     return response.text
 
 
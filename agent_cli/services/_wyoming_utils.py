@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import TYPE_CHECKING
 
 from wyoming.client import AsyncClient
 
+from agent_cli.core import metrics, tracing
 from agent_cli.core.utils import print_error_message
 
 if TYPE_CHECKING:
@@ -22,6 +23,7 @@ async def wyoming_client_context(
     logger: logging.Logger,
     *,
     quiet: bool = False,
+    log_errors: bool = True,
 ) -> AsyncGenerator[AsyncClient, None]:
     """Context manager for Wyoming client connections with unified error handling.
 
@@ -31,6 +33,7 @@ async def wyoming_client_context(
         server_type: Type of server (e.g., "ASR", "TTS", "wake word")
         logger: Logger instance
         quiet: If True, suppress console error messages
+        log_errors: If False, leave logging connection errors to the caller
 
     Yields:
         Connected Wyoming client
@@ -44,11 +47,15 @@ async def wyoming_client_context(
     logger.info("Connecting to Wyoming %s server at %s", server_type, uri)
 
     try:
-        async with AsyncClient.from_uri(uri) as client:
+        async with AsyncExitStack() as stack:
+            with tracing.span(f"{server_type.lower()}.connect", uri=uri):
+                client = await stack.enter_async_context(AsyncClient.from_uri(uri))
             logger.info("%s connection established", server_type)
             yield client
     except ConnectionRefusedError:
-        logger.exception("%s connection refused.", server_type)
+        if log_errors:
+            logger.exception("%s connection refused.", server_type)
+        metrics.ERRORS.inc(stage=server_type.lower())
         if not quiet:
             print_error_message(
                 f"{server_type} connection refused.",
@@ -56,7 +63,9 @@ async def wyoming_client_context(
             )
         raise
     except Exception as e:
-        logger.exception("An error occurred during %s connection", server_type.lower())
+        if log_errors:
+            logger.exception("An error occurred during %s connection", server_type.lower())
+        metrics.ERRORS.inc(stage=server_type.lower())
         if not quiet:
             print_error_message(f"{server_type} error: {e}")
         raise
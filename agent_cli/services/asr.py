@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import io
+import re
+import time
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -11,12 +13,14 @@ from wyoming.asr import Transcribe, Transcript, TranscriptChunk, TranscriptStart
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 
 from agent_cli import constants
+from agent_cli.core import metrics, tracing, vad
 from agent_cli.core.audio import (
     open_pyaudio_stream,
     read_audio_stream,
     read_from_queue,
     setup_input_stream,
 )
+from agent_cli.core.audio_file import pcm_to_wav
 from agent_cli.core.utils import manage_send_receive_tasks
 from agent_cli.services import transcribe_audio_openai
 from agent_cli.services._wyoming_utils import wyoming_client_context
@@ -32,6 +36,15 @@ if TYPE_CHECKING:
     from agent_cli import config
     from agent_cli.core.utils import InteractiveStopEvent
 
+# Recordings longer than this are transcribed in windows that are cut at silences
+LONG_AUDIO_WINDOW_SECONDS = 30.0
+# Audio shared by consecutive windows, so that a word at a cut is heard in full
+WINDOW_OVERLAP_SECONDS = 1.0
+# Longest run of words that the overlap can duplicate when stitching the windows
+_MAX_OVERLAP_WORDS = 8
+# Windows of one recording in flight at once, unless the caller passes a semaphore
+MAX_CONCURRENT_WINDOWS = 4
+
 
 def create_transcriber(
     provider_cfg: config.ProviderSelection,
@@ -61,7 +74,7 @@ def create_recorded_audio_transcriber(
 ) -> Callable[..., Awaitable[str]]:
     """Return the appropriate transcriber for recorded audio based on the provider."""
     if provider_cfg.asr_provider == "openai":
-        return transcribe_audio_openai
+        return _transcribe_recorded_audio_openai
     if provider_cfg.asr_provider == "local":
         return _transcribe_recorded_audio_wyoming
     msg = f"Unsupported ASR provider: {provider_cfg.asr_provider}"
@@ -76,29 +89,37 @@ async def _send_audio(
     *,
     live: Live,
     quiet: bool = False,
-) -> None:
-    """Read from mic and send to Wyoming server."""
+) -> float:
+    """Read from mic and send to Wyoming server, returning the `time.monotonic()` of the end."""
     await client.write_event(Transcribe().event())
     await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
 
+    n_bytes = 0
+
     async def send_chunk(chunk: bytes) -> None:
         """Send audio chunk to ASR server."""
+        nonlocal n_bytes
+        n_bytes += len(chunk)
         await client.write_event(AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event())
 
     try:
-        await read_audio_stream(
-            stream=stream,
-            stop_event=stop_event,
-            chunk_handler=send_chunk,
-            logger=logger,
-            live=live,
-            quiet=quiet,
-            progress_message="Listening",
-            progress_style="blue",
-        )
+        with tracing.span("asr.capture") as span:
+            await read_audio_stream(
+                stream=stream,
+                stop_event=stop_event,
+                chunk_handler=send_chunk,
+                logger=logger,
+                live=live,
+                quiet=quiet,
+                progress_message="Listening",
+                progress_style="blue",
+            )
+            if span is not None:
+                span.set(audio_bytes=n_bytes)
     finally:
         await client.write_event(AudioStop().event())
         logger.debug("Sent AudioStop")
+    return time.monotonic()
 
 
 async def record_audio_to_buffer(queue: asyncio.Queue, logger: logging.Logger) -> bytes:
@@ -123,6 +144,7 @@ async def _receive_transcript(
 ) -> str:
     """Receive transcription events and return the final transcript."""
     transcript_text = ""
+    first_partial = True
     while True:
         event = await client.read_event()
         if event is None:
@@ -132,12 +154,16 @@ async def _receive_transcript(
         if Transcript.is_type(event.type):
             transcript = Transcript.from_event(event)
             transcript_text = transcript.text
+            tracing.event("asr.final_transcript", chars=len(transcript_text))
             logger.info("Final transcript: %s", transcript_text)
             if final_callback:
                 final_callback(transcript_text)
             break
         if TranscriptChunk.is_type(event.type):
             chunk = TranscriptChunk.from_event(event)
+            if first_partial:
+                tracing.event("asr.first_partial")
+                first_partial = False
             logger.debug("Transcript chunk: %s", chunk.text)
             if chunk_callback:
                 chunk_callback(chunk.text)
@@ -166,7 +192,7 @@ async def record_audio_with_manual_stop(
         audio_buffer.write(chunk)
 
     stream_kwargs = setup_input_stream(input_device_index)
-    with open_pyaudio_stream(p, **stream_kwargs) as stream:
+    with tracing.span("asr.capture") as span, open_pyaudio_stream(p, **stream_kwargs) as stream:
         await read_audio_stream(
             stream=stream,
             stop_event=stop_event,
@@ -177,6 +203,8 @@ async def record_audio_with_manual_stop(
             progress_message="Recording",
             progress_style="green",
         )
+        if span is not None:
+            span.set(audio_bytes=audio_buffer.tell())
     return audio_buffer.getvalue()
 
 
@@ -189,7 +217,43 @@ async def _transcribe_recorded_audio_wyoming(
     **_kwargs: object,
 ) -> str:
     """Process pre-recorded audio data with Wyoming ASR server."""
+    transcribe = partial(
+        _transcribe_pcm_wyoming,
+        wyoming_asr_cfg=wyoming_asr_cfg,
+        logger=logger,
+        quiet=quiet,
+    )
     try:
+        return await _transcribe_in_windows(audio_data, transcribe, logger)
+    except (ConnectionRefusedError, Exception):
+        return ""
+
+
+async def _transcribe_recorded_audio_openai(
+    *,
+    audio_data: bytes,
+    openai_asr_cfg: config.OpenAIASR,
+    logger: logging.Logger,
+    **_kwargs: object,
+) -> str:
+    """Process pre-recorded audio data with OpenAI Whisper, raising on errors."""
+
+    async def transcribe(pcm: bytes) -> str:
+        return await transcribe_audio_openai(pcm_to_wav(pcm), openai_asr_cfg, logger)
+
+    return await _transcribe_in_windows(audio_data, transcribe, logger)
+
+
+async def _transcribe_pcm_wyoming(
+    audio_data: bytes,
+    wyoming_asr_cfg: config.WyomingASR,
+    logger: logging.Logger,
+    *,
+    quiet: bool = False,
+) -> str:
+    """Send pre-recorded audio data to the Wyoming ASR server, raising on errors."""
+    start_time = time.monotonic()
+    with tracing.span("asr.transcribe", audio_bytes=len(audio_data)):
         async with wyoming_client_context(
             wyoming_asr_cfg.asr_wyoming_ip,
             wyoming_asr_cfg.asr_wyoming_port,
@@ -211,9 +275,146 @@ async def _transcribe_recorded_audio_wyoming(
             await client.write_event(AudioStop().event())
             logger.debug("Sent AudioStop")
 
-            return await _receive_transcript(client, logger)
-    except (ConnectionRefusedError, Exception):
-        return ""
+            transcript = await _receive_transcript(client, logger)
+    metrics.ASR_SECONDS.observe(time.monotonic() - start_time, provider="wyoming")
+    return transcript
+
+
+async def transcribe_utterance(
+    queue: asyncio.Queue[bytes | None],
+    *,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    logger: logging.Logger,
+) -> str:
+    """Transcribe an utterance whose audio arrives on `queue` while it is spoken.
+
+    The audio ends with `None`. A Wyoming server gets each chunk as it arrives, so
+    the transcript is ready shortly after the utterance ends; OpenAI gets the whole
+    utterance at its end. Errors are raised, like for `transcribe_recording`.
+    """
+    if provider_cfg.asr_provider == "openai":
+        audio_data = await record_audio_to_buffer(queue, logger)
+        with tracing.span("asr.transcribe", audio_bytes=len(audio_data)):
+            return await transcribe_audio_openai(pcm_to_wav(audio_data), openai_asr_cfg, logger)
+    if provider_cfg.asr_provider != "local":
+        msg = f"Unsupported ASR provider: {provider_cfg.asr_provider}"
+        raise ValueError(msg)
+
+    async with wyoming_client_context(
+        wyoming_asr_cfg.asr_wyoming_ip,
+        wyoming_asr_cfg.asr_wyoming_port,
+        "ASR",
+        logger,
+        quiet=True,
+    ) as client:
+        await client.write_event(Transcribe().event())
+        await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
+
+        async def send_chunk(chunk: bytes) -> None:
+            await client.write_event(
+                AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event(),
+            )
+
+        with tracing.span("asr.transcribe"):
+            await read_from_queue(queue, send_chunk, logger)
+            await client.write_event(AudioStop().event())
+            end_time = time.monotonic()
+            transcript = await _receive_transcript(client, logger)
+    metrics.ASR_SECONDS.observe(time.monotonic() - end_time, provider="wyoming")
+    return transcript
+
+
+async def transcribe_recording(
+    audio_data: bytes,
+    *,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    logger: logging.Logger,
+    semaphore: asyncio.Semaphore | None = None,
+    window_seconds: float = LONG_AUDIO_WINDOW_SECONDS,
+) -> str:
+    """Transcribe a complete recording of 16 kHz mono PCM audio.
+
+    Long recordings are split at silences into overlapping windows of at most
+    `window_seconds`, which are transcribed concurrently (with at most `semaphore`
+    requests in flight, if given) and stitched back together.
+
+    Unlike the transcribers for interactive use, errors are raised instead of
+    reported, so that batch callers can record them per recording.
+    """
+    if provider_cfg.asr_provider not in ("local", "openai"):
+        msg = f"Unsupported ASR provider: {provider_cfg.asr_provider}"
+        raise ValueError(msg)
+
+    async def transcribe(pcm: bytes) -> str:
+        if provider_cfg.asr_provider == "openai":
+            return await transcribe_audio_openai(pcm_to_wav(pcm), openai_asr_cfg, logger)
+        return await _transcribe_pcm_wyoming(pcm, wyoming_asr_cfg, logger, quiet=True)
+
+    return await _transcribe_in_windows(
+        audio_data,
+        transcribe,
+        logger,
+        semaphore=semaphore,
+        window_seconds=window_seconds,
+    )
+
+
+async def _transcribe_in_windows(
+    audio_data: bytes,
+    transcribe: Callable[[bytes], Awaitable[str]],
+    logger: logging.Logger,
+    *,
+    semaphore: asyncio.Semaphore | None = None,
+    window_seconds: float = LONG_AUDIO_WINDOW_SECONDS,
+) -> str:
+    """Transcribe PCM audio in windows cut at silences and stitch the transcripts.
+
+    At most `MAX_CONCURRENT_WINDOWS` windows are transcribed at once, unless a
+    `semaphore` is given.
+    """
+    # Scanning a long recording for silences takes a while, so keep it off the event loop
+    windows = await asyncio.to_thread(
+        vad.split_at_silences,
+        audio_data,
+        window_seconds=window_seconds,
+        overlap_seconds=WINDOW_OVERLAP_SECONDS,
+    )
+    if len(windows) > 1:
+        logger.info("Transcribing %d windows of up to %.0fs", len(windows), window_seconds)
+    semaphore = semaphore or asyncio.Semaphore(MAX_CONCURRENT_WINDOWS)
+
+    async def transcribe_window(start: int, end: int) -> str:
+        async with semaphore:
+            return await transcribe(audio_data[start:end])
+
+    texts = await asyncio.gather(*(transcribe_window(start, end) for start, end in windows))
+    return texts[0] if len(texts) == 1 else stitch_transcripts(texts)
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def stitch_transcripts(texts: list[str], *, max_overlap_words: int = _MAX_OVERLAP_WORDS) -> str:
+    """Join the transcripts of consecutive, overlapping windows.
+
+    The longest run of up to `max_overlap_words` words that both ends one
+    transcript and starts the next (ignoring case and punctuation) is the audio
+    of the overlap, so it is kept only once.
+    """
+    words: list[str] = []
+    for text in texts:
+        new_words = text.split()
+        limit = min(max_overlap_words, len(words), len(new_words))
+        tail = [_normalize_word(w) for w in words[len(words) - limit :]]
+        head = [_normalize_word(w) for w in new_words[:limit]]
+        overlap = next((k for k in range(limit, 0, -1) if tail[-k:] == head[:k]), 0)
+        words.extend(new_words[overlap:])
+    return " ".join(words)
 
 
 async def _transcribe_live_audio_wyoming(
@@ -240,7 +441,7 @@ async def _transcribe_live_audio_wyoming(
         ) as client:
             stream_kwargs = setup_input_stream(audio_input_cfg.input_device_index)
             with open_pyaudio_stream(p, **stream_kwargs) as stream:
-                _, recv_task = await manage_send_receive_tasks(
+                send_task, recv_task = await manage_send_receive_tasks(
                     _send_audio(client, stream, stop_event, logger, live=live, quiet=quiet),
                     _receive_transcript(
                         client,
@@ -250,6 +451,12 @@ async def _transcribe_live_audio_wyoming(
                     ),
                     return_when=asyncio.ALL_COMPLETED,
                 )
+                if not send_task.cancelled() and send_task.exception() is None:
+                    # The transcript of live audio is ready this long after the recording stopped
+                    metrics.ASR_SECONDS.observe(
+                        time.monotonic() - send_task.result(),
+                        provider="wyoming",
+                    )
                 return recv_task.result()
     except (ConnectionRefusedError, Exception):
         return None
@@ -278,7 +485,10 @@ async def _transcribe_live_audio_openai(
     if not audio_data:
         return None
     try:
-        return await transcribe_audio_openai(audio_data, openai_asr_cfg, logger)
+        with tracing.span("asr.transcribe", audio_bytes=len(audio_data)):
+            transcript = await transcribe_audio_openai(audio_data, openai_asr_cfg, logger)
     except Exception:
         logger.exception("Error during transcription")
         return ""
+    tracing.event("asr.final_transcript", chars=len(transcript))
+    return transcript
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
 import sys
+import threading
 import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pyperclip
 from rich.live import Live
 
+from agent_cli.core import metrics, tracing
 from agent_cli.core.utils import console, live_timer, print_error_message, print_output_panel
 
 if TYPE_CHECKING:
-    import logging
+    from typing import Self
 
     from pydantic_ai import Agent
     from pydantic_ai.models.gemini import GeminiModel
@@ -21,6 +29,14 @@ if TYPE_CHECKING:
 
     from agent_cli import config
 
+LOGGER = logging.getLogger(__name__)
+
+CACHE_FILE = Path.home() / ".cache" / "agent-cli" / "llm-cache.sqlite"
+# Cached responses older than this are not used, so model updates are picked up eventually
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+# Least recently used responses beyond this are evicted
+CACHE_MAX_ENTRIES = 10_000
+
 
 def _openai_llm_model(openai_cfg: config.OpenAILLM) -> OpenAIModel:
     from pydantic_ai.models.openai import OpenAIModel  # noqa: PLC0415
@@ -55,6 +71,153 @@ def _gemini_llm_model(gemini_cfg: config.GeminiLLM) -> GeminiModel:
     return GeminiModel(model_name=model_name, provider=provider)
 
 
+def get_model_name(
+    provider_cfg: config.ProviderSelection,
+    ollama_cfg: config.Ollama,
+    openai_cfg: config.OpenAILLM,
+    gemini_cfg: config.GeminiLLM,
+) -> str:
+    """Return the name of the configured LLM model."""
+    if provider_cfg.llm_provider == "local":
+        return ollama_cfg.llm_ollama_model
+    if provider_cfg.llm_provider == "openai":
+        return openai_cfg.llm_openai_model
+    return gemini_cfg.llm_gemini_model
+
+
+def get_model_host(provider_cfg: config.ProviderSelection, ollama_cfg: config.Ollama) -> str:
+    """Return the server of a self-hosted LLM model, where the same name can be another model."""
+    return ollama_cfg.llm_ollama_host if provider_cfg.llm_provider == "local" else ""
+
+
+class ResponseCache:
+    """Persistent cache of LLM responses to deterministic prompts, stored in SQLite.
+
+    Only for transformations whose output depends on nothing but the prompt, such
+    as correcting or cleaning up text. Errors accessing the database are logged and
+    treated as cache misses, so the cache never breaks the request. The database is
+    accessed in a worker thread, so lookups do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl: float = CACHE_TTL_SECONDS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache; the database is opened on first use."""
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._db: sqlite3.Connection | None = None
+        # The connection is shared by the worker threads, one at a time
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        *,
+        provider: str,
+        model: str,
+        host: str,
+        system_prompt: str,
+        instructions: str,
+        user_input: str,
+    ) -> str:
+        """Return the cache key of a request."""
+        data = json.dumps([provider, model, host, system_prompt, instructions, user_input])
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                self.path,
+                timeout=1.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)",
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)",
+            )
+        return self._db
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached response, if there is one that has not expired."""
+        response = await asyncio.to_thread(self._get, key)
+        if response is None:
+            self.misses += 1
+            metrics.LLM_CACHE_LOOKUPS.inc(result="miss")
+        else:
+            self.hits += 1
+            metrics.LLM_CACHE_LOOKUPS.inc(result="hit")
+        return response
+
+    def _get(self, key: str) -> str | None:
+        now = time.time()
+        try:
+            with self._lock:
+                db = self._connect()
+                row = db.execute(
+                    "SELECT response FROM responses WHERE key = ? AND created > ?",
+                    (key, now - self.ttl),
+                ).fetchone()
+                if row is not None:
+                    db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        except sqlite3.Error:
+            LOGGER.warning("Could not read the LLM response cache %s", self.path, exc_info=True)
+            return None
+        return row[0] if row is not None else None
+
+    async def put(self, key: str, response: str) -> None:
+        """Store a response, evicting expired and least recently used entries."""
+        await asyncio.to_thread(self._put, key, response)
+
+    def _put(self, key: str, response: str) -> None:
+        now = time.time()
+        try:
+            with self._lock:
+                db = self._connect()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                db.execute("DELETE FROM responses WHERE created <= ?", (now - self.ttl,))
+                db.execute(
+                    "DELETE FROM responses WHERE key IN"
+                    " (SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error:
+            LOGGER.warning("Could not write the LLM response cache %s", self.path, exc_info=True)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self) -> Self:
+        """Return the cache, which is closed on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the database."""
+        self.close()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the response cache in the user's cache directory."""
+    return ResponseCache(CACHE_FILE)
+
+
 def create_llm_agent(
     provider_cfg: config.ProviderSelection,
     ollama_cfg: config.Ollama,
@@ -112,38 +275,64 @@ async def get_llm_response(
     clipboard: bool = False,
     show_output: bool = False,
     exit_on_error: bool = False,
+    cache: ResponseCache | None = None,
 ) -> str | None:
-    """Get a response from the LLM with optional clipboard and output handling."""
-    agent = create_llm_agent(
-        provider_cfg=provider_cfg,
-        ollama_cfg=ollama_cfg,
-        openai_cfg=openai_cfg,
-        gemini_cfg=gemini_cfg,
+    """Get a response from the LLM with optional clipboard and output handling.
+
+    With a `cache`, a response to the same prompt from the same model is reused
+    instead of sending the request; pass None to bypass it. Requests with `tools`
+    are never cached, because their response depends on what the tools return.
+    """
+    start_time = time.monotonic()
+    model_name = get_model_name(provider_cfg, ollama_cfg, openai_cfg, gemini_cfg)
+    if tools:
+        cache = None
+    cache_key = ResponseCache.key(
+        provider=provider_cfg.llm_provider,
+        model=model_name,
+        host=get_model_host(provider_cfg, ollama_cfg),
         system_prompt=system_prompt,
         instructions=agent_instructions,
-        tools=tools,
+        user_input=user_input,
     )
 
-    start_time = time.monotonic()
-
     try:
-        if provider_cfg.llm_provider == "local":
-            model_name = ollama_cfg.llm_ollama_model
-        elif provider_cfg.llm_provider == "openai":
-            model_name = openai_cfg.llm_openai_model
-        elif provider_cfg.llm_provider == "gemini":
-            model_name = gemini_cfg.llm_gemini_model
-
-        async with live_timer(
-            live or Live(console=console),
-            f"🤖 Applying instruction with {model_name}",
-            style="bold yellow",
-            quiet=quiet,
-        ):
-            result = await agent.run(user_input)
+        result_text = await cache.get(cache_key) if cache is not None else None
+        if result_text is not None:
+            logger.info("Using cached LLM response.")
+            tracing.event("llm.cache_hit", model=model_name)
+        else:
+            agent = create_llm_agent(
+                provider_cfg=provider_cfg,
+                ollama_cfg=ollama_cfg,
+                openai_cfg=openai_cfg,
+                gemini_cfg=gemini_cfg,
+                system_prompt=system_prompt,
+                instructions=agent_instructions,
+                tools=tools,
+            )
+            async with live_timer(
+                live or Live(console=console),
+                f"🤖 Applying instruction with {model_name}",
+                style="bold yellow",
+                quiet=quiet,
+            ):
+                with tracing.span(
+                    "llm.response",
+                    provider=provider_cfg.llm_provider,
+                    model=model_name,
+                    input_chars=len(user_input),
+                ):
+                    result = await agent.run(user_input)
+            result_text = result.output
+            metrics.LLM_SECONDS.observe(
+                time.monotonic() - start_time,
+                provider=provider_cfg.llm_provider,
+            )
+            if cache is not None:
+                await cache.put(cache_key, result_text)
 
         elapsed = time.monotonic() - start_time
-        result_text = result.output
 
         if clipboard:
             pyperclip.copy(result_text)
@@ -162,6 +351,7 @@ async def get_llm_response(
 
     except Exception as e:
         logger.exception("An error occurred during LLM processing.")
+        metrics.ERRORS.inc(stage="llm")
         if provider_cfg.llm_provider == "openai":
             msg = "Please check your OpenAI API key."
         elif provider_cfg.llm_provider == "gemini":
@@ -188,6 +378,7 @@ async def process_and_update_clipboard(
     clipboard: bool,
     quiet: bool,
     live: Live,
+    cache: ResponseCache | None = None,
 ) -> str | None:
     """Processes the text with the LLM, updates the clipboard, and displays the result."""
     user_input = INPUT_TEMPLATE.format(original_text=original_text, instruction=instruction)
@@ -206,4 +397,5 @@ async def process_and_update_clipboard(
         live=live,
         show_output=True,
         exit_on_error=True,
+        cache=cache,
     )
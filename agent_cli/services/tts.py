@@ -5,19 +5,19 @@ from __future__ import annotations
 import asyncio
 import importlib.util
 import io
+import time
 import wave
 from functools import partial
 from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import aiohttp
-from openai import AsyncOpenAI
 from rich.live import Live
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 from wyoming.tts import Synthesize, SynthesizeVoice
 
 from agent_cli import config, constants
+from agent_cli.core import metrics, tracing
 from agent_cli.core.audio import open_pyaudio_stream, pyaudio_context, setup_output_stream
 from agent_cli.core.utils import (
     InteractiveStopEvent,
@@ -180,6 +180,8 @@ async def _process_audio_events(
 
         elif AudioChunk.is_type(event.type):
             chunk = AudioChunk.from_event(event)
+            if not audio_data.tell():
+                tracing.event("tts.first_byte")
             audio_data.write(chunk.audio)
             logger.debug("Received %d bytes of audio", len(chunk.audio))
 
@@ -236,6 +238,8 @@ async def _synthesize_speech_kokoro(
     **_kwargs: object,
 ) -> bytes | None:
     """Synthesize speech from text using Kokoro TTS server."""
+    from openai import AsyncOpenAI  # noqa: PLC0415
+
     try:
         client = AsyncOpenAI(
             api_key="not-needed",
@@ -261,6 +265,8 @@ async def _synthesize_speech_piper(
     **_kwargs: object,
 ) -> bytes | None:
     """Synthesize speech from text using Piper HTTP server."""
+    import aiohttp  # noqa: PLC0415
+
     try:
         payload: dict[str, str | int | float] = {"text": text}
 
@@ -386,7 +392,10 @@ async def _play_audio(
                     sample_width=sample_width,
                     channels=channels,
                 )
-                with open_pyaudio_stream(p, **stream_kwargs) as stream:
+                with (
+                    open_pyaudio_stream(p, **stream_kwargs) as stream,
+                    tracing.span("tts.playback", speed=speed),
+                ):
                     chunk_size = constants.PYAUDIO_CHUNK_SIZE
                     for i in range(0, len(frames), chunk_size):
                         if stop_event and stop_event.is_set():
@@ -432,21 +441,35 @@ async def _speak_text(
         piper_tts_cfg,
     )
     audio_data = None
+    start_time = time.monotonic()
     try:
         async with live_timer(live, "🔊 Synthesizing text", style="blue", quiet=quiet):
-            audio_data = await synthesizer(
-                text=text,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
-                piper_tts_cfg=piper_tts_cfg,
-                logger=logger,
-                quiet=quiet,
-                live=live,
-            )
+            with tracing.span(
+                "tts.synthesize",
+                provider=provider_cfg.tts_provider,
+                chars=len(text),
+            ) as span:
+                audio_data = await synthesizer(
+                    text=text,
+                    wyoming_tts_cfg=wyoming_tts_cfg,
+                    openai_tts_cfg=openai_tts_cfg,
+                    kokoro_tts_cfg=kokoro_tts_cfg,
+                    piper_tts_cfg=piper_tts_cfg,
+                    logger=logger,
+                    quiet=quiet,
+                    live=live,
+                )
+                if span is not None:
+                    span.set(audio_bytes=len(audio_data or b""))
     except Exception:
         logger.exception("Error during speech synthesis")
+        metrics.ERRORS.inc(stage="tts")
         return None
+    if audio_data:
+        metrics.TTS_SECONDS.observe(
+            time.monotonic() - start_time,
+            provider=provider_cfg.tts_provider,
+        )
 
     if audio_data and play_audio_flag:
         await _play_audio(
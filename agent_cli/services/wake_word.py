@@ -1,16 +1,23 @@
-"""Module for Wake Word Detection using Wyoming."""
+"""Module for Wake Word Detection using Wyoming or an in-process openWakeWord model."""
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import importlib.util
+from abc import ABC, abstractmethod
 from functools import partial
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
 
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 from wyoming.wake import Detect, Detection, NotDetected
 
 from agent_cli import config, constants
+from agent_cli.core import metrics
 from agent_cli.core.audio import read_from_queue
+from agent_cli.core.display import status_line
 from agent_cli.core.utils import manage_send_receive_tasks
 from agent_cli.services._wyoming_utils import wyoming_client_context
 
@@ -18,38 +25,262 @@ if TYPE_CHECKING:
     import logging
     from collections.abc import Awaitable, Callable
 
+    from openwakeword.model import Model
     from rich.live import Live
     from wyoming.client import AsyncClient
 
+has_openwakeword = importlib.util.find_spec("openwakeword") is not None
+
+# Score above which an openWakeWord prediction counts as a detection
+OPENWAKEWORD_THRESHOLD = 0.5
+# Wake word of each provider when none is given; `ok_nabu` is not an openWakeWord model
+DEFAULT_WAKE_WORDS = {"local": "ok_nabu", "openwakeword": "hey_jarvis"}
+# Model files that openWakeWord can load, instead of a pretrained model name
+_OPENWAKEWORD_MODEL_SUFFIXES = (".onnx", ".tflite")
+
+
+def _is_model_path(wake_word: str) -> bool:
+    return Path(wake_word).suffix in _OPENWAKEWORD_MODEL_SUFFIXES
+
+
+def openwakeword_model_error(wake_word: str) -> str | None:
+    """Return why openWakeWord cannot load the `wake_word` model, or None if it can."""
+    if _is_model_path(wake_word):
+        if Path(wake_word).expanduser().is_file():
+            return None
+        return f"Wake word model file not found: {wake_word}"
+    import openwakeword  # noqa: PLC0415
+
+    if wake_word in openwakeword.MODELS:
+        return None
+    return (
+        f"'{wake_word}' is not a pretrained openWakeWord model. Use one of"
+        f" {', '.join(sorted(openwakeword.MODELS))}, or the path to a model file."
+    )
+
+
+def create_wake_word_session(
+    wake_word_cfg: config.WakeWord,
+    logger: logging.Logger,
+    queue: asyncio.Queue[bytes | None],
+    *,
+    live: Live | None = None,
+    quiet: bool = False,
+) -> WakeWordSession:
+    """Return a long-lived wake word detection session for the configured provider."""
+    cls = (
+        _OpenWakeWordSession
+        if wake_word_cfg.wake_word_provider == "openwakeword"
+        else _WyomingWakeWordSession
+    )
+    return cls(wake_word_cfg, logger, queue, live=live, quiet=quiet)
+
 
 def create_wake_word_detector(
     wake_word_cfg: config.WakeWord,
 ) -> Callable[..., Awaitable[str | None]]:
-    """Return a wake word detector function."""
+    """Return a function that detects a single wake word, using a new session per call."""
     return partial(_detect_wake_word_from_queue, wake_word_cfg=wake_word_cfg)
 
 
+class WakeWordSession(ABC):
+    """Detect the wake word continuously in the audio from a queue.
+
+    The detector (a connection to the Wyoming server, or the openWakeWord model)
+    stays up for the lifetime of the session, so consecutive detections do not pay
+    for the setup again. Iterating over the session yields the name of each
+    detected wake word; the iteration ends when the audio queue ends or the
+    detector fails.
+
+    `failures` counts the consecutive runs that failed before any audio reached
+    the detector, so that a caller restarting the session can back off.
+    """
+
+    def __init__(
+        self,
+        wake_word_cfg: config.WakeWord,
+        logger: logging.Logger,
+        queue: asyncio.Queue[bytes | None],
+        *,
+        live: Live | None = None,
+        quiet: bool = False,
+    ) -> None:
+        """Initialize the session."""
+        self.wake_word_cfg = wake_word_cfg
+        self.logger = logger
+        self.queue = queue
+        self.live = live
+        self.quiet = quiet
+        self.progress_message = "Listening for wake word"
+        self.failures = 0
+        self._seconds_streamed = 0.0
+        self._detections: asyncio.Queue[str | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the detector has stopped, e.g., because the connection was lost."""
+        return self._task is not None and self._task.done()
+
+    def start(self) -> None:
+        """Start detecting in the background, or restart after the detector stopped."""
+        if self._task is not None and not self._task.done():
+            return
+        self._detections = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def __aenter__(self) -> Self:
+        """Start detecting in the background."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop detecting."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    def __aiter__(self) -> Self:
+        """Iterate over the detected wake words."""
+        return self
+
+    async def __anext__(self) -> str:
+        """Wait for the next detected wake word."""
+        name = await self._detections.get()
+        if name is None:
+            self._detections.put_nowait(None)  # Keep the session exhausted
+            raise StopAsyncIteration
+        return name
+
+    def drain(self) -> None:
+        """Discard the pending detections and audio, e.g., from while the assistant spoke."""
+        for queue in (self._detections, self.queue):
+            items = [queue.get_nowait() for _ in range(queue.qsize())]
+            if None in items:
+                queue.put_nowait(None)  # Keep the end-of-stream marker
+        self._seconds_streamed = 0.0
+
+    def _report_progress(self, chunk: bytes) -> None:
+        self.failures = 0  # The detector is up
+        self._seconds_streamed += len(chunk) / (
+            constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2
+        )
+        if self.live and not self.quiet:
+            status_line(self.live).progress(
+                self.progress_message,
+                self._seconds_streamed,
+                style="",
+            )
+
+    def _detected(self, name: str) -> None:
+        metrics.WAKE_WORD_DETECTIONS.inc(wake_word=name)
+        self._seconds_streamed = 0.0
+        self._detections.put_nowait(name)
+
+    async def _run(self) -> None:
+        try:
+            await self._detect()
+        except Exception as e:
+            metrics.ERRORS.inc(stage="wake_word")
+            # Warn once, not on every restart while, e.g., the server is down
+            if self.failures == 0:
+                self.logger.warning("Wake word detection stopped, retrying: %s", e)
+            else:
+                self.logger.debug("Wake word detection failed again", exc_info=True)
+            self.failures += 1
+        finally:
+            self._detections.put_nowait(None)
+
+    @abstractmethod
+    async def _detect(self) -> None:
+        """Feed the audio to the detector until it ends, reporting each detection."""
+
+
+class _WyomingWakeWordSession(WakeWordSession):
+    """Streams the audio to a Wyoming wake word server over a single connection."""
+
+    async def _detect(self) -> None:
+        async with wyoming_client_context(
+            self.wake_word_cfg.wake_server_ip,
+            self.wake_word_cfg.wake_server_port,
+            "wake word",
+            self.logger,
+            quiet=self.quiet or self.failures > 0,
+            log_errors=False,  # Logged once by `_run`
+        ) as client:
+            await client.write_event(Detect(names=[self.wake_word_cfg.wake_word]).event())
+            await manage_send_receive_tasks(
+                _send_audio_from_queue_for_wake_detection(
+                    client,
+                    self.queue,
+                    self.logger,
+                    on_chunk=self._report_progress,
+                ),
+                self._receive_detections(client),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+    async def _receive_detections(self, client: AsyncClient) -> None:
+        while (name := await _receive_wake_detection(client, self.logger)) is not None:
+            self._detected(name)
+
+
+class _OpenWakeWordSession(WakeWordSession):
+    """Runs openWakeWord in-process on the audio.
+
+    Unlike the Wyoming session, no audio leaves the process, which avoids the
+    per-chunk serialization and the network round trip.
+    """
+
+    async def _detect(self) -> None:
+        import numpy as np  # noqa: PLC0415
+
+        model = await asyncio.to_thread(_load_openwakeword_model, self.wake_word_cfg.wake_word)
+        model.reset()  # Forget the scores of a previous session
+        while (chunk := await self.queue.get()) is not None:
+            scores = await asyncio.to_thread(model.predict, np.frombuffer(chunk, dtype=np.int16))
+            self._report_progress(chunk)
+            name, score = max(scores.items(), key=lambda item: item[1])
+            if score >= OPENWAKEWORD_THRESHOLD:
+                self.logger.info("Wake word detected: %s (score %.2f)", name, score)
+                model.reset()  # Do not detect the same utterance twice
+                self._detected(name)
+
+
+@functools.cache
+def _load_openwakeword_model(wake_word: str) -> Model:
+    """Load an openWakeWord model by name or path, once per process."""
+    from openwakeword.model import Model  # noqa: PLC0415
+    from openwakeword.utils import download_models  # noqa: PLC0415
+
+    if _is_model_path(wake_word):
+        wake_word = str(Path(wake_word).expanduser())
+        # The framework follows the model file, e.g., a custom `.tflite` model
+        framework = Path(wake_word).suffix.removeprefix(".")
+    else:
+        download_models([wake_word])  # No-op if the pretrained model is already present
+        framework = "onnx"
+    return Model(wakeword_models=[wake_word], inference_framework=framework)
+
+
 async def _send_audio_from_queue_for_wake_detection(
     client: AsyncClient,
     queue: asyncio.Queue,
     logger: logging.Logger,
-    live: Live | None,
-    quiet: bool,
-    progress_message: str,
+    *,
+    on_chunk: Callable[[bytes], None] | None = None,
 ) -> None:
     """Read from a queue and send to Wyoming wake word server."""
     await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
-    seconds_streamed = 0.0
 
     async def send_chunk(chunk: bytes) -> None:
-        nonlocal seconds_streamed
         """Send audio chunk to wake word server."""
         await client.write_event(
             AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event(),
         )
-        seconds_streamed += len(chunk) / (constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2)
-        if live and not quiet:
-            live.update(f"{progress_message}... ({seconds_streamed:.1f}s)")
+        if on_chunk:
+            on_chunk(chunk)
 
     try:
         await read_from_queue(queue=queue, chunk_handler=send_chunk, logger=logger)
@@ -107,33 +338,12 @@ async def _detect_wake_word_from_queue(
     quiet: bool = False,
     progress_message: str = "Listening for wake word",
 ) -> str | None:
-    """Detect wake word from an audio queue."""
-    try:
-        async with wyoming_client_context(
-            wake_word_cfg.wake_server_ip,
-            wake_word_cfg.wake_server_port,
-            "wake word",
-            logger,
-            quiet=quiet,
-        ) as client:
-            await client.write_event(Detect(names=[wake_word_cfg.wake_word]).event())
-
-            _send_task, recv_task = await manage_send_receive_tasks(
-                _send_audio_from_queue_for_wake_detection(
-                    client,
-                    queue,
-                    logger,
-                    live,
-                    quiet,
-                    progress_message,
-                ),
-                _receive_wake_detection(client, logger, detection_callback=detection_callback),
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            if recv_task.done() and not recv_task.cancelled():
-                return recv_task.result()
-
-            return None
-    except (ConnectionRefusedError, asyncio.CancelledError, Exception):
-        return None
+    """Detect a single wake word from an audio queue."""
+    session = create_wake_word_session(wake_word_cfg, logger, queue, live=live, quiet=quiet)
+    session.progress_message = progress_message
+    async with session:
+        async for wake_word_name in session:
+            if detection_callback:
+                detection_callback(wake_word_name)
+            return wake_word_name
+    return None
@@ -0,0 +1 @@
+"""End-to-end benchmarks of the agents against local mock servers."""
@@ -0,0 +1,7 @@
+"""Run the end-to-end benchmarks: `python -m benchmarks --help`."""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
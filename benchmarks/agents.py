@@ -0,0 +1,172 @@
+"""One turn of each agent against the mock servers, timed from the end of the user's input.
+
+A turn runs the agent's own entry point with the synthetic microphone and
+speakers, and a stop event that is set after `speech_seconds` of (simulated)
+speech, as the hotkey would. Its latency is the time from then until the agent
+is done; for `speak`, which has no recording, it is the time until the first
+audio is played.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from agent_cli import config
+from agent_cli.core.utils import InteractiveStopEvent
+
+from . import synthetic_audio
+from .mock_servers import TRANSCRIPT
+from .synthetic_audio import SyntheticPyAudio
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .mock_servers import Endpoints
+
+AGENTS = ("transcribe", "voice-edit", "chat", "speak")
+TEXT_TO_SPEAK = "The quick brown fox jumps over the lazy dog, twice, for good measure."
+
+
+def _configs(endpoints: Endpoints) -> dict[str, Any]:
+    """Return the configuration of all services, pointing at the mock servers."""
+    return {
+        "provider_cfg": config.ProviderSelection(
+            llm_provider="local",
+            asr_provider="local",
+            tts_provider="local",
+        ),
+        "general_cfg": config.General(log_level="WARNING", quiet=True, clipboard=False),
+        "audio_in_cfg": config.AudioInput(),
+        "wyoming_asr_cfg": config.WyomingASR(
+            asr_wyoming_ip=endpoints.host,
+            asr_wyoming_port=endpoints.asr_port,
+        ),
+        "openai_asr_cfg": config.OpenAIASR(asr_openai_model="whisper-1"),
+        "ollama_cfg": config.Ollama(
+            llm_ollama_model="benchmark",
+            llm_ollama_host=endpoints.llm_url,
+        ),
+        "openai_llm_cfg": config.OpenAILLM(llm_openai_model="gpt-4o-mini"),
+        "gemini_llm_cfg": config.GeminiLLM(llm_gemini_model="gemini-2.5-flash"),
+        "audio_out_cfg": config.AudioOutput(enable_tts=True),
+        "wyoming_tts_cfg": config.WyomingTTS(
+            tts_wyoming_ip=endpoints.host,
+            tts_wyoming_port=endpoints.tts_port,
+        ),
+        "openai_tts_cfg": config.OpenAITTS(tts_openai_model="tts-1", tts_openai_voice="alloy"),
+        "kokoro_tts_cfg": config.KokoroTTS(
+            tts_kokoro_model="kokoro",
+            tts_kokoro_voice="af_sky",
+            tts_kokoro_host="http://localhost:8880/v1",
+        ),
+        "piper_tts_cfg": config.PiperTTS(tts_piper_host="http://localhost:5000"),
+    }
+
+
+async def _timed_after_speech(
+    run: Callable[[InteractiveStopEvent], Awaitable[object]],
+    speech_seconds: float,
+) -> float:
+    """Run a recording agent, stop it after the speech, and return the time it took from then."""
+    stop_event = InteractiveStopEvent()
+    stopped_at = 0.0
+
+    def stop() -> None:
+        nonlocal stopped_at
+        stopped_at = time.monotonic()
+        stop_event.set()
+
+    asyncio.get_running_loop().call_later(speech_seconds / SyntheticPyAudio.speed, stop)
+    await run(stop_event)
+    return time.monotonic() - stopped_at
+
+
+async def transcribe_turn(endpoints: Endpoints, speech_seconds: float) -> float:
+    """Transcribe the speech and clean it up with the LLM."""
+    from agent_cli.agents import transcribe  # noqa: PLC0415
+
+    cfgs = _configs(endpoints)
+    return await _timed_after_speech(
+        lambda stop_event: transcribe._async_main(
+            extra_instructions=None,
+            provider_cfg=cfgs["provider_cfg"],
+            general_cfg=cfgs["general_cfg"],
+            audio_in_cfg=cfgs["audio_in_cfg"],
+            wyoming_asr_cfg=cfgs["wyoming_asr_cfg"],
+            openai_asr_cfg=cfgs["openai_asr_cfg"],
+            ollama_cfg=cfgs["ollama_cfg"],
+            openai_llm_cfg=cfgs["openai_llm_cfg"],
+            gemini_llm_cfg=cfgs["gemini_llm_cfg"],
+            llm_enabled=True,
+            transcription_log=None,
+            p=SyntheticPyAudio(),
+            stop_event=stop_event,
+        ),
+        speech_seconds,
+    )
+
+
+async def voice_edit_turn(endpoints: Endpoints, speech_seconds: float) -> float:
+    """Apply a spoken instruction to the clipboard and speak the result."""
+    from agent_cli.agents import voice_edit  # noqa: PLC0415
+
+    return await _timed_after_speech(
+        lambda stop_event: voice_edit._async_main(
+            **_configs(endpoints),
+            p=SyntheticPyAudio(),
+            stop_event=stop_event,
+        ),
+        speech_seconds,
+    )
+
+
+async def chat_turn(endpoints: Endpoints, speech_seconds: float) -> float:
+    """Answer a spoken message with the conversation so far, and speak the answer."""
+    from agent_cli.agents import chat  # noqa: PLC0415
+
+    cfgs = _configs(endpoints)
+    history = [{"role": "user", "content": TRANSCRIPT, "timestamp": ""}] * 4
+    return await _timed_after_speech(
+        lambda stop_event: chat._handle_conversation_turn(
+            **cfgs,
+            p=SyntheticPyAudio(),
+            stop_event=stop_event,
+            conversation_history=list(history),
+            history_cfg=config.History(),
+            chat_tools=[],
+            live=None,
+        ),
+        speech_seconds,
+    )
+
+
+async def speak_turn(endpoints: Endpoints, speech_seconds: float) -> float:  # noqa: ARG001
+    """Synthesize a sentence and return the time until it starts playing."""
+    from agent_cli.agents import speak  # noqa: PLC0415
+
+    cfgs = _configs(endpoints)
+    starts: list[float] = []
+    synthetic_audio.playback_starts.set(starts)
+    start_time = time.monotonic()
+    await speak._async_main(
+        general_cfg=cfgs["general_cfg"],
+        text=TEXT_TO_SPEAK,
+        provider_cfg=cfgs["provider_cfg"],
+        audio_out_cfg=cfgs["audio_out_cfg"],
+        wyoming_tts_cfg=cfgs["wyoming_tts_cfg"],
+        openai_tts_cfg=cfgs["openai_tts_cfg"],
+        kokoro_tts_cfg=cfgs["kokoro_tts_cfg"],
+        piper_tts_cfg=cfgs["piper_tts_cfg"],
+        p=SyntheticPyAudio(),
+    )
+    return starts[0] - start_time
+
+
+TURNS: dict[str, Callable[[Endpoints, float], Awaitable[float]]] = {
+    "transcribe": transcribe_turn,
+    "voice-edit": voice_edit_turn,
+    "chat": chat_turn,
+    "speak": speak_turn,
+}
@@ -0,0 +1,366 @@
+"""Microbenchmarks of the per-chunk loops of the audio hot paths.
+
+Each path is fed `--chunks` chunks of synthetic PCM, paced at each of `--speeds`
+times real time, in three passes:
+
+1. The CPU time per chunk, and the wall-clock overhead per chunk beyond the
+   pacing of the audio itself.
+2. The lag of the event loop: a probe task that wakes up every millisecond
+   records how late it is, which shows the loops that block the event loop.
+3. The peak and retained memory allocated under `tracemalloc`, at the fastest
+   speed only, since the pacing doesn't change what is allocated.
+
+The paths render to a Rich `Live` display, as they do in the agents, but on a
+console that writes to `os.devnull`. Run with `python -m benchmarks.hot_paths`;
+like the end-to-end benchmarks, it compares with a baseline that is saved with
+`--save-baseline`, and exits with 1 on regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyaudio
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.client import AsyncTcpClient
+from wyoming.event import Event, write_event
+
+from agent_cli import config, constants
+from agent_cli.core import audio
+from agent_cli.core.utils import InteractiveStopEvent
+from agent_cli.services import asr, tts
+
+from .runner import regressions, report_regressions
+from .synthetic_audio import SyntheticPyAudio, SyntheticStream
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Generator
+
+LOGGER = logging.getLogger(__name__)
+CHUNK_SECONDS = constants.PYAUDIO_CHUNK_SIZE / constants.PYAUDIO_RATE
+CHUNK_BYTES = constants.PYAUDIO_CHUNK_SIZE * constants.PYAUDIO_CHANNELS * 2
+_PROBE_INTERVAL = 0.001
+# Metrics compared with the baseline, and the differences below which they are noise
+SLACK = {
+    "cpu_us": 50.0,
+    "overhead_us": 500.0,
+    "lag_p99_ms": 1.0,
+    "lag_max_ms": 5.0,
+    "peak_kib": 16.0,
+    "retained_kib": 4.0,
+}
+
+console = Console()
+
+
+class _Measurement:
+    """Measure the block of code in its `with` statement, in one of the passes."""
+
+    def __init__(self, *, probe_lag: bool = False, trace_allocations: bool = False) -> None:
+        self.probe_lag = probe_lag
+        self.trace_allocations = trace_allocations
+        self.lags: list[float] = []
+        self.cpu_seconds = self.wall_seconds = 0.0
+        self.peak_bytes = self.retained_bytes = 0
+        self._probe: asyncio.Task | None = None
+
+    async def _probe_lags(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + _PROBE_INTERVAL
+            await asyncio.sleep(_PROBE_INTERVAL)
+            self.lags.append(max(0.0, loop.time() - expected))
+
+    def __enter__(self) -> None:
+        if self.probe_lag:
+            self._probe = asyncio.create_task(self._probe_lags())
+        if self.trace_allocations:
+            tracemalloc.start()
+            self._start_bytes = tracemalloc.get_traced_memory()[0]
+        self._cpu_start, self._wall_start = time.process_time(), time.perf_counter()
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        if self.trace_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.peak_bytes = peak - self._start_bytes
+            self.retained_bytes = current - self._start_bytes
+        if self._probe is not None:
+            self._probe.cancel()
+
+
+class _PacedStream(SyntheticStream):
+    """A synthetic microphone that sets `stop_event` when its last chunk is read."""
+
+    def __init__(self, n_chunks: int, speed: float, stop_event: InteractiveStopEvent) -> None:
+        super().__init__(rate=constants.PYAUDIO_RATE, channels=1, width=2, speed=speed)
+        self.n_frames = n_chunks * constants.PYAUDIO_CHUNK_SIZE
+        self.stop_event = stop_event
+        self.loop = asyncio.get_running_loop()
+
+    def read(self, num_frames: int, *, exception_on_overflow: bool = True) -> bytes:
+        """Return the next chunk, and stop the reader after the last one."""
+        chunk = super().read(num_frames, exception_on_overflow=exception_on_overflow)
+        if self.frames_read >= self.n_frames:
+            # Runs in a worker thread; scheduled before the reader resumes with the chunk
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+        return chunk
+
+
+@contextmanager
+def _live() -> Generator[Live, None, None]:
+    """Run a Live display like the agents do, but on a console that discards its output."""
+    with (
+        Path(os.devnull).open("w") as devnull,
+        Live(console=Console(file=devnull, force_terminal=True), transient=True) as live,
+    ):
+        yield live
+
+
+def _encode(event: Event) -> bytes:
+    buffer = io.BytesIO()
+    write_event(event, buffer)
+    return buffer.getvalue()
+
+
+async def _read_audio_stream(n_chunks: int, speed: float, measured: _Measurement) -> None:
+    stop_event = InteractiveStopEvent()
+    stream = _PacedStream(n_chunks, speed, stop_event)
+    with _live() as live, measured:
+        await audio.read_audio_stream(stream, stop_event, lambda _chunk: None, LOGGER, live=live)
+
+
+async def _audio_tee(n_chunks: int, speed: float, measured: _Measurement) -> None:
+    """Tee the stream into two consumers, as the assistant does, with a second of history."""
+
+    async def drain(queue: asyncio.Queue[bytes | None]) -> None:
+        while await queue.get() is not None:
+            pass
+
+    stop_event = InteractiveStopEvent()
+    stream = _PacedStream(n_chunks, speed, stop_event)
+    with measured:
+        async with audio.tee_audio_stream(stream, stop_event, LOGGER, history_seconds=1) as tee:
+            queues = [await tee.add_queue(), await tee.add_queue()]
+            await asyncio.gather(*(drain(queue) for queue in queues))
+
+
+async def _read_from_queue(n_chunks: int, speed: float, measured: _Measurement) -> None:
+    async def handle(_chunk: bytes) -> None:
+        pass
+
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    chunk = bytes(CHUNK_BYTES)
+    with measured:
+        reader = asyncio.create_task(audio.read_from_queue(queue, handle, LOGGER))
+        for _ in range(n_chunks):
+            await asyncio.sleep(CHUNK_SECONDS / speed)
+            queue.put_nowait(chunk)
+        queue.put_nowait(None)
+        await reader
+
+
+async def _send_audio(n_chunks: int, speed: float, measured: _Measurement) -> None:
+    """Stream the microphone to a server that discards it, as fast as it can read."""
+
+    async def discard(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while await reader.read(2**16):
+            pass
+        writer.close()
+
+    stop_event = InteractiveStopEvent()
+    stream = _PacedStream(n_chunks, speed, stop_event)
+    async with await asyncio.start_server(discard, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        async with AsyncTcpClient("127.0.0.1", port) as client:
+            with _live() as live, measured:
+                await asr._send_audio(client, stream, stop_event, LOGGER, live=live)
+
+
+async def _process_audio_events(n_chunks: int, speed: float, measured: _Measurement) -> None:
+    """Receive synthesized speech from a server that sends pre-encoded chunks in real time."""
+    audio_start = _encode(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
+    chunk = _encode(AudioChunk(audio=bytes(CHUNK_BYTES), **constants.WYOMING_AUDIO_CONFIG).event())
+
+    async def synthesize(_reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(audio_start)
+        for _ in range(n_chunks):
+            await asyncio.sleep(CHUNK_SECONDS / speed)
+            writer.write(chunk)
+            await writer.drain()
+        writer.write(_encode(AudioStop().event()))
+        await writer.drain()
+        writer.close()
+
+    async with await asyncio.start_server(synthesize, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        async with AsyncTcpClient("127.0.0.1", port) as client:
+            with measured:
+                await tts._process_audio_events(client, LOGGER)
+
+
+async def _play_audio(n_chunks: int, speed: float, measured: _Measurement) -> None:
+    wav = tts._create_wav_data(bytes(n_chunks * CHUNK_BYTES), constants.PYAUDIO_RATE, 2, 1)
+    original, pyaudio.PyAudio = pyaudio.PyAudio, SyntheticPyAudio
+    SyntheticPyAudio.speed = speed
+    try:
+        with _live() as live, measured:
+            await tts._play_audio(wav, LOGGER, audio_output_cfg=config.AudioOutput(), live=live)
+    finally:
+        pyaudio.PyAudio = original
+
+
+PATHS: dict[str, Callable[[int, float, _Measurement], Awaitable[None]]] = {
+    "read_audio_stream": _read_audio_stream,
+    "audio_tee": _audio_tee,
+    "read_from_queue": _read_from_queue,
+    "send_audio": _send_audio,
+    "process_audio_events": _process_audio_events,
+    "play_audio": _play_audio,
+}
+
+
+async def measure(path: str, n_chunks: int, speed: float, *, allocations: bool) -> dict[str, Any]:
+    """Run the passes over one path at one speed and return its metrics per chunk."""
+    run = PATHS[path]
+    timed = _Measurement()
+    await run(n_chunks, speed, timed)
+    probed = _Measurement(probe_lag=True)
+    await run(n_chunks, speed, probed)
+    lags = probed.lags or [0.0]
+    result = {
+        "cpu_us": timed.cpu_seconds / n_chunks * 1e6,
+        "overhead_us": max(0.0, timed.wall_seconds - n_chunks * CHUNK_SECONDS / speed)
+        / n_chunks
+        * 1e6,
+        "lag_p99_ms": (
+            statistics.quantiles(lags, n=100, method="inclusive")[98] if len(lags) > 1 else lags[0]
+        )
+        * 1e3,
+        "lag_max_ms": max(lags) * 1e3,
+    }
+    if allocations:
+        traced = _Measurement(trace_allocations=True)
+        await run(n_chunks, speed, traced)
+        result["peak_kib"] = traced.peak_bytes / 1024
+        result["retained_kib"] = traced.retained_bytes / 1024
+    return result
+
+
+async def _benchmark(paths: list[str], speeds: list[float], n_chunks: int) -> dict[str, Any]:
+    results = {}
+    for path in paths:
+        console.print(f"⏱️ Benchmarking [bold]{path}[/bold]...")
+        for speed in speeds:
+            results[f"{path} {speed:g}x"] = await measure(
+                path,
+                n_chunks,
+                speed,
+                allocations=speed == max(speeds),
+            )
+    return results
+
+
+def _print_results(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]) -> None:
+    table = Table(
+        title="Per-chunk CPU time and overhead (µs), event loop lag (ms), and memory (KiB)",
+    )
+    table.add_column("Path", style="bold", no_wrap=True)
+    for metric in SLACK:
+        table.add_column(metric, justify="right")
+    for name, result in results.items():
+        cells = []
+        for metric in SLACK:
+            if (value := result.get(metric)) is None:
+                cells.append("-")
+                continue
+            cell = f"{value:.1f}"
+            if (old := baseline.get(name, {}).get(metric)) is not None and old > 0:
+                cell += f" ({value / old - 1:+.0%})"
+            cells.append(cell)
+        table.add_row(name, *cells)
+    console.print(table)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.hot_paths",
+        description="Benchmark the per-chunk loops of the audio hot paths.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help=f"Paths to benchmark, of {', '.join(PATHS)} (default: all).",
+    )
+    parser.add_argument("--chunks", type=int, default=30, help="Audio chunks per run.")
+    parser.add_argument(
+        "--speeds",
+        type=float,
+        nargs="+",
+        default=[1.0, 100.0],
+        help="Multiples of real time at which the audio is fed.",
+    )
+    parser.add_argument(
+        "--max-lag-ms",
+        type=float,
+        help="Fail if the event loop lags more than this at any speed, whatever the baseline.",
+    )
+    parser.add_argument("--save-baseline", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Compare with the results in this JSON file, and fail on regressions.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative increase over the baseline that counts as a regression.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the microbenchmarks and return the exit code, 1 if there are regressions."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if unknown := set(args.paths) - set(PATHS):
+        parser.error(f"unknown path(s): {', '.join(sorted(unknown))}")
+    results = asyncio.run(_benchmark(args.paths or list(PATHS), args.speeds, args.chunks))
+
+    baseline = json.loads(args.baseline.read_text())["results"] if args.baseline else {}
+    _print_results(results, baseline)
+    if args.save_baseline:
+        args.save_baseline.write_text(
+            json.dumps({"chunks": args.chunks, "results": results}, indent=2) + "\n",
+        )
+        console.print(f"💾 Saved the baseline to {args.save_baseline}")
+    found = regressions(results, baseline, args.tolerance, SLACK)
+    if args.max_lag_ms is not None:
+        found += [
+            f"{name} lag_max_ms: {result['lag_max_ms']:.1f} > {args.max_lag_ms:g}"
+            for name, result in results.items()
+            if result["lag_max_ms"] > args.max_lag_ms
+        ]
+    return report_regressions(found)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
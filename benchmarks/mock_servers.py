@@ -0,0 +1,212 @@
+"""Local mock Wyoming ASR, TTS, and wake word servers and an OpenAI-compatible LLM server.
+
+Unlike the mocks in `tests/mocks`, which replace the clients, these are real
+servers on localhost, so the benchmarks exercise the same sockets, event
+serialization, and HTTP client as a deployment, with latencies that are set in
+`Latency` instead of depending on the models.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
+
+from aiohttp import web
+from wyoming.asr import Transcript, TranscriptChunk, TranscriptStart, TranscriptStop
+from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.event import async_read_event, async_write_event
+from wyoming.tts import Synthesize
+from wyoming.wake import Detect, Detection, NotDetected
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+TRANSCRIPT = "turn on the lights in the kitchen and set a timer for ten minutes"
+LLM_RESPONSE = "Sure, I turned on the kitchen lights and started a ten minute timer."
+WAKE_WORD = "ok_nabu"
+_TTS_RATE = 22050
+
+
+@dataclass
+class Latency:
+    """Simulated server behaviour; durations are in seconds."""
+
+    asr: float = 0.2  # From the end of the audio to the final transcript
+    asr_partial_every: int = 10  # Audio chunks between partial transcripts; 0 disables them
+    tts_first_byte: float = 0.1
+    tts_chunk: float = 0.01  # Between audio chunks, as a streaming TTS would send them
+    tts_chunks: int = 20  # Of 0.1s of audio each
+    llm_first_token: float = 0.3
+    llm_token: float = 0.02
+    wake_after: float = 0.3  # Audio streamed before the wake word is detected
+
+
+class Endpoints(NamedTuple):
+    """Where the mock servers listen."""
+
+    host: str
+    asr_port: int
+    tts_port: int
+    wake_port: int
+    llm_url: str  # Without the `/v1` suffix, like the Ollama host
+
+
+async def _asr(
+    latency: Latency,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    n_chunks = 0
+    while (event := await async_read_event(reader)) is not None:
+        if AudioChunk.is_type(event.type):
+            n_chunks += 1
+            if latency.asr_partial_every and n_chunks % latency.asr_partial_every == 0:
+                if n_chunks == latency.asr_partial_every:
+                    await async_write_event(TranscriptStart().event(), writer)
+                n_words = n_chunks // latency.asr_partial_every
+                partial = " ".join(TRANSCRIPT.split()[:n_words])
+                await async_write_event(TranscriptChunk(text=partial).event(), writer)
+        elif AudioStop.is_type(event.type):
+            await asyncio.sleep(latency.asr)
+            await async_write_event(Transcript(text=TRANSCRIPT).event(), writer)
+            if latency.asr_partial_every:
+                await async_write_event(TranscriptStop().event(), writer)
+            break
+
+
+async def _tts(
+    latency: Latency,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    while (event := await async_read_event(reader)) is not None:
+        if not Synthesize.is_type(event.type):
+            continue
+        await asyncio.sleep(latency.tts_first_byte)
+        audio_format = {"rate": _TTS_RATE, "width": 2, "channels": 1}
+        await async_write_event(AudioStart(**audio_format).event(), writer)
+        silence = bytes(_TTS_RATE // 10 * 2)
+        for i in range(latency.tts_chunks):
+            if i:
+                await asyncio.sleep(latency.tts_chunk)
+            await async_write_event(AudioChunk(audio=silence, **audio_format).event(), writer)
+        await async_write_event(AudioStop().event(), writer)
+        break
+
+
+async def _wake(
+    latency: Latency,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    seconds = 0.0
+    detected = False
+    while (event := await async_read_event(reader)) is not None:
+        if Detect.is_type(event.type):
+            seconds, detected = 0.0, False
+        elif AudioChunk.is_type(event.type):
+            chunk = AudioChunk.from_event(event)
+            seconds += len(chunk.audio) / (chunk.rate * chunk.width * chunk.channels)
+            if not detected and seconds >= latency.wake_after:
+                detected = True
+                await async_write_event(Detection(name=WAKE_WORD).event(), writer)
+        elif AudioStop.is_type(event.type):
+            if not detected:
+                await async_write_event(NotDetected().event(), writer)
+            break
+
+
+def _wyoming_handler(
+    handle: Callable[[Latency, asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]],
+    latency: Latency,
+) -> Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]:
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await handle(latency, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # The client hung up, e.g., after a wake word detection
+        finally:
+            writer.close()
+
+    return handler
+
+
+def _chat_completion(latency: Latency) -> Callable[[web.Request], Awaitable[web.StreamResponse]]:
+    """Return a handler for `/v1/chat/completions`, streaming if the request asks for it."""
+    tokens = LLM_RESPONSE.split(" ")
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        created = int(time.time())
+        base = {"id": "chatcmpl-benchmark", "created": created, "model": body.get("model", "")}
+        await asyncio.sleep(latency.llm_first_token)
+        if not body.get("stream"):
+            await asyncio.sleep(latency.llm_token * (len(tokens) - 1))
+            return web.json_response(
+                {
+                    **base,
+                    "object": "chat.completion",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": LLM_RESPONSE},
+                            "finish_reason": "stop",
+                        },
+                    ],
+                    "usage": {
+                        "prompt_tokens": 0,
+                        "completion_tokens": len(tokens),
+                        "total_tokens": 0,
+                    },
+                },
+            )
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for i, token in enumerate(tokens):
+            if i:
+                await asyncio.sleep(latency.llm_token)
+            chunk = {
+                **base,
+                "object": "chat.completion.chunk",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"role": "assistant", "content": f" {token}" if i else token},
+                        "finish_reason": None,
+                    },
+                ],
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        return response
+
+    return handler
+
+
+@asynccontextmanager
+async def mock_servers(
+    latency: Latency,
+    host: str = "127.0.0.1",
+) -> AsyncGenerator[Endpoints, None]:
+    """Run all mock servers on free ports for the duration of the context."""
+    async with AsyncExitStack() as stack:
+        ports = []
+        for handle in (_asr, _tts, _wake):
+            server = await asyncio.start_server(_wyoming_handler(handle, latency), host, 0)
+            await stack.enter_async_context(server)
+            ports.append(server.sockets[0].getsockname()[1])
+
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", _chat_completion(latency))
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        stack.push_async_callback(runner.cleanup)
+        site = web.TCPSite(runner, host, 0)
+        await site.start()
+        llm_port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+        yield Endpoints(host, *ports, llm_url=f"http://{host}:{llm_port}")
@@ -0,0 +1,246 @@
+"""Run the end-to-end benchmarks and compare them with a baseline.
+
+The mock servers run in this process, and every agent is benchmarked in a fresh
+child process, so that its CPU time and peak RSS are its own. Each child runs
+`--warmup` turns that are not measured (the first turn pays for the imports and
+connections), then `--turns` turns with up to `--concurrency` at a time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from .agents import AGENTS, TURNS
+from .mock_servers import Endpoints, Latency, mock_servers
+from .synthetic_audio import SyntheticPyAudio
+
+# Metrics compared with the baseline, where higher is worse, and the differences
+# below which they are noise, whatever the relative change
+ABSOLUTE_SLACK = {"p50": 0.005, "p95": 0.01, "p99": 0.01, "cpu_per_turn": 0.005, "max_rss_mb": 5.0}
+
+console = Console()
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _max_rss_mb() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10  # Bytes or KiB
+
+
+def _percentiles(latencies: list[float]) -> dict[str, float]:
+    if len(latencies) < 2:  # noqa: PLR2004
+        return dict.fromkeys(("p50", "p95", "p99"), latencies[0])
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+async def _run_turns(
+    agent: str,
+    endpoints: Endpoints,
+    *,
+    turns: int,
+    warmup: int,
+    concurrency: int,
+    speech_seconds: float,
+) -> dict[str, Any]:
+    turn = TURNS[agent]
+    for _ in range(warmup):
+        await turn(endpoints, speech_seconds)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited() -> float:
+        async with semaphore:
+            return await turn(endpoints, speech_seconds)
+
+    cpu_start, start_time = _cpu_seconds(), time.monotonic()
+    latencies = await asyncio.gather(*(limited() for _ in range(turns)))
+    cpu_seconds, elapsed = _cpu_seconds() - cpu_start, time.monotonic() - start_time
+    return {
+        "turns": turns,
+        **_percentiles(latencies),
+        "mean": statistics.fmean(latencies),
+        "cpu_per_turn": cpu_seconds / turns,
+        "cpu_utilization": cpu_seconds / elapsed,
+        "max_rss_mb": _max_rss_mb(),
+    }
+
+
+def _run_agent(agent: str, endpoints: Endpoints, options: dict[str, Any]) -> dict[str, Any]:
+    """Benchmark one agent; runs in a child process."""
+    import pyaudio  # noqa: PLC0415
+    import pyperclip  # noqa: PLC0415
+
+    # The synthetic sound card, and an in-memory clipboard for headless machines
+    SyntheticPyAudio.speed = options.pop("audio_speed")
+    pyaudio.PyAudio = SyntheticPyAudio
+    clipboard = ["Dear team, the meeting moves to Thursday at 3pm, please confirm."]
+    pyperclip.copy = lambda text: clipboard.__setitem__(0, text)
+    pyperclip.paste = lambda: clipboard[0]
+
+    logging.disable(logging.WARNING)
+    with contextlib.redirect_stdout(io.StringIO()):  # The agents print their results
+        return asyncio.run(_run_turns(agent, endpoints, **options))
+
+
+async def _benchmark(args: argparse.Namespace, latency: Latency) -> dict[str, dict[str, Any]]:
+    options = {
+        "turns": args.turns,
+        "warmup": args.warmup,
+        "concurrency": args.concurrency,
+        "speech_seconds": args.speech_seconds,
+        "audio_speed": args.audio_speed,
+    }
+    results = {}
+    loop = asyncio.get_running_loop()
+    async with mock_servers(latency) as endpoints:
+        for agent in args.agents:
+            console.print(f"⏱️ Benchmarking [bold]{agent}[/bold]...")
+            # A fresh process per agent, so that CPU time and RSS are not shared
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                results[agent] = await loop.run_in_executor(
+                    pool,
+                    _run_agent,
+                    agent,
+                    endpoints,
+                    dict(options),
+                )
+    return results
+
+
+def regressions(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+    slack: dict[str, float] = ABSOLUTE_SLACK,
+) -> list[str]:
+    """Describe the metrics that are more than `tolerance` (relative) worse than the baseline.
+
+    Only the metrics in `slack` are compared, and only if their increase is
+    larger than their slack.
+    """
+    found = []
+    for name, result in results.items():
+        for metric, min_increase in slack.items():
+            old = baseline.get(name, {}).get(metric)
+            new = result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) and new - old > min_increase:
+                change = f" (+{new / old - 1:.0%})" if old > 0 else ""
+                found.append(f"{name} {metric}: {old:.3f} -> {new:.3f}{change}")
+    return found
+
+
+def _print_results(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]) -> None:
+    table = Table(title="Turn latency (s), CPU time per turn (s), and peak RSS (MB)")
+    table.add_column("Agent", style="bold")
+    for metric in ("turns", "p50", "p95", "p99", "mean", "cpu_per_turn", "max_rss_mb"):
+        table.add_column(metric, justify="right")
+    for agent, result in results.items():
+        cells = []
+        for metric in ("p50", "p95", "p99", "mean", "cpu_per_turn", "max_rss_mb"):
+            cell = f"{result[metric]:.3f}"
+            if (old := baseline.get(agent, {}).get(metric)) is not None and old > 0:
+                cell += f" ({result[metric] / old - 1:+.0%})"
+            cells.append(cell)
+        table.add_row(agent, str(result["turns"]), *cells)
+    console.print(table)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark agent turns against local mock Wyoming and LLM servers.",
+    )
+    parser.add_argument(
+        "agents",
+        nargs="*",
+        help=f"Agents to benchmark, of {', '.join(AGENTS)} (default: all).",
+    )
+    parser.add_argument("-n", "--turns", type=int, default=20, help="Measured turns per agent.")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured turns per agent.")
+    parser.add_argument("-j", "--concurrency", type=int, default=1, help="Turns run at once.")
+    parser.add_argument(
+        "--speech-seconds",
+        type=float,
+        default=2.0,
+        help="Duration of the spoken input of a turn.",
+    )
+    parser.add_argument(
+        "--audio-speed",
+        type=float,
+        default=10.0,
+        help="Multiple of real time at which the synthetic audio is recorded and played.",
+    )
+    for field in fields(Latency):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+            help=f"Mock server: {field.name} (default: {field.default}).",
+        )
+    parser.add_argument("--save-baseline", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Compare with the results in this JSON file, and fail on regressions.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative increase over the baseline that counts as a regression.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and return the exit code, 1 if there are regressions."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if unknown := set(args.agents) - set(AGENTS):
+        parser.error(f"unknown agent(s): {', '.join(sorted(unknown))}")
+    args.agents = args.agents or list(AGENTS)
+    latency = Latency(**{field.name: getattr(args, field.name) for field in fields(Latency)})
+    results = asyncio.run(_benchmark(args, latency))
+
+    baseline = json.loads(args.baseline.read_text())["results"] if args.baseline else {}
+    _print_results(results, baseline)
+    if args.save_baseline:
+        args.save_baseline.write_text(
+            json.dumps({"latency": asdict(latency), "results": results}, indent=2) + "\n",
+        )
+        console.print(f"💾 Saved the baseline to {args.save_baseline}")
+    return report_regressions(regressions(results, baseline, args.tolerance))
+
+
+def report_regressions(found: list[str]) -> int:
+    """Print the regressions, if any, and return the exit code: 1 if there are any."""
+    if not found:
+        return 0
+    console.print("[bold red]❌ Regressions beyond the tolerance:[/bold red]")
+    for regression in found:
+        console.print(f"  {regression}")
+    return 1
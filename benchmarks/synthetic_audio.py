@@ -0,0 +1,104 @@
+"""A stand-in for PyAudio that records synthetic speech and plays audio into the void.
+
+Streams block for as long as the audio they read or write would take at `speed`
+times real time, like a sound card does, so the agents run with their usual
+pacing without a microphone or speakers.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import time
+from array import array
+from contextvars import ContextVar
+from typing import Any
+
+from agent_cli import constants
+
+# Set by a turn to collect the times at which its output streams started playing
+playback_starts: ContextVar[list[float] | None] = ContextVar("playback_starts", default=None)
+
+
+@functools.cache
+def _one_second_of_speech() -> bytes:
+    """Return a 16-bit 220 Hz tone with a 4 Hz syllable envelope, loud enough for the VADs.
+
+    Both frequencies have a whole number of periods in a second, so it repeats
+    seamlessly, and reading it costs a slice instead of a synthesis per chunk.
+    """
+    rate = constants.PYAUDIO_RATE
+    samples = array(
+        "h",
+        (
+            int(
+                6000
+                * (0.6 + 0.4 * math.sin(2 * math.pi * 4 * i / rate))
+                * math.sin(2 * math.pi * 220 * i / rate),
+            )
+            for i in range(rate)
+        ),
+    )
+    return samples.tobytes()
+
+
+def _speech_like_chunk(n_frames: int, start: int) -> bytes:
+    """Return `n_frames` (at most a second) of the speech, from frame `start` on."""
+    speech = _one_second_of_speech()
+    offset = start % constants.PYAUDIO_RATE * 2
+    chunk = speech[offset : offset + 2 * n_frames]
+    return chunk + speech[: 2 * n_frames - len(chunk)]
+
+
+class SyntheticStream:
+    """An input stream of synthetic speech, or an output stream that discards its audio."""
+
+    def __init__(self, *, rate: int, channels: int, width: int, speed: float) -> None:
+        """Initialize the stream; `speed` is the multiple of real time it runs at."""
+        self.bytes_per_second = rate * channels * width
+        self.speed = speed
+        self.frames_read = 0
+        self.bytes_written = 0
+
+    def read(self, num_frames: int, *, exception_on_overflow: bool = True) -> bytes:  # noqa: ARG002
+        """Return the next `num_frames` of speech, after they would have been recorded."""
+        time.sleep(num_frames / constants.PYAUDIO_RATE / self.speed)
+        chunk = _speech_like_chunk(num_frames, self.frames_read)
+        self.frames_read += num_frames
+        return chunk
+
+    def write(self, frames: bytes) -> None:
+        """Block for as long as playing `frames` would take."""
+        if not self.bytes_written and (starts := playback_starts.get()) is not None:
+            starts.append(time.monotonic())
+        self.bytes_written += len(frames)
+        time.sleep(len(frames) / self.bytes_per_second / self.speed)
+
+    def stop_stream(self) -> None:
+        """Do nothing, like a stopped stream."""
+
+    def close(self) -> None:
+        """Do nothing, like a closed stream."""
+
+
+class SyntheticPyAudio:
+    """Replacement for `pyaudio.PyAudio` that opens `SyntheticStream`s."""
+
+    speed = 1.0  # Set by the benchmark before any stream is opened
+
+    def open(self, **kwargs: Any) -> SyntheticStream:
+        """Open a stream with the format of the PyAudio call."""
+        width = {8: 2, 2: 4, 4: 3, 16: 1}.get(kwargs.get("format", 8), 2)  # paInt16 is 8
+        return SyntheticStream(
+            rate=kwargs.get("rate", constants.PYAUDIO_RATE),
+            channels=kwargs.get("channels", 1),
+            width=width,
+            speed=self.speed,
+        )
+
+    def get_device_count(self) -> int:
+        """Report no devices, so that the default devices are used."""
+        return 0
+
+    def terminate(self) -> None:
+        """Do nothing, as there is no audio system to release."""
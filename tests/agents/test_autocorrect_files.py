@@ -0,0 +1,92 @@
+"""Tests for the autocorrect-files agent."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from agent_cli.cli import app
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+runner = CliRunner()
+MODULE = "agent_cli.agents.autocorrect_files"
+
+
+async def _correct(agent: object, text: str) -> str:  # noqa: ARG001
+    if "fail" in text:
+        msg = "LLM unavailable"
+        raise RuntimeError(msg)
+    # Earlier chunks take longer, so they complete out of order
+    await asyncio.sleep(0.01 * (10 - int(text[1])))
+    return text.upper() + "\n"
+
+
+def test_autocorrect_files_stdin_in_order() -> None:
+    """Test that chunks are corrected concurrently but written in order."""
+    text = "\n\n".join(f"p{i} text" for i in range(6)) + "\n"
+    with (
+        patch(f"{MODULE}._create_correction_agent", return_value=MagicMock()),
+        patch("agent_cli.agents.autocorrect._correct_text", side_effect=_correct) as mock,
+    ):
+        result = runner.invoke(
+            app,
+            ["autocorrect-files", "--max-chunk-tokens", "2", "-j", "3", "--quiet"],
+            input=text,
+        )
+    assert result.exit_code == 0, result.output
+    assert result.stdout == text.upper()
+    assert mock.call_count == 6
+
+
+def test_autocorrect_files_directory_and_errors(tmp_path: Path) -> None:
+    """Test that several files get headers and failed chunks are kept uncorrected."""
+    (tmp_path / "a.md").write_text("p1 good\n\np2 fail\n")
+    (tmp_path / "b.txt").write_text("p3 fine")
+    (tmp_path / "image.png").write_bytes(b"\x89PNG")
+    with (
+        patch(f"{MODULE}._create_correction_agent", return_value=MagicMock()),
+        patch("agent_cli.agents.autocorrect._correct_text", side_effect=_correct),
+    ):
+        result = runner.invoke(
+            app,
+            ["autocorrect-files", str(tmp_path), "--max-chunk-tokens", "2"],
+        )
+    assert result.exit_code == 1
+    a, b = (str((tmp_path / name).resolve()) for name in ("a.md", "b.txt"))
+    assert result.stdout == f"==> {a} <==\nP1 GOOD\n\np2 fail\n\n==> {b} <==\nP3 FINE"
+    assert "LLM unavailable" in result.stderr
+
+
+def test_autocorrect_files_incremental(tmp_path: Path) -> None:
+    """Test that only new or edited paragraphs are sent on repeat runs."""
+    draft = tmp_path / "draft.txt"
+    draft.write_text("p1 one\n\np2 two\n")
+    args = ["autocorrect-files", str(draft), "--incremental", "--quiet"]
+    with (
+        patch(f"{MODULE}._create_correction_agent", return_value=MagicMock()),
+        patch("agent_cli.agents.autocorrect._correct_text", side_effect=_correct) as mock,
+    ):
+        result = runner.invoke(app, args)
+        assert result.stdout == "P1 ONE\n\nP2 TWO\n"
+        assert mock.call_count == 2
+
+        # Feed the corrected output back in with one paragraph edited
+        draft.write_text("P1 ONE\n\nP2 TWO\n\np3 three\n")
+        result = runner.invoke(app, args)
+        assert result.stdout == "P1 ONE\n\nP2 TWO\n\nP3 THREE\n"
+        assert mock.call_count == 3
+        assert mock.call_args.args[1] == "p3 three"
+
+        # A different model does not reuse the corrections
+        result = runner.invoke(app, [*args, "--llm-ollama-model", "other"])
+        assert mock.call_count == 6
+
+        # The corrections are reused even if the cache is off for other commands
+        result = runner.invoke(app, [*args, "--no-llm-cache"])
+        assert result.stdout == "P1 ONE\n\nP2 TWO\n\nP3 THREE\n"
+        assert mock.call_count == 6
@@ -8,9 +8,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from rich.console import Console
+from typer.testing import CliRunner
 
 from agent_cli import config
 from agent_cli.agents import autocorrect
+from agent_cli.cli import app
 
 
 def test_system_prompt_and_instructions():
@@ -338,3 +340,28 @@ async def test_async_autocorrect_error(mock_process_text: AsyncMock):
         )
     assert excinfo.value.code == 1
     mock_process_text.assert_called_once()
+
+
+def test_autocorrect_incremental() -> None:
+    """Test that only new or edited paragraphs are sent on repeat runs."""
+    runner = CliRunner()
+
+    async def correct(agent: object, text: str) -> str:  # noqa: ARG001
+        return text.upper()
+
+    args = ["autocorrect", "--incremental", "--quiet"]
+    with (
+        patch("agent_cli.agents.autocorrect._create_correction_agent", return_value=MagicMock()),
+        patch("agent_cli.agents.autocorrect._correct_text", side_effect=correct) as mock,
+        patch("agent_cli.agents.autocorrect.pyperclip.copy") as mock_copy,
+    ):
+        result = runner.invoke(app, [*args, "p1 one\n\np2 two"])
+        assert result.exit_code == 0, result.output
+        mock_copy.assert_called_with("P1 ONE\n\nP2 TWO")
+        assert mock.call_count == 2
+
+        # Correct the corrected text again with one paragraph edited
+        result = runner.invoke(app, [*args, "P1 ONE\n\np2 two!\n\np3 three"])
+        assert result.exit_code == 0, result.output
+        mock_copy.assert_called_with("P1 ONE\n\nP2 TWO!\n\nP3 THREE")
+        assert [call.args[1] for call in mock.call_args_list[2:]] == ["p2 two!", "p3 three"]
@@ -77,6 +77,7 @@ async def test_handle_conversation_turn_no_llm_response():
             openai_tts_cfg=openai_tts_cfg,
             kokoro_tts_cfg=kokoro_tts_cfg,
             piper_tts_cfg=piper_tts_cfg,
+            chat_tools=[],
             live=mock_live,
         )
         mock_create_transcriber.assert_called_once()
@@ -142,6 +143,7 @@ async def test_handle_conversation_turn_no_instruction():
             openai_tts_cfg=openai_tts_cfg,
             kokoro_tts_cfg=kokoro_tts_cfg,
             piper_tts_cfg=piper_tts_cfg,
+            chat_tools=[],
             live=mock_live,
         )
         mock_create_transcriber.assert_called_once()
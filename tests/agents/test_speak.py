@@ -111,6 +111,8 @@ def test_speak_agent(mock_async_main: AsyncMock) -> None:
     result = runner.invoke(app, ["speak", "hello"], catch_exceptions=False)
     assert result.exit_code == 0
     mock_async_main.assert_called_once()
+    # `--stop` reaches the playback through the control socket
+    assert mock_async_main.call_args.kwargs["stop_event"] is not None
 
 
 @patch("agent_cli.agents.speak.process.kill_process")
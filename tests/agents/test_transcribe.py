@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from array import array
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,10 +13,13 @@ import pytest
 
 from agent_cli import config
 from agent_cli.agents import transcribe
+from agent_cli.core.utils import InteractiveStopEvent
+from benchmarks.mock_servers import TRANSCRIPT, Latency, mock_servers
 from tests.mocks.wyoming import MockASRClient
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("fast_path_words", [0, 8])
 @patch("agent_cli.agents.transcribe.process_and_update_clipboard", new_callable=AsyncMock)
 @patch("agent_cli.services.asr.wyoming_client_context")
 @patch("agent_cli.agents.transcribe.pyperclip")
@@ -27,9 +31,13 @@ async def test_transcribe_main_llm_enabled(
     mock_pyperclip: MagicMock,
     mock_wyoming_client_context: MagicMock,
     mock_process_and_update_clipboard: AsyncMock,
+    fast_path_words: int,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Test the main function of the transcribe agent with LLM enabled."""
+    """Test the main function of the transcribe agent with LLM enabled.
+
+    With the fast path, the short transcript is cleaned up without the LLM.
+    """
     # Mock the pyaudio context manager
     mock_pyaudio_instance = MagicMock()
     mock_pyaudio_context.return_value.__enter__.return_value = mock_pyaudio_instance
@@ -80,11 +88,16 @@ async def test_transcribe_main_llm_enabled(
             llm_enabled=True,
             transcription_log=None,
             p=mock_pyaudio_instance,
+            llm_fast_path_words=fast_path_words,
         )
 
     # Assertions
-    mock_process_and_update_clipboard.assert_called_once()
-    mock_pyperclip.copy.assert_not_called()
+    if fast_path_words:
+        mock_process_and_update_clipboard.assert_not_called()
+        mock_pyperclip.copy.assert_called_once_with("Hello world.")
+    else:
+        mock_process_and_update_clipboard.assert_called_once()
+        mock_pyperclip.copy.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -291,6 +304,135 @@ async def test_transcribe_with_logging(
     assert "hostname" in entry
 
 
+@pytest.mark.asyncio
+@patch("agent_cli.agents.transcribe.pyperclip")
+async def test_transcribe_continuous(
+    mock_pyperclip: MagicMock,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that each utterance of a continuous dictation is transcribed and appended."""
+    quiet = array("h", [20, -20] * 512).tobytes()
+    loud = array("h", [3000, -3000] * 512).tobytes()
+    # Two utterances, separated by more than the pause that ends an utterance
+    chunks = iter([quiet] * 10 + [loud] * 10 + [quiet] * 20 + [loud] * 10 + [quiet] * 20)
+    stop_event = InteractiveStopEvent()
+
+    def read(**_kwargs: object) -> bytes:
+        chunk = next(chunks, None)
+        if chunk is None:
+            stop_event.set()
+            return quiet
+        return chunk
+
+    mock_pyaudio_instance = MagicMock()
+    mock_pyaudio_instance.open.return_value.read.side_effect = read
+    output_file = tmp_path / "dictation.txt"
+    log_file = tmp_path / "transcriptions.log"
+
+    async with mock_servers(Latency(asr=0.05)) as endpoints:
+        result = await transcribe._async_continuous(
+            extra_instructions=None,
+            provider_cfg=config.ProviderSelection(
+                asr_provider="local",
+                llm_provider="local",
+                tts_provider="piper",
+            ),
+            general_cfg=config.General(
+                log_level="INFO",
+                log_file=None,
+                quiet=True,
+                list_devices=False,
+                clipboard=True,
+            ),
+            audio_in_cfg=config.AudioInput(),
+            wyoming_asr_cfg=config.WyomingASR(
+                asr_wyoming_ip=endpoints.host,
+                asr_wyoming_port=endpoints.asr_port,
+            ),
+            openai_asr_cfg=config.OpenAIASR(asr_openai_model="whisper-1"),
+            ollama_cfg=config.Ollama(llm_ollama_model="test", llm_ollama_host="localhost"),
+            openai_llm_cfg=config.OpenAILLM(llm_openai_model="gpt-4"),
+            gemini_llm_cfg=config.GeminiLLM(llm_gemini_model="gemini-1.5-flash"),
+            llm_enabled=False,
+            transcription_log=log_file,
+            p=mock_pyaudio_instance,
+            stop_event=stop_event,
+            output_file=output_file,
+        )
+
+    assert result == f"{TRANSCRIPT} {TRANSCRIPT}"
+    assert capsys.readouterr().out.splitlines() == [TRANSCRIPT, TRANSCRIPT]
+    assert output_file.read_text().splitlines() == [TRANSCRIPT, TRANSCRIPT]
+    assert mock_pyperclip.copy.call_args_list[-1].args == (result,)
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [entry["model"] for entry in entries] == ["local", "local"]
+
+
+@pytest.mark.asyncio
+@patch("agent_cli.agents.transcribe.pyperclip")
+async def test_transcribe_continuous_flush(mock_pyperclip: MagicMock) -> None:  # noqa: ARG001
+    """Test that a flush ends the current utterance, answers with it, and keeps recording."""
+    quiet = array("h", [20, -20] * 512).tobytes()
+    loud = array("h", [3000, -3000] * 512).tobytes()
+    # One long utterance, flushed in the middle
+    chunks = iter([quiet] * 10 + [loud] * 20 + [quiet] * 20)
+    n_read = 0
+    stop_event = InteractiveStopEvent()
+    flush_requests: asyncio.Queue[asyncio.Future[str | None]] = asyncio.Queue()
+    flushed: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+    loop = asyncio.get_running_loop()
+
+    def read(**_kwargs: object) -> bytes:
+        nonlocal n_read
+        n_read += 1
+        if n_read == 16:  # Some speech in
+            loop.call_soon_threadsafe(flush_requests.put_nowait, flushed)
+        chunk = next(chunks, None)
+        if chunk is None:
+            stop_event.set()
+            return quiet
+        return chunk
+
+    mock_pyaudio_instance = MagicMock()
+    mock_pyaudio_instance.open.return_value.read.side_effect = read
+
+    async with mock_servers(Latency(asr=0.05)) as endpoints:
+        result = await transcribe._async_continuous(
+            extra_instructions=None,
+            provider_cfg=config.ProviderSelection(
+                asr_provider="local",
+                llm_provider="local",
+                tts_provider="piper",
+            ),
+            general_cfg=config.General(
+                log_level="INFO",
+                log_file=None,
+                quiet=True,
+                list_devices=False,
+                clipboard=False,
+            ),
+            audio_in_cfg=config.AudioInput(),
+            wyoming_asr_cfg=config.WyomingASR(
+                asr_wyoming_ip=endpoints.host,
+                asr_wyoming_port=endpoints.asr_port,
+            ),
+            openai_asr_cfg=config.OpenAIASR(asr_openai_model="whisper-1"),
+            ollama_cfg=config.Ollama(llm_ollama_model="test", llm_ollama_host="localhost"),
+            openai_llm_cfg=config.OpenAILLM(llm_openai_model="gpt-4"),
+            gemini_llm_cfg=config.GeminiLLM(llm_gemini_model="gemini-1.5-flash"),
+            llm_enabled=False,
+            transcription_log=None,
+            p=mock_pyaudio_instance,
+            stop_event=stop_event,
+            flush_requests=flush_requests,
+        )
+
+    assert flushed.result() == TRANSCRIPT
+    # The rest of the speech after the flush is an utterance of its own
+    assert result == f"{TRANSCRIPT} {TRANSCRIPT}"
+
+
 def test_transcription_log_path_expansion() -> None:
     """Test that transcription log paths with ~ are expanded."""
     # Create a test case that would use ~ expansion
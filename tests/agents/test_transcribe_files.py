@@ -0,0 +1,107 @@
+"""Tests for the transcribe-files agent."""
+
+from __future__ import annotations
+
+import json
+import wave
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+from typer.testing import CliRunner
+
+from agent_cli.cli import app
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+runner = CliRunner()
+
+
+def _write_wav(path: Path, seconds: int = 1) -> None:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(bytes(32000 * seconds))
+
+
+def test_transcribe_files_jsonl_and_resume(tmp_path: Path) -> None:
+    """Test that transcripts are written to JSONL and a rerun skips them."""
+    for name in ("a.wav", "b.wav"):
+        _write_wav(tmp_path / name)
+    output = tmp_path / "out.jsonl"
+    args = ["transcribe-files", str(tmp_path), "--output", str(output), "-j", "2"]
+
+    with patch(
+        "agent_cli.agents.transcribe_files.asr.transcribe_recording",
+        new_callable=AsyncMock,
+        return_value="hello",
+    ) as mock_transcribe:
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert "2 file(s), 0 failed, 0 skipped" in result.output
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert sorted(r["file"] for r in records) == [
+            str((tmp_path / name).resolve()) for name in ("a.wav", "b.wav")
+        ]
+        assert all(r["text"] == "hello" and r["duration"] == 1.0 for r in records)
+
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert "0 file(s), 0 failed, 2 skipped" in result.output
+    assert mock_transcribe.await_count == 2
+
+
+def test_transcribe_files_sidecar_and_errors(tmp_path: Path) -> None:
+    """Test that sidecar files are written and failures are reported."""
+    _write_wav(tmp_path / "a.wav", seconds=1)
+    _write_wav(tmp_path / "b.wav", seconds=2)
+
+    async def transcribe(audio_data: bytes, **kwargs: object) -> str:  # noqa: ARG001
+        if len(audio_data) == 32000:
+            msg = "ASR connection refused"
+            raise ConnectionRefusedError(msg)
+        return "hello"
+
+    with patch(
+        "agent_cli.agents.transcribe_files.asr.transcribe_recording",
+        new_callable=AsyncMock,
+        side_effect=transcribe,
+    ):
+        result = runner.invoke(app, ["transcribe-files", str(tmp_path), "--sidecar", "-j", "1"])
+    assert result.exit_code == 1
+    assert "ASR connection refused" in result.output
+    assert (tmp_path / "b.wav.txt").read_text() == "hello\n"
+    assert not (tmp_path / "a.wav.txt").exists()
+
+
+def test_transcribe_files_sidecar_same_stem(tmp_path: Path) -> None:
+    """Test that files sharing a stem get their own sidecar files, and a rerun skips both."""
+    for name in ("a.wav", "a.mp3"):
+        (tmp_path / name).touch()
+
+    async def transcribe(audio_data: bytes, **kwargs: object) -> str:  # noqa: ARG001
+        return f"{len(audio_data)} bytes"
+
+    with (
+        patch(
+            "agent_cli.agents.transcribe_files.load_audio",
+            new_callable=AsyncMock,
+            side_effect=lambda path: bytes(32000 if path.suffix == ".wav" else 64000),
+        ),
+        patch(
+            "agent_cli.agents.transcribe_files.asr.transcribe_recording",
+            new_callable=AsyncMock,
+            side_effect=transcribe,
+        ) as mock_transcribe,
+    ):
+        args = ["transcribe-files", str(tmp_path), "--sidecar"]
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "a.wav.txt").read_text() == "32000 bytes\n"
+        assert (tmp_path / "a.mp3.txt").read_text() == "64000 bytes\n"
+
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert "0 file(s), 0 failed, 2 skipped" in result.output
+    assert mock_transcribe.await_count == 2
@@ -6,10 +6,16 @@ import asyncio
 import contextlib
 import io
 import logging
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 from rich.console import Console
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
 
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
     """Set default timeout for all tests."""
@@ -18,6 +24,14 @@ def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
             item.add_marker(pytest.mark.timeout(3))
 
 
+@pytest.fixture(autouse=True)
+def llm_cache_file(tmp_path: Path) -> Generator[Path, None, None]:
+    """Keep the LLM response cache of each test in its own temporary directory."""
+    path = tmp_path / "llm-cache.sqlite"
+    with patch("agent_cli.services.llm.CACHE_FILE", path):
+        yield path
+
+
 @pytest.fixture
 def mock_console() -> Console:
     """Provide a console that writes to a StringIO for testing."""
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from wyoming.asr import Transcribe, Transcript, TranscriptChunk
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 
+from agent_cli.core import vad
 from agent_cli.services import asr
 
 
@@ -101,7 +103,7 @@ def test_create_recorded_audio_transcriber():
     provider_cfg = MagicMock()
     provider_cfg.asr_provider = "openai"
     transcriber = asr.create_recorded_audio_transcriber(provider_cfg)
-    assert transcriber is asr.transcribe_audio_openai
+    assert transcriber is asr._transcribe_recorded_audio_openai
 
     provider_cfg.asr_provider = "local"
     transcriber = asr.create_recorded_audio_transcriber(provider_cfg)
@@ -121,3 +123,88 @@ async def test_transcribe_recorded_audio_wyoming_connection_error(
     )
     assert result == ""
     mock_wyoming_client_context.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_recorded_audio_wyoming_in_windows() -> None:
+    """Test that long interactive recordings are split off the event loop and stitched."""
+    audio = bytes(32000 * 65)  # More than two windows of silence
+    with (
+        patch(
+            "agent_cli.services.asr._transcribe_pcm_wyoming",
+            side_effect=["one", "two", "three"],
+        ) as mock_transcribe,
+        patch("agent_cli.services.asr.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread,
+    ):
+        result = await asr._transcribe_recorded_audio_wyoming(
+            audio_data=audio,
+            wyoming_asr_cfg=MagicMock(),
+            logger=MagicMock(),
+        )
+    assert result == "one two three"
+    assert mock_transcribe.call_count == 3
+    assert to_thread.call_args.args[0] is vad.split_at_silences
+
+
+@pytest.mark.asyncio
+async def test_transcribe_recorded_audio_openai_in_windows() -> None:
+    """Test that long recordings are sent to OpenAI as WAV windows, a bounded number at once."""
+    audio = bytes(32000 * 65)  # More than two windows of silence
+    in_flight = max_in_flight = 0
+    texts = iter(["one", "two", "three"])
+
+    async def transcribe(wav: bytes, *args: object) -> str:  # noqa: ARG001
+        nonlocal in_flight, max_in_flight
+        assert wav.startswith(b"RIFF")
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        text = next(texts)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return text
+
+    with (
+        patch("agent_cli.services.asr.transcribe_audio_openai", side_effect=transcribe),
+        patch("agent_cli.services.asr.MAX_CONCURRENT_WINDOWS", 2),
+    ):
+        result = await asr._transcribe_recorded_audio_openai(
+            audio_data=audio,
+            openai_asr_cfg=MagicMock(),
+            logger=MagicMock(),
+            quiet=True,
+        )
+    assert result == "one two three"
+    assert max_in_flight == 2
+
+
+def test_stitch_transcripts() -> None:
+    """Test that words duplicated by the window overlap are kept once."""
+    assert asr.stitch_transcripts(["Hello there, how", "How are you?", "you? Fine."]) == (
+        "Hello there, how are you? Fine."
+    )
+    assert asr.stitch_transcripts(["one two", "three", ""]) == "one two three"
+
+
+@pytest.mark.asyncio
+async def test_transcribe_recording_in_windows() -> None:
+    """Test that long recordings are transcribed per window and stitched."""
+    provider_cfg = MagicMock(asr_provider="local")
+    audio = bytes(32000 * 5)  # Silence, so each window is cut at its earliest candidate
+    n_windows = len(vad.split_at_silences(audio, window_seconds=2, overlap_seconds=1))
+    transcripts = ["the quick brown", "brown fox", "fox jumps", "jumps over", "over the dog"]
+
+    with patch(
+        "agent_cli.services.asr._transcribe_pcm_wyoming",
+        side_effect=transcripts[:n_windows],
+    ) as mock_transcribe:
+        text = await asr.transcribe_recording(
+            audio,
+            provider_cfg=provider_cfg,
+            wyoming_asr_cfg=MagicMock(),
+            openai_asr_cfg=MagicMock(),
+            logger=MagicMock(),
+            window_seconds=2,
+        )
+    assert n_windows > 1
+    assert mock_transcribe.call_count == n_windows
+    assert text == " ".join(["the quick brown", "fox", "jumps", "over", "the dog"][:n_windows])
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from agent_cli.core import audio
+from agent_cli.core import audio, vad
 from tests.mocks.audio import MockPyAudio
 
 
@@ -371,3 +371,81 @@ async def test_audio_tee_os_error():
     await tee._run()
 
     mock_logger.exception.assert_called_once_with("Error reading audio stream")
+
+
+@pytest.mark.asyncio
+async def test_audio_tee_replays_history():
+    """Test that a late consumer can start from a chunk kept in the history."""
+    chunks = [bytes([i]) for i in range(6)]
+    mock_stream = Mock()
+    mock_stream.read.side_effect = [*chunks, OSError("Stream closed")]
+    mock_stop_event = Mock()
+    mock_stop_event.is_set.return_value = False
+
+    tee = audio._AudioTee(mock_stream, mock_stop_event, Mock(), history_chunks=4)
+    await tee._run()
+    assert tee.chunks_read == 6
+
+    # Only the last 4 chunks are kept, so chunk 1 is out of reach
+    late = await tee.add_queue(start_chunk=1)
+    assert [late.get_nowait() for _ in range(late.qsize())] == chunks[2:]
+    late = await tee.add_queue(start_chunk=4)
+    assert [late.get_nowait() for _ in range(late.qsize())] == chunks[4:]
+
+
+@pytest.mark.asyncio
+async def test_audio_tee_gated_queue():
+    """Test that a gated queue only receives the chunks its gate passes."""
+    quiet, loud = bytes(2048), b"\xff\x7f" * 1024
+    mock_stream = Mock()
+    mock_stream.read.side_effect = [quiet, quiet, loud, OSError("Stream closed")]
+    mock_stop_event = Mock()
+    mock_stop_event.is_set.return_value = False
+
+    tee = audio._AudioTee(mock_stream, mock_stop_event, Mock())
+    gated = await tee.add_queue(gate=vad.EnergyGate(preroll=0.07))  # 2 chunks
+    ungated = await tee.add_queue()
+    await tee._run()
+    assert ungated.qsize() == 4  # Three chunks and the end-of-stream marker
+    assert [gated.get_nowait() for _ in range(gated.qsize())] == [quiet, quiet, loud, None]
+
+
+@pytest.mark.asyncio
+async def test_audio_tee_chunks_taken_by_gated_queue():
+    """Test that the position of a gated consumer accounts for skipped chunks and the pre-roll."""
+    quiet, loud = bytes(2048), b"\xff\x7f" * 1024
+    mock_stream = Mock()
+    mock_stream.read.side_effect = [*[quiet] * 5, loud, loud, *[quiet] * 3, OSError("Closed")]
+    mock_stop_event = Mock()
+    mock_stop_event.is_set.return_value = False
+
+    tee = audio._AudioTee(mock_stream, mock_stop_event, Mock())
+    gated = await tee.add_queue(gate=vad.EnergyGate(preroll=0.07, hangover=0.0))  # 2 chunks
+    await tee._run()
+    # The pre-roll (chunks 3 and 4), chunks 5 and 6, and the end-of-stream marker
+    assert gated.qsize() == 5
+    assert tee.chunks_taken(gated) == 3
+    for _ in range(4):
+        gated.get_nowait()
+    # Counting back from the chunks read would land on chunk 9, which the gate skipped
+    assert tee.chunks_read - gated.qsize() == 9
+    assert tee.chunks_taken(gated) == 7
+
+
+@pytest.mark.asyncio
+async def test_audio_tee_drops_oldest_chunks_when_full():
+    """Test that a consumer that falls behind loses its oldest chunks, and that they are counted."""
+    chunks = [bytes([i]) for i in range(5)]
+    mock_stream = Mock()
+    mock_stream.read.side_effect = [*chunks, OSError("Stream closed")]
+    mock_stop_event = Mock()
+    mock_stop_event.is_set.return_value = False
+
+    tee = audio._AudioTee(mock_stream, mock_stop_event, Mock())
+    tee._max_queued_chunks = 3
+    queue = await tee.add_queue()
+    await tee._run()
+
+    # Chunks 0-2 and the end-of-stream marker do not fit in the queue
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [*chunks[3:], None]
+    assert tee.dropped_chunks == 3
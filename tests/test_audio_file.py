@@ -0,0 +1,71 @@
+"""Tests for reading audio files."""
+
+from __future__ import annotations
+
+import wave
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from agent_cli.core import audio_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_wav(path: Path, pcm: bytes, *, rate: int = 16000, channels: int = 1) -> None:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(pcm)
+
+
+def test_find_audio_files(tmp_path: Path) -> None:
+    """Test that directories, globs and files are expanded, sorted and deduplicated."""
+    (tmp_path / "nested").mkdir()
+    for name in ("b.wav", "a.mp3", "notes.txt", "nested/c.flac"):
+        (tmp_path / name).touch()
+
+    found = audio_file.find_audio_files([str(tmp_path), str(tmp_path / "*.wav")])
+    assert [p.name for p in found] == ["a.mp3", "b.wav", "c.flac"]
+    # Explicit files are kept whatever their extension
+    assert audio_file.find_audio_files([str(tmp_path / "notes.txt")]) == [
+        (tmp_path / "notes.txt").resolve(),
+    ]
+    assert audio_file.find_audio_files([str(tmp_path / "missing*.wav")]) == []
+
+
+@pytest.mark.asyncio
+async def test_load_native_wav(tmp_path: Path) -> None:
+    """Test that 16 kHz mono WAV files are read without ffmpeg."""
+    pcm = bytes(range(256)) * 125  # 1 s of audio
+    path = tmp_path / "speech.wav"
+    _write_wav(path, pcm)
+    with patch("agent_cli.core.audio_file.shutil.which") as mock_which:
+        assert await audio_file.load_audio(path) == pcm
+    mock_which.assert_not_called()
+    assert audio_file.pcm_duration(pcm) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_load_audio_requires_ffmpeg(tmp_path: Path) -> None:
+    """Test that other formats need ffmpeg."""
+    path = tmp_path / "speech.wav"
+    _write_wav(path, bytes(64), rate=44100, channels=2)
+    with (
+        patch("agent_cli.core.audio_file.shutil.which", return_value=None),
+        pytest.raises(RuntimeError, match="ffmpeg is required"),
+    ):
+        await audio_file.load_audio(path)
+
+
+def test_pcm_to_wav(tmp_path: Path) -> None:
+    """Test that PCM audio is wrapped in a readable WAV container."""
+    path = tmp_path / "out.wav"
+    path.write_bytes(audio_file.pcm_to_wav(bytes(320)))
+    with wave.open(str(path), "rb") as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getnframes() == 160
@@ -0,0 +1,105 @@
+"""Tests of the benchmarks: their mock servers with the clients of the agents, and hot paths."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+import aiohttp
+import pytest
+
+from agent_cli import config
+from agent_cli.services import asr, tts, wake_word
+from benchmarks import hot_paths
+from benchmarks.mock_servers import LLM_RESPONSE, TRANSCRIPT, WAKE_WORD, Latency, mock_servers
+from benchmarks.runner import regressions
+
+LOGGER = logging.getLogger(__name__)
+FAST = Latency(asr=0.0, tts_first_byte=0.0, tts_chunk=0.0, llm_first_token=0.0, llm_token=0.0)
+
+
+@pytest.mark.asyncio
+async def test_asr_and_tts_servers() -> None:
+    """Test a transcription with partial transcripts, and a synthesis."""
+    async with mock_servers(FAST) as endpoints:
+        asr_cfg = config.WyomingASR(
+            asr_wyoming_ip=endpoints.host,
+            asr_wyoming_port=endpoints.asr_port,
+        )
+        transcript = await asr._transcribe_pcm_wyoming(bytes(64000), asr_cfg, LOGGER)
+        assert transcript == TRANSCRIPT
+
+        tts_cfg = config.WyomingTTS(
+            tts_wyoming_ip=endpoints.host,
+            tts_wyoming_port=endpoints.tts_port,
+        )
+        wav = await tts._synthesize_speech_wyoming(
+            text="Hello",
+            wyoming_tts_cfg=tts_cfg,
+            logger=LOGGER,
+            quiet=True,
+            live=None,
+        )
+        assert wav is not None
+        assert wav.startswith(b"RIFF")
+
+
+@pytest.mark.asyncio
+async def test_wake_word_server() -> None:
+    """Test that the wake word is detected after the configured amount of audio."""
+    async with mock_servers(Latency(wake_after=0.1)) as endpoints:
+        wake_cfg = config.WakeWord(
+            wake_server_ip=endpoints.host,
+            wake_server_port=endpoints.wake_port,
+            wake_word=WAKE_WORD,
+        )
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        for _ in range(10):
+            queue.put_nowait(bytes(2048))
+        detect = wake_word.create_wake_word_detector(wake_cfg)
+        assert (
+            await asyncio.wait_for(detect(logger=LOGGER, queue=queue, quiet=True), 5) == WAKE_WORD
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_llm_server(stream: bool) -> None:
+    """Test the OpenAI-compatible chat completions, with and without streaming."""
+    async with (
+        mock_servers(FAST) as endpoints,
+        aiohttp.ClientSession() as session,
+        session.post(
+            f"{endpoints.llm_url}/v1/chat/completions",
+            json={"model": "m", "messages": [{"role": "user", "content": "Hi"}], "stream": stream},
+        ) as response,
+    ):
+        if not stream:
+            body = await response.json()
+            assert body["choices"][0]["message"]["content"] == LLM_RESPONSE
+            return
+        text = ""
+        async for line in response.content:
+            data = line.decode().removeprefix("data: ").strip()
+            if data and data != "[DONE]":
+                text += json.loads(data)["choices"][0]["delta"]["content"]
+        assert text == LLM_RESPONSE
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", list(hot_paths.PATHS))
+async def test_hot_path(path: str) -> None:
+    """Test that each audio hot path runs through all chunks, with all metrics."""
+    result = await hot_paths.measure(path, n_chunks=3, speed=1000, allocations=True)
+    assert set(result) == set(hot_paths.SLACK)
+    assert result["cpu_us"] > 0
+
+
+def test_hot_paths_regressions() -> None:
+    """Test that only regressions beyond both the tolerance and the slack are reported."""
+    baseline = {"send_audio 1x": {"cpu_us": 100.0, "lag_max_ms": 1.0, "peak_kib": 10.0}}
+    results = {"send_audio 1x": {"cpu_us": 200.0, "lag_max_ms": 3.0, "peak_kib": 11.0}}
+    assert regressions(results, baseline, 0.2, hot_paths.SLACK) == [
+        "send_audio 1x cpu_us: 100.000 -> 200.000 (+100%)",
+    ]
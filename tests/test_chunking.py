@@ -0,0 +1,43 @@
+"""Tests for splitting text into chunks under a token budget."""
+
+from __future__ import annotations
+
+from agent_cli.core.chunking import Chunk, estimate_tokens, split_text
+
+
+def _join(chunks: list[Chunk]) -> str:
+    return "".join(chunk.text + chunk.separator for chunk in chunks)
+
+
+def test_split_text_packs_paragraphs() -> None:
+    """Test that whole paragraphs are packed into chunks and the text round-trips."""
+    text = "First paragraph.\n\nSecond one.\n  \nThird one here.\n"
+    assert split_text(text, 100) == [Chunk(text.rstrip("\n"), "\n")]
+
+    chunks = split_text(text, 8)
+    assert chunks == [
+        Chunk("First paragraph.\n\nSecond one.", "\n  \n"),
+        Chunk("Third one here.", "\n"),
+    ]
+    assert _join(chunks) == text
+
+    assert [chunk.text for chunk in split_text(text, 100, pack=False)] == [
+        "First paragraph.",
+        "Second one.",
+        "Third one here.",
+    ]
+
+
+def test_split_text_splits_long_paragraphs() -> None:
+    """Test that a paragraph over the budget is split at lines, then sentences."""
+    sentence = "This sentence has about ten tokens in it."
+    paragraph = " ".join([sentence] * 4)
+    text = f"{paragraph}\nshort line\n\nEnd."
+    chunks = split_text(text, 25)
+    assert _join(chunks) == text
+    assert all(estimate_tokens(chunk.text) <= 25 for chunk in chunks)
+    assert chunks[0] == Chunk(f"{sentence} {sentence}", " ")
+    assert chunks[-1].text.endswith("short line\n\nEnd.")
+
+    # A single sentence over the budget cannot be split further
+    assert split_text(sentence, 2) == [Chunk(sentence, "")]
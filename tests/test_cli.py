@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import ast
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
-from agent_cli.cli import app
-
-if TYPE_CHECKING:
-    import pytest
+from agent_cli.cli import _LAZY_COMMANDS, app
+from agent_cli.core.startup import measure_imports, parse_importtime
 
 runner = CliRunner()
 
@@ -29,3 +32,115 @@ def test_main_with_args(mock_setup_logging: pytest.MagicMock) -> None:
     assert result.exit_code == 0
     assert "Usage" in result.stdout
     mock_setup_logging.assert_not_called()
+
+
+def _modules_loaded_by(args: list[str]) -> set[str]:
+    """Run the CLI in a fresh interpreter and return the modules it imported."""
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from agent_cli.cli import app\n"
+        f"result = CliRunner().invoke(app, {args!r})\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.timeout(10)
+def test_help_does_not_import_commands() -> None:
+    """Test that the top-level help is rendered without importing any command module."""
+    modules = _modules_loaded_by(["--help"])
+    assert not {module for module, *_ in _LAZY_COMMANDS.values()} & modules
+    assert "agent_cli.services" not in modules
+
+
+@pytest.mark.timeout(10)
+def test_autocorrect_skips_heavy_imports() -> None:
+    """Test that the autocorrect command does not load audio or HTTP client libraries."""
+    modules = _modules_loaded_by(["autocorrect", "--help"])
+    assert "agent_cli.agents.autocorrect" in modules
+    for heavy in ("pyaudio", "wyoming", "openai", "aiohttp", "agent_cli.agents.chat"):
+        assert heavy not in modules
+
+
+@pytest.mark.timeout(10)
+def test_autocorrect_startup_budget() -> None:
+    """Test that the cold start of autocorrect leaves out the slow imports.
+
+    Asserting on the modules rather than on the time keeps the test stable on busy machines.
+    """
+    modules = {t.module for t in measure_imports("autocorrect")}
+    assert "agent_cli.agents.autocorrect" in modules
+    for heavy in ("pyaudio", "numpy", "wyoming", "openai", "pydantic_ai", "aiohttp"):
+        assert not {m for m in modules if m == heavy or m.startswith(f"{heavy}.")}, heavy
+
+
+def _registered_commands(module: str) -> dict[str, tuple[str, str | None]]:
+    """Return the help and panel of the `@app.command`s in a module, without importing it."""
+    spec = importlib.util.find_spec(module)
+    assert spec is not None
+    assert spec.origin is not None
+    tree = ast.parse(Path(spec.origin).read_text())
+    commands = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call) and ast.unparse(decorator.func) == "app.command":
+                name = ast.literal_eval(decorator.args[0])
+                panel = next(
+                    (
+                        ast.literal_eval(k.value)
+                        for k in decorator.keywords
+                        if k.arg == "rich_help_panel"
+                    ),
+                    None,
+                )
+                commands[name] = ((ast.get_docstring(node) or "").splitlines()[0], panel)
+    return commands
+
+
+def test_lazy_commands_help_matches_commands() -> None:
+    """Test that the help shown for lazy commands matches the real command docstrings.
+
+    The modules are parsed rather than imported, so this runs without PyAudio.
+    """
+    for name, (module, short_help, panel) in _LAZY_COMMANDS.items():
+        assert _registered_commands(module)[name] == (short_help, panel), name
+
+
+@pytest.mark.timeout(10)
+def test_agents_package_star_import() -> None:
+    """Test that `from agent_cli.agents import *` works without importing every agent."""
+    script = "import sys\nfrom agent_cli.agents import *\nprint('\\n'.join(sys.modules))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set(result.stdout.split())
+    assert "agent_cli.agents" in modules
+    assert not {m for m in modules if m.startswith("agent_cli.agents.")}
+
+
+def test_parse_importtime() -> None:
+    """Test parsing the `-X importtime` report."""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   typer\n"
+        "import time:       500 |        620 | agent_cli.cli\n"
+        "some other warning\n"
+    )
+    timings = parse_importtime(stderr)
+    assert [(t.module, t.self_us, t.cumulative_us) for t in timings] == [
+        ("typer", 120, 120),
+        ("agent_cli.cli", 500, 620),
+    ]
@@ -0,0 +1,157 @@
+"""Tests for the resident daemon."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_cli.cli import app
+from agent_cli.core import ipc, process
+from agent_cli.core.utils import InteractiveStopEvent, _stop_process
+from agent_cli.daemon import server
+from agent_cli.daemon.client import DAEMON_NAME
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from agent_cli.services.llm import ResponseCache
+
+
+def test_command_settings_precedence() -> None:
+    """Test that request options override the config file, which overrides the defaults."""
+    file_config = {
+        "defaults": {"llm_provider": "openai", "asr_wyoming_port": 1234},
+        "transcribe": {"asr_wyoming_port": 5678},
+    }
+    settings = server.command_settings(file_config, "transcribe", {"llm-provider": "gemini"})
+    assert settings["llm_provider"] == "gemini"
+    assert settings["asr_wyoming_port"] == 5678
+    assert settings["llm_ollama_host"] == "http://localhost:11434"
+    assert settings["quiet"] is True
+
+
+def _daemon() -> server._Daemon:
+    return server._Daemon(MagicMock(), {}, InteractiveStopEvent())
+
+
+@pytest.mark.asyncio
+async def test_recording_toggle() -> None:
+    """Test that toggle starts a recording and a second toggle returns its result."""
+
+    async def fake_recorder(
+        p: MagicMock,  # noqa: ARG001
+        cache: ResponseCache,  # noqa: ARG001
+        settings: dict,  # noqa: ARG001
+        stop_event: InteractiveStopEvent,
+    ) -> str:
+        await stop_event.wait()
+        return "hello world"
+
+    daemon = _daemon()
+    with patch.dict(server._RECORDERS, {"transcribe": fake_recorder}):
+        response = await daemon.handle({"command": "transcribe", "action": "toggle"})
+        assert response == {"ok": True, "running": True}
+
+        response = await daemon.handle({"command": "transcribe", "action": "status"})
+        assert response == {"ok": True, "running": True}
+
+        response = await daemon.handle({"command": "transcribe", "action": "start"})
+        assert response["ok"] is False
+
+        response = await daemon.handle({"command": "transcribe", "action": "toggle"})
+        assert response == {"ok": True, "running": False, "result": "hello world"}
+
+        response = await daemon.handle({"command": "transcribe", "action": "stop"})
+        assert response["ok"] is False
+
+
+@pytest.mark.asyncio
+async def test_one_shot_autocorrect() -> None:
+    """Test that autocorrect returns the corrected text and copies it."""
+    daemon = _daemon()
+    with (
+        patch(
+            "agent_cli.daemon.server.autocorrect._process_text",
+            new_callable=AsyncMock,
+            return_value=("This is correct.", 0.1),
+        ) as mock_process,
+        patch("agent_cli.daemon.server.pyperclip.copy") as mock_copy,
+    ):
+        response = await daemon.handle(
+            {"command": "autocorrect", "text": "this is corect", "options": {"llm-cache": True}},
+        )
+    assert response == {"ok": True, "result": "This is correct."}
+    assert mock_process.call_args.args[0] == "this is corect"
+    assert mock_process.call_args.kwargs["cache"] is daemon.cache  # Shared by all requests
+    mock_copy.assert_called_once_with("This is correct.")
+
+
+@pytest.mark.asyncio
+async def test_daemon_stop_and_close() -> None:
+    """Test that stopping the daemon sets the shutdown event and stops recordings."""
+
+    async def fake_recorder(
+        p: MagicMock,  # noqa: ARG001
+        cache: ResponseCache,  # noqa: ARG001
+        settings: dict,  # noqa: ARG001
+        stop_event: InteractiveStopEvent,
+    ) -> str:
+        await stop_event.wait()
+        return ""
+
+    daemon = _daemon()
+    with patch.dict(server._RECORDERS, {"voice-edit": fake_recorder}):
+        await daemon.handle({"command": "voice-edit", "action": "start"})
+        status = await daemon.handle({"command": "daemon", "action": "status"})
+        assert status["recording"] == ["voice-edit"]
+        assert set(status["cleanup"]) == {"fast_path", "llm"}
+
+        assert await daemon.cache.get("key") is None  # Opens the database
+        response = await daemon.handle({"command": "daemon", "action": "stop"})
+        assert response["ok"] is True
+        assert daemon.shutdown_event.is_set()
+        await asyncio.wait_for(daemon.close(), timeout=1)
+    assert daemon.recordings == {}
+    assert daemon.cache._db is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_command() -> None:
+    """Test that unknown commands are rejected."""
+    response = await _daemon().handle({"command": "nope"})
+    assert response == {"ok": False, "error": "Unknown command: 'nope'"}
+
+
+@pytest.mark.asyncio
+async def test_daemon_stop_through_control_socket(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that `daemon --stop` stops a running daemon through its socket, not SIGTERM."""
+    monkeypatch.setattr(process, "PID_DIR", tmp_path)
+    path = tmp_path / "d.sock"
+    daemon = _daemon()
+    with (
+        process.pid_file_context(DAEMON_NAME, control_socket=path),
+        patch("agent_cli.core.utils.process.kill_process") as mock_kill,
+    ):
+        async with ipc.unix_server(path, daemon.handle):
+            stopped = await asyncio.to_thread(_stop_process, DAEMON_NAME, "daemon", quiet=True)
+    assert stopped is True
+    assert daemon.shutdown_event.is_set()
+    mock_kill.assert_not_called()
+
+
+def test_daemon_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the daemon is profiled until it stops, also on Ctrl+C."""
+    monkeypatch.setattr(process, "PID_DIR", tmp_path)
+    profile_file = tmp_path / "daemon.txt"
+    with patch("agent_cli.daemon.server.asyncio.run", side_effect=KeyboardInterrupt) as mock_run:
+        result = CliRunner().invoke(app, ["daemon", "--profile", str(profile_file), "--quiet"])
+    assert result.exit_code == 0, result.output
+    mock_run.call_args.args[0].close()  # The coroutine that never ran
+    assert profile_file.exists()
@@ -0,0 +1,88 @@
+"""Tests for the status line of the live display."""
+
+from __future__ import annotations
+
+import io
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+from rich.live import Live
+
+from agent_cli.core.audio import read_audio_stream
+from agent_cli.core.display import StatusLine, status_line
+from agent_cli.core.utils import InteractiveStopEvent, live_timer, maybe_live
+
+
+def _render(status: StatusLine) -> str:
+    console = Console(file=io.StringIO(), width=120)
+    console.print(status)
+    return console.file.getvalue().strip()  # type: ignore[attr-defined]
+
+
+def test_status_line_states() -> None:
+    """Test the rendering of progress, timers, and Ctrl+C messages."""
+    status = StatusLine()
+    status.progress("Listening", 1.25)
+    assert _render(status) == "Listening... (1.2s)"
+
+    stop_event = InteractiveStopEvent()
+    status.show("Processing", spinner=True, timer=True, stop_event=stop_event, ctrl_c_message="Bye")
+    assert "Processing... (0.0s)" in _render(status)
+    stop_event.increment_sigint_count()
+    assert _render(status) == "Bye"
+
+    status.warn("Careful")
+    assert _render(status) == "Careful"
+    status.clear()
+    assert _render(status) == ""
+
+
+def test_status_line_of_live() -> None:
+    """Test that the status line of a display is reused, and installed in other displays."""
+    with maybe_live(False) as live:
+        assert live is None
+    display = maybe_live(True)
+    assert status_line(display) is status_line(display)
+
+    other = Live(console=Console(file=io.StringIO()))
+    status = status_line(other)
+    assert other.get_renderable() is status
+
+
+@pytest.mark.asyncio
+async def test_read_audio_stream_updates_state_only() -> None:
+    """Test that reading audio only sets the state, which is rendered by the display."""
+    live = maybe_live(True)
+    update = MagicMock(wraps=live.update)
+    live.update = update  # type: ignore[method-assign]
+    stop_event = InteractiveStopEvent()
+    stream = MagicMock()
+    chunks = iter(range(3))
+
+    def read(**_kwargs: object) -> bytes:
+        if next(chunks) == 2:
+            stop_event.set()
+        return b"\x00\x00" * 1024
+
+    stream.read.side_effect = read
+    await read_audio_stream(
+        stream,
+        stop_event,
+        lambda _chunk: None,
+        logging.getLogger(__name__),
+        live=live,
+        progress_message="Listening",
+    )
+    update.assert_not_called()
+    assert _render(status_line(live)) == "Listening... (0.2s)"
+
+
+@pytest.mark.asyncio
+async def test_live_timer_clears_status() -> None:
+    """Test that the timer shows a spinner while running and clears the status line after."""
+    live = maybe_live(True)
+    async with live_timer(live, "Thinking", quiet=False):
+        assert "Thinking... (0.0s)" in _render(status_line(live))
+    assert _render(status_line(live)) == ""
@@ -0,0 +1,119 @@
+"""Tests for the Unix socket messaging and the daemon client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from agent_cli.core import ipc
+from agent_cli.daemon import client
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def socket_file(tmp_path: Path) -> Path:
+    """Provide a short socket path (Unix socket paths are limited to ~100 bytes)."""
+    return tmp_path / "t.sock"
+
+
+@pytest.mark.asyncio
+async def test_unix_server_round_trip(socket_file: Path) -> None:
+    """Test that a request reaches the handler and its response reaches the client."""
+
+    async def handler(request: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True, "result": request["text"].upper()}
+
+    async with ipc.unix_server(socket_file, handler):
+        assert socket_file.stat().st_mode & 0o777 == 0o600
+        response = await asyncio.to_thread(ipc.send_request, socket_file, {"text": "hi"}, 1)
+    assert response == {"ok": True, "result": "HI"}
+    assert not socket_file.exists()
+
+
+@pytest.mark.asyncio
+async def test_unix_server_handler_error(socket_file: Path) -> None:
+    """Test that handler exceptions are returned as errors."""
+
+    async def handler(request: dict[str, Any]) -> dict[str, Any]:  # noqa: ARG001
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    async with ipc.unix_server(socket_file, handler):
+        response = await asyncio.to_thread(ipc.send_request, socket_file, {}, 1)
+    assert response == {"ok": False, "error": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_unix_server_replaces_stale_socket(socket_file: Path) -> None:
+    """Test that a leftover socket file from a crashed server is replaced."""
+    socket_file.touch()
+
+    async def handler(request: dict[str, Any]) -> dict[str, Any]:  # noqa: ARG001
+        return {"ok": True}
+
+    async with ipc.unix_server(socket_file, handler):
+        response = await asyncio.to_thread(ipc.send_request, socket_file, {}, 1)
+    assert response == {"ok": True}
+
+
+def test_send_request_no_server(socket_file: Path) -> None:
+    """Test that connecting without a server raises an OSError."""
+    with pytest.raises(OSError, match="No such file"):
+        ipc.send_request(socket_file, {})
+
+
+def test_decode_message_rejects_non_objects() -> None:
+    """Test that only JSON objects are accepted as messages."""
+    assert ipc.decode_message(ipc.encode_message({"a": 1})) == {"a": 1}
+    with pytest.raises(TypeError):
+        ipc.decode_message(b"[1, 2]\n")
+
+
+@patch("agent_cli.daemon.client.ipc.send_request")
+def test_client_sends_request(
+    mock_send: pytest.MagicMock,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that the client builds the request and prints the result."""
+    mock_send.return_value = {"ok": True, "running": False, "result": "Hello world."}
+    exit_code = client.main(
+        ["transcribe", "--toggle", "-o", "llm=true", "-o", "llm-provider=openai"],
+    )
+    assert exit_code == 0
+    assert capsys.readouterr().out == "Hello world.\n"
+    request = mock_send.call_args.args[1]
+    assert request == {
+        "command": "transcribe",
+        "action": "toggle",
+        "text": None,
+        "options": {"llm": True, "llm-provider": "openai"},
+    }
+
+
+@patch("agent_cli.daemon.client.ipc.send_request")
+def test_client_status_exit_code(mock_send: pytest.MagicMock) -> None:
+    """Test that `--status` exits with 0 only when running."""
+    mock_send.return_value = {"ok": True, "running": True}
+    assert client.main(["voice-edit", "--status"]) == 0
+    mock_send.return_value = {"ok": True, "running": False}
+    assert client.main(["voice-edit", "--status"]) == 1
+
+
+@patch("agent_cli.daemon.client.ipc.send_request")
+def test_client_errors(
+    mock_send: pytest.MagicMock,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that daemon errors and connection failures exit with 1."""
+    mock_send.return_value = {"ok": False, "error": "transcribe is not running"}
+    assert client.main(["transcribe", "--stop"]) == 1
+    assert "transcribe is not running" in capsys.readouterr().err
+
+    mock_send.side_effect = FileNotFoundError("No such file or directory")
+    assert client.main(["autocorrect", "some text"]) == 1
+    assert "Could not reach the agent-cli daemon" in capsys.readouterr().err
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from agent_cli import config
-from agent_cli.services.llm import create_llm_agent, get_llm_response, process_and_update_clipboard
+from agent_cli.services.llm import (
+    ResponseCache,
+    create_llm_agent,
+    get_llm_response,
+    get_response_cache,
+    process_and_update_clipboard,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def test_create_llm_agent_openai_no_key():
@@ -92,6 +102,67 @@ async def test_get_llm_response(mock_create_llm_agent: MagicMock) -> None:
     mock_agent.run.assert_called_once_with("test")
 
 
+@pytest.mark.asyncio
+async def test_response_cache(tmp_path: Path) -> None:
+    """Test the TTL and the least recently used eviction of the response cache."""
+    kwargs = {"provider": "local", "system_prompt": "s", "instructions": "i", "user_input": "u"}
+    key = ResponseCache.key(model="m", host="http://a:11434", **kwargs)
+    assert key != ResponseCache.key(model="other", host="http://a:11434", **kwargs)
+    assert key != ResponseCache.key(model="m", host="http://b:11434", **kwargs)
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+    assert await cache.get(key) is None
+    await cache.put(key, "response")
+    assert await cache.get(key) == "response"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    await cache.put("b", "B")
+    assert await cache.get(key) == "response"  # Now more recently used than "b"
+    await cache.put("c", "C")
+    assert await cache.get("b") is None
+    assert await cache.get(key) == "response"
+    with ResponseCache(tmp_path / "cache.sqlite") as reopened:
+        assert await reopened.get("c") == "C"  # Persisted
+    assert reopened._db is None  # Closed on exit
+
+    expired = ResponseCache(tmp_path / "cache.sqlite", ttl=0)
+    assert await expired.get(key) is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+@patch("agent_cli.services.llm.create_llm_agent")
+async def test_get_llm_response_cached(mock_create_llm_agent: MagicMock) -> None:
+    """Test that an identical request is answered from the cache, unless bypassed."""
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(return_value=MagicMock(output="hello"))
+    mock_create_llm_agent.return_value = mock_agent
+    kwargs = {
+        "system_prompt": "test",
+        "agent_instructions": "test",
+        "user_input": "test",
+        "provider_cfg": config.ProviderSelection(
+            llm_provider="local",
+            asr_provider="local",
+            tts_provider="piper",
+        ),
+        "ollama_cfg": config.Ollama(llm_ollama_model="test", llm_ollama_host="test"),
+        "openai_cfg": config.OpenAILLM(llm_openai_model="gpt-4o-mini"),
+        "gemini_cfg": config.GeminiLLM(llm_gemini_model="gemini-1.5-flash"),
+        "logger": MagicMock(),
+        "live": MagicMock(),
+    }
+    cache = get_response_cache()
+    assert await get_llm_response(**kwargs, cache=cache) == "hello"
+    assert await get_llm_response(**kwargs, cache=cache) == "hello"
+    assert mock_agent.run.call_count == 1
+    assert await get_llm_response(**kwargs) == "hello"
+    assert mock_agent.run.call_count == 2
+
+    # Nor are requests with tools, whose results may change
+    assert await get_llm_response(**kwargs, cache=cache, tools=[MagicMock()]) == "hello"
+    assert mock_agent.run.call_count == 3
+
+
 @pytest.mark.asyncio
 @patch("agent_cli.services.llm.create_llm_agent")
 async def test_get_llm_response_error(mock_create_llm_agent: MagicMock) -> None:
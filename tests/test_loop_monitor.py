@@ -0,0 +1,56 @@
+"""Tests for the event loop monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from agent_cli.core import loop_monitor
+
+
+def _block(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def _blocking_turn() -> str:
+    await asyncio.sleep(0.02)
+    _block(0.2)
+    await asyncio.sleep(0.02)
+    return "done"
+
+
+@pytest.mark.asyncio
+async def test_monitor_finds_blocking_function() -> None:
+    """Test that blocking is measured as lag and attributed to the blocking function."""
+    loop = asyncio.get_running_loop()
+    monitor = loop_monitor.LoopMonitor(loop)
+    monitor.start()
+    try:
+        assert loop.get_debug()
+        assert await asyncio.create_task(_blocking_turn()) == "done"
+    finally:
+        monitor.stop()
+
+    assert not loop.get_debug()
+    assert max(monitor.lags) > 0.15
+    blocker = max(monitor.blockers.values(), key=lambda b: b.seconds)
+    assert blocker.where.endswith("in _block")
+    assert blocker.stalls == 1
+    assert 0.1 < blocker.seconds < 0.3
+    slow = max(monitor.slow_callbacks.values(), key=lambda s: s.seconds)
+    assert "_blocking_turn" in slow.description
+    assert slow.seconds > 0.15
+
+
+@pytest.mark.asyncio
+async def test_run_with_monitor_prints_summary(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the summary at the end, and that nothing is monitored unless enabled."""
+    assert await loop_monitor.run_with_monitor(_blocking_turn(), enabled=False) == "done"
+    assert capsys.readouterr().out == ""
+
+    assert await loop_monitor.run_with_monitor(_blocking_turn(), enabled=True) == "done"
+    output = capsys.readouterr().out
+    assert "Event loop lag" in output
+    assert "_block" in output
@@ -0,0 +1,111 @@
+"""Tests for the Prometheus metrics."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agent_cli.core import metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _restore_registry() -> Iterator[None]:
+    """Unregister the metrics created by a test."""
+    registry = list(metrics._REGISTRY)
+    yield
+    metrics._REGISTRY[:] = registry
+
+
+def test_counter_and_gauge_render() -> None:
+    """Test the text format of counters with labels and gauges read from a function."""
+    counter = metrics.Counter("test_events", "Test events.")
+    counter.inc(kind="a")
+    counter.inc(2, kind='quoted "b"')
+    gauge = metrics.Gauge("test_depth", "Test depth.")
+    gauge.set_function(lambda: 7)
+
+    assert counter.get(kind="a") == 1
+    assert counter.render() == (
+        "# HELP agent_cli_test_events_total Test events.\n"
+        "# TYPE agent_cli_test_events_total counter\n"
+        'agent_cli_test_events_total{kind="a"} 1\n'
+        'agent_cli_test_events_total{kind="quoted \\"b\\""} 2\n'
+    )
+    assert gauge.render().endswith("agent_cli_test_depth 7\n")
+    gauge.remove()
+    assert gauge.samples() == []
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    """Test that each bucket counts the observations up to its bound."""
+    histogram = metrics.Histogram("test_seconds", "Test latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value, provider="p")
+
+    lines = histogram.samples()
+    assert lines == [
+        'agent_cli_test_seconds_bucket{provider="p",le="0.1"} 1',
+        'agent_cli_test_seconds_bucket{provider="p",le="1"} 3',
+        'agent_cli_test_seconds_bucket{provider="p",le="+Inf"} 4',
+        'agent_cli_test_seconds_sum{provider="p"} 4.25',
+        'agent_cli_test_seconds_count{provider="p"} 4',
+    ]
+
+
+def test_write_textfile(tmp_path: Path) -> None:
+    """Test that the textfile holds all registered metrics and no temporary file is left."""
+    path = tmp_path / "node-exporter" / "agent_cli.prom"
+    metrics.write_textfile(path)
+
+    assert "# TYPE agent_cli_llm_seconds histogram" in path.read_text()
+    assert [p.name for p in path.parent.iterdir()] == ["agent_cli.prom"]
+
+
+@pytest.mark.asyncio
+async def test_http_endpoint() -> None:
+    """Test that `/metrics` is served and other paths are not found."""
+
+    async def get(port: int, path: str) -> str:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        response = await reader.read()
+        writer.close()
+        return response.decode()
+
+    metrics.ERRORS.inc(stage="test")
+    server = await asyncio.start_server(metrics._handle_http, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        response = await get(port, "/metrics")
+        assert response.startswith("HTTP/1.1 200 OK")
+        assert 'agent_cli_errors_total{stage="test"}' in response
+        assert (await get(port, "/")).startswith("HTTP/1.1 404")
+
+
+@pytest.mark.asyncio
+async def test_exporter_writes_textfile_on_exit(tmp_path: Path) -> None:
+    """Test that the textfile is written while running and once more when done."""
+    path = tmp_path / "agent_cli.prom"
+    counter = metrics.Counter("exits", "Exits.")
+
+    async def main() -> int:
+        await asyncio.sleep(0)  # While the first write is in flight
+        counter.inc()
+        return 42
+
+    result = await metrics.run_with_exporter(main(), textfile=path)
+    assert result == 42
+    assert "agent_cli_exits_total 1" in path.read_text()
+    assert [p.name for p in tmp_path.iterdir()] == ["agent_cli.prom"]  # No leftover temp file
+
+
+def test_metric_needs_samples() -> None:
+    """Test that every kind of metric implements its samples."""
+    with pytest.raises(TypeError):
+        metrics._Metric("abstract", "Not a metric.")  # type: ignore[abstract]
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import os
 import signal
+import subprocess
+import sys
 import tempfile
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -147,10 +151,11 @@ def test_pid_file_context_success() -> None:
         assert pid_file.exists()
         assert returned_pid_file == pid_file
 
-        # PID file should contain current process ID
-        with pid_file.open() as f:
-            stored_pid = int(f.read().strip())
-        assert stored_pid == os.getpid()
+        # PID file should contain current process ID and its start time
+        info = process.read_process_info(process_name)
+        assert info is not None
+        assert info.pid == os.getpid()
+        assert info.start_time == process._process_start_time(os.getpid())
 
     # PID file should be cleaned up after context
     assert not pid_file.exists()
@@ -199,3 +204,50 @@ def test_pid_file_context_exception_cleanup() -> None:
 
     # PID file should still be cleaned up after exception
     assert not pid_file.exists()
+
+
+def test_pid_file_context_control_socket(temp_pid_dir: Path) -> None:
+    """Test that the control socket path is registered with the process."""
+    socket = temp_pid_dir / "test-process.sock"
+    with process.pid_file_context("test-process", control_socket=socket):
+        info = process.read_process_info("test-process")
+    assert info is not None
+    assert info.control_socket == str(socket)
+
+
+@pytest.mark.skipif(not Path("/proc/self/stat").exists(), reason="Requires /proc")
+def test_is_process_running_reused_pid(temp_pid_dir: Path) -> None:
+    """Test that a PID reused by another process is detected as stale."""
+    start_time = process._process_start_time(os.getpid())
+    assert start_time is not None
+    pid_file = temp_pid_dir / "test-process.pid"
+    pid_file.write_text(json.dumps({"pid": os.getpid(), "start_time": start_time - 1}))
+
+    assert not process.is_process_running("test-process")
+    assert not pid_file.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="Requires pidfd_open")
+def test_kill_process_waits_for_exit(temp_pid_dir: Path) -> None:
+    """Test that kill_process returns as soon as the process has exited."""
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        (temp_pid_dir / "test-process.pid").write_text(str(child.pid))
+        start = time.monotonic()
+        assert process.kill_process("test-process")
+        assert time.monotonic() - start < process.KILL_TIMEOUT / 2
+        assert child.wait(timeout=1) == -signal.SIGTERM
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_wait_for_exit() -> None:
+    """Test waiting for a process to exit and timing out."""
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert not process._wait_for_exit(child.pid, 0.05)
+    finally:
+        child.kill()
+        child.wait()
+    assert process._wait_for_exit(child.pid, 0.05)
@@ -0,0 +1,68 @@
+"""Tests for the sampling profiler."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agent_cli.core import profiler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _busy(seconds: float) -> int:
+    total = 0
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        total += 1
+    return total
+
+
+def test_profiling_collapsed_stacks(tmp_path: Path) -> None:
+    """Test that the busy functions of all threads show up in the collapsed stacks."""
+    profile_file = tmp_path / "profile.txt"
+    with profiler.profiling(profile_file) as session:
+        worker = threading.Thread(target=_busy, args=(0.2,), name="worker")
+        worker.start()
+        _busy(0.2)
+        worker.join()
+    assert session is not None
+
+    lines = profile_file.read_text().splitlines()
+    assert lines
+    stacks = {line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in lines}
+    main = sum(
+        n for stack, n in stacks.items() if stack.startswith("MainThread;") and "_busy" in stack
+    )
+    in_worker = sum(
+        n for stack, n in stacks.items() if stack.startswith("worker;") and "_busy" in stack
+    )
+    assert main > 5
+    assert in_worker > 5
+    assert all("(tests/test_profiler.py:18)" in stack for stack in stacks if "_busy" in stack)
+
+
+def test_profiling_speedscope(tmp_path: Path) -> None:
+    """Test the speedscope format, with valid frame indices and a weight per sample."""
+    profile_file = tmp_path / "profiles" / "profile.json"  # The directory is created
+    with profiler.profiling(profile_file):
+        _busy(0.1)
+
+    data = json.loads(profile_file.read_text())
+    frames = data["shared"]["frames"]
+    (main,) = (p for p in data["profiles"] if p["name"] == "MainThread")
+    assert len(main["samples"]) == len(main["weights"])
+    assert all(0 <= i < len(frames) for stack in main["samples"] for i in stack)
+    assert any(frames[stack[-1]]["name"] == "_busy" for stack in main["samples"])
+    assert main["endValue"] == pytest.approx(sum(main["weights"]))
+
+
+def test_profiling_disabled() -> None:
+    """Test that nothing is sampled without a profile file."""
+    with profiler.profiling(None) as session:
+        assert session is None
@@ -0,0 +1,38 @@
+"""Tests for the rule-based transcript cleanup."""
+
+from __future__ import annotations
+
+import pytest
+
+from agent_cli.core.text_cleanup import Cleanup, heuristic_cleanup
+
+
+@pytest.mark.parametrize(
+    ("transcript", "expected"),
+    [
+        ("hello world", "Hello world."),
+        ("um so i think the the plan works", "So I think the plan works."),
+        ("I, um, agree", "I agree."),
+        ("what time is it", "What time is it?"),
+        ("no, no, that's fine!", "No, no, that's fine!"),
+        ("i'm done,", "I'm done."),
+    ],
+)
+def test_heuristic_cleanup(transcript: str, expected: str) -> None:
+    """Test fillers, stutters, capitalization and final punctuation."""
+    assert heuristic_cleanup(transcript) == Cleanup(expected, confident=True)
+
+
+@pytest.mark.parametrize(
+    ("transcript", "reason"),
+    [
+        ("uh um", "no words besides filler"),
+        ("one two three four five six seven eight nine", "more than 8 words"),
+        ("first this. then that", "several sentences"),
+    ],
+)
+def test_heuristic_cleanup_defers_to_llm(transcript: str, reason: str) -> None:
+    """Test that long or complex transcripts are left to the LLM."""
+    cleanup = heuristic_cleanup(transcript)
+    assert not cleanup.confident
+    assert cleanup.reason == reason
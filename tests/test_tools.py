@@ -2,37 +2,167 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import pytest
+
+from agent_cli import _tools
 from agent_cli._tools import execute_code, read_file
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-def test_read_file_tool(tmp_path: Path) -> None:
+@pytest.mark.asyncio
+async def test_read_file_tool(tmp_path: Path) -> None:
     """Test the ReadFileTool."""
     # 1. Test reading a file that exists
     file = tmp_path / "test.txt"
     file.write_text("hello")
-    assert read_file(path=str(file)) == "hello"
+    assert await read_file(path=str(file)) == "hello"
 
     # 2. Test reading a file that does not exist
-    assert "Error: File not found" in read_file(path="non_existent_file.txt")
+    assert "Error: File not found" in await read_file(path="non_existent_file.txt")
 
     # 3. Test OSError
-    with patch("pathlib.Path.read_text", side_effect=OSError("Test error")):
-        assert "Error reading file" in read_file(path=str(file))
+    with patch("pathlib.Path.open", side_effect=OSError("Test error")):
+        assert "Error reading file" in await read_file(path=str(file))
+
+
+@pytest.mark.asyncio
+async def test_read_file_byte_range(tmp_path: Path) -> None:
+    """Test reading a byte range and the truncation marker."""
+    file = tmp_path / "test.txt"
+    file.write_text("0123456789")
+
+    assert await read_file(path=str(file), offset=2, limit=3) == (
+        "234\n... [truncated: bytes 2-5 shown, file is 10 bytes; use offset=5 to read more]"
+    )
+    assert await read_file(path=str(file), offset=5) == "56789"
+
+
+@pytest.mark.asyncio
+async def test_read_file_line_range(tmp_path: Path) -> None:
+    """Test reading a range of lines."""
+    file = tmp_path / "test.txt"
+    file.write_text("".join(f"line {i}\n" for i in range(1, 11)))
+
+    assert await read_file(path=str(file), start_line=3, end_line=4) == "line 3\nline 4\n"
+    assert await read_file(path=str(file), start_line=10) == "line 10\n"
 
+    result = await read_file(path=str(file), start_line=2, limit=14)
+    assert result.startswith("line 2\nline 3\n\n... [truncated: lines 2-3 shown")
+    assert "use start_line=4" in result
 
-def test_execute_code_tool() -> None:
+
+@pytest.mark.asyncio
+async def test_read_file_budget(tmp_path: Path) -> None:
+    """Test that the per-call byte budget caps large reads."""
+    file = tmp_path / "big.log"
+    file.write_text("x" * 100)
+
+    with patch.object(_tools, "MAX_TOOL_OUTPUT_BYTES", 10):
+        result = await read_file(path=str(file), limit=1000)
+        assert result.startswith("x" * 10 + "\n... [truncated")
+
+        # A single line longer than the budget continues by byte offset
+        result = await read_file(path=str(file), start_line=1)
+        assert "use offset=10" in result
+
+
+@pytest.mark.asyncio
+async def test_read_file_binary(tmp_path: Path) -> None:
+    """Test that binary files are not returned as text."""
+    file = tmp_path / "data.bin"
+    file.write_bytes(b"\x89PNG\x00\x01\x02")
+    assert "appears to be a binary file" in await read_file(path=str(file))
+
+
+@pytest.mark.asyncio
+async def test_execute_code_tool() -> None:
     """Test the ExecuteCodeTool."""
     # 1. Test a simple command
-    assert execute_code(code="echo hello").strip() == "hello"
+    assert (await execute_code(code="echo hello")).strip() == "hello"
 
     # 2. Test a command that fails
-    assert "Error: Command not found" in execute_code(code="non_existent_command")
+    assert "Error: Command not found" in await execute_code(code="non_existent_command")
 
     # 3. Test a command that returns a non-zero exit code
-    assert "Error executing code" in execute_code(code="ls non_existent_file")
+    assert "Error executing code" in await execute_code(code="ls non_existent_file")
+
+
+@pytest.mark.asyncio
+async def test_execute_code_timeout() -> None:
+    """Test that a hanging command is killed after the timeout."""
+    with patch.object(_tools, "EXECUTE_CODE_TIMEOUT", 0.1):
+        result = await execute_code(code="sleep 5")
+    assert "timed out" in result
+
+
+@pytest.mark.asyncio
+async def test_execute_code_output_cap() -> None:
+    """Test that large outputs are truncated with a marker."""
+    with patch.object(_tools, "MAX_TOOL_OUTPUT_BYTES", 4):
+        result = await execute_code(code="echo hello-world")
+    assert result.startswith("hell")
+    assert "[output truncated: 4 of 12 bytes shown]" in result
+
+
+@pytest.mark.asyncio
+async def test_execute_code_runs_concurrently() -> None:
+    """Test that independent tool calls do not block each other."""
+    start = time.monotonic()
+    await asyncio.gather(*(execute_code(code="sleep 0.3") for _ in range(3)))
+    assert time.monotonic() - start < 0.8
+
+
+@pytest.mark.asyncio
+async def test_cache_tool_results_ttl() -> None:
+    """Test that cached results expire after the TTL."""
+    calls: list[str] = []
+
+    async def search(query: str) -> list[str]:
+        calls.append(query)
+        return [query]
+
+    cached = _tools.cache_tool_results(search, ttl=60)
+    assert await cached("python") == ["python"]
+    assert await cached(query="python") == ["python"]
+    assert await cached("rust") == ["rust"]
+    assert calls == ["python", "rust"]
+
+    with patch("agent_cli._tools.time.monotonic", return_value=time.monotonic() + 120):
+        await cached("python")
+    assert calls == ["python", "rust", "python"]
+
+
+@pytest.mark.asyncio
+async def test_cache_tool_results_file_invalidation(tmp_path: Path) -> None:
+    """Test that cached file reads are invalidated when the file changes."""
+    file = tmp_path / "test.txt"
+    file.write_text("hello")
+    cached_read_file = _tools.cache_tool_results(
+        read_file,
+        fingerprint=_tools._file_fingerprint,
+    )
+
+    assert await cached_read_file(path=str(file)) == "hello"
+    with patch("pathlib.Path.open", side_effect=AssertionError("should be cached")):
+        assert await cached_read_file(path=str(file)) == "hello"
+
+    file.write_text("hello, world")
+    # The file is checked for changes in a worker thread, like the read itself
+    with patch("agent_cli._tools.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        assert await cached_read_file(path=str(file)) == "hello, world"
+    assert to_thread.call_args_list[0].args[0].__name__ == "stat"
+
+
+def test_tools_are_cached() -> None:
+    """Test that the read-only tools are wrapped in the cache."""
+    tool_list = {tool.name: tool for tool in _tools.tools()}
+    assert tool_list["read_file"].function.__wrapped__ is read_file
+    assert hasattr(tool_list["duckduckgo_search"].function, "__wrapped__")
+    assert "__wrapped__" not in vars(tool_list["execute_code"].function)
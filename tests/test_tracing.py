@@ -0,0 +1,101 @@
+"""Tests for the latency tracing."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agent_cli.core import tracing
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_disabled_by_default() -> None:
+    """Test that spans and events are no-ops outside of `tracing`."""
+    with tracing.span("asr.capture") as span:
+        tracing.event("asr.first_partial")
+    assert span is None
+
+
+def test_spans_nest_across_tasks(tmp_path: Path) -> None:
+    """Test that spans in concurrent tasks get the enclosing span as their parent."""
+
+    async def stage(name: str) -> None:
+        with tracing.span(name):
+            await asyncio.sleep(0)
+
+    async def turn() -> None:
+        with tracing.span("turn"):
+            await asyncio.gather(stage("asr.capture"), stage("asr.receive"))
+            tracing.event("asr.final_transcript", chars=5)
+
+    with tracing.tracing(tmp_path / "trace.json") as tracer:
+        asyncio.run(turn())
+
+    assert tracer is not None
+    spans = {span.name: span for span in tracer.spans}
+    assert set(spans) == {"turn", "asr.capture", "asr.receive", "asr.final_transcript"}
+    turn_id = spans["turn"].span_id
+    assert spans["turn"].parent_id is None
+    assert all(spans[name].parent_id == turn_id for name in spans if name != "turn")
+    assert spans["turn"].start_ns <= spans["asr.capture"].start_ns
+    assert spans["asr.capture"].end_ns <= spans["turn"].end_ns
+    assert spans["asr.final_transcript"].attributes == {"chars": 5}
+
+
+def test_error_is_recorded(tmp_path: Path) -> None:
+    """Test that a span records the exception that ended it."""
+
+    def fail() -> None:
+        with tracing.span("llm.response"):
+            msg = "boom"
+            raise ValueError(msg)
+
+    with (
+        tracing.tracing(tmp_path / "trace.json") as tracer,
+        pytest.raises(ValueError, match="boom"),
+    ):
+        fail()
+    assert tracer is not None
+    assert tracer.spans[0].attributes["error"] == "ValueError('boom')"
+
+
+def test_chrome_trace_export(tmp_path: Path) -> None:
+    """Test that the trace is written as Chrome trace events, one track per category."""
+    trace_file = tmp_path / "trace.json"
+    with tracing.tracing(trace_file):
+        with tracing.span("asr.capture", audio_bytes=32000):
+            pass
+        tracing.event("tts.first_byte")
+
+    trace = json.loads(trace_file.read_text())
+    events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] != "M"}
+    assert events["asr.capture"]["ph"] == "X"
+    assert events["asr.capture"]["dur"] >= 0
+    assert events["asr.capture"]["args"] == {"audio_bytes": 32000}
+    assert events["tts.first_byte"]["ph"] == "i"
+    assert events["asr.capture"]["tid"] != events["tts.first_byte"]["tid"]
+    tracks = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+    assert tracks == {"asr", "tts"}
+
+
+def test_otel_jsonl_export(tmp_path: Path) -> None:
+    """Test that a `.jsonl` trace file gets one OpenTelemetry span per line."""
+    trace_file = tmp_path / "trace.jsonl"
+    with tracing.tracing(trace_file), tracing.span("llm.response", model="m", cached=False):
+        tracing.event("llm.first_token")
+
+    lines = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    spans = {line["name"]: line for line in lines}
+    parent, child = spans["llm.response"], spans["llm.first_token"]
+    assert parent["traceId"] == child["traceId"]
+    assert child["parentSpanId"] == parent["spanId"]
+    assert int(parent["startTimeUnixNano"]) <= int(parent["endTimeUnixNano"])
+    assert parent["attributes"] == [
+        {"key": "model", "value": {"stringValue": "m"}},
+        {"key": "cached", "value": {"boolValue": False}},
+    ]
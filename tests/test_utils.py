@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from datetime import timedelta
+from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
 
-from agent_cli.core import utils
+from agent_cli.core import ipc, process, utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.parametrize(
@@ -155,3 +161,82 @@ def test_stop_or_status_or_toggle(
     mock_kill_process.return_value = True
     assert utils.stop_or_status_or_toggle("test", "test", False, False, True, quiet=True)
     mock_kill_process.assert_called_with("test")
+
+
+@pytest.mark.asyncio
+async def test_run_with_control_socket(tmp_path: Path) -> None:
+    """Test that a `stop` request ends the run and returns its result."""
+    socket_file = tmp_path / "t.sock"
+
+    async def main(stop_event: utils.InteractiveStopEvent) -> str:
+        await stop_event.wait()
+        return "hello world"
+
+    task = asyncio.create_task(
+        utils.run_with_control_socket(socket_file, main, logging.getLogger(), quiet=True),
+    )
+    while not socket_file.exists():  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+    status = await asyncio.to_thread(ipc.send_request, socket_file, {"action": "status"}, 1)
+    assert status["running"] is True
+    flush = await asyncio.to_thread(ipc.send_request, socket_file, {"action": "flush"}, 1)
+    assert flush == {"ok": False, "error": "This session cannot flush."}
+    unknown = await asyncio.to_thread(ipc.send_request, socket_file, {"action": "pause"}, 1)
+    assert unknown == {"ok": False, "error": "Unknown action: 'pause'"}
+    response = await asyncio.to_thread(ipc.send_request, socket_file, {"action": "stop"}, 1)
+    assert response == {"ok": True, "result": "hello world"}
+    assert await task == "hello world"
+    assert not socket_file.exists()
+
+
+@pytest.mark.asyncio
+async def test_run_with_control_socket_flush(tmp_path: Path) -> None:
+    """Test that a `flush` request is answered by `main`, which keeps running."""
+    socket_file = tmp_path / "t.sock"
+    flush_requests: asyncio.Queue[asyncio.Future[str | None]] = asyncio.Queue()
+
+    async def main(stop_event: utils.InteractiveStopEvent) -> str:
+        (await flush_requests.get()).set_result("hello")
+        await stop_event.wait()
+        return "hello world"
+
+    task = asyncio.create_task(
+        utils.run_with_control_socket(
+            socket_file,
+            main,
+            logging.getLogger(),
+            quiet=True,
+            flush_requests=flush_requests,
+        ),
+    )
+    while not socket_file.exists():  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+    response = await asyncio.to_thread(ipc.send_request, socket_file, {"action": "flush"}, 1)
+    assert response == {"ok": True, "result": "hello"}
+    assert not task.done()
+    response = await asyncio.to_thread(ipc.send_request, socket_file, {"action": "stop"}, 1)
+    assert response == {"ok": True, "result": "hello world"}
+    assert await task == "hello world"
+
+
+@patch("agent_cli.core.process.kill_process")
+@patch("agent_cli.core.utils.ipc.send_request")
+@patch("agent_cli.core.process.read_process_info")
+def test_stop_prefers_control_socket(
+    mock_read_process_info: Mock,
+    mock_send_request: Mock,
+    mock_kill_process: Mock,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that `--stop` uses the control socket and prints the result."""
+    mock_read_process_info.return_value = process.ProcessInfo(123, 1, "/tmp/t.sock")  # noqa: S108
+    mock_send_request.return_value = {"ok": True, "result": "hello world"}
+    assert utils.stop_or_status_or_toggle("test", "test", True, False, False, quiet=True)
+    assert capsys.readouterr().out == "hello world\n"
+    mock_kill_process.assert_not_called()
+
+    # Falls back to SIGTERM when the socket is unreachable
+    mock_send_request.side_effect = ConnectionRefusedError
+    mock_kill_process.return_value = True
+    assert utils.stop_or_status_or_toggle("test", "test", True, False, False, quiet=True)
+    mock_kill_process.assert_called_once_with("test")
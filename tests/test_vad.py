@@ -0,0 +1,101 @@
+"""Tests for the energy-based voice activity detection."""
+
+from __future__ import annotations
+
+import math
+import subprocess
+import sys
+from array import array
+
+import pytest
+
+from agent_cli import constants
+from agent_cli.core import vad
+
+
+def _tone(amplitude: int, n_samples: int = constants.PYAUDIO_CHUNK_SIZE) -> bytes:
+    samples = (round(amplitude * math.sin(i / 5)) for i in range(n_samples))
+    return array("h", samples).tobytes()
+
+
+def test_vad_does_not_import_pyaudio() -> None:
+    """Test that the audio processing can be used without the audio device library."""
+    script = "import sys, agent_cli.core.vad; assert 'pyaudio' not in sys.modules"
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_rms() -> None:
+    """Test the RMS of silence, a constant signal and an odd number of bytes."""
+    assert vad.rms(b"") == 0.0
+    assert vad.rms(bytes(2048)) == 0.0
+    assert vad.rms(array("h", [-100, 100]).tobytes() + b"\x01") == pytest.approx(100)
+    assert vad.rms(_tone(1000)) == pytest.approx(1000 / math.sqrt(2), rel=0.01)
+
+
+def test_energy_gate_suppresses_silence() -> None:
+    """Test that quiet audio is held back and loud audio releases the pre-roll."""
+    gate = vad.EnergyGate(preroll=0.2, hangover=0.2)  # 4 chunks each
+    quiet, loud = _tone(20), _tone(3000)
+    assert all(gate.process(quiet) == [] for _ in range(20))
+
+    # The onset releases the 4 pre-roll chunks before it
+    assert gate.process(loud) == [quiet] * 4 + [loud]
+    # The gate stays open for the hangover, then closes
+    assert [len(gate.process(quiet)) for _ in range(6)] == [1, 1, 1, 1, 0, 0]
+    assert gate.chunks_in == 27
+    assert gate.chunks_out == 9
+    assert "67% suppressed" in gate.summary()
+
+
+def test_energy_gate_adapts_to_background_noise() -> None:
+    """Test that a steady louder background eventually stops opening the gate."""
+    gate = vad.EnergyGate(hangover=0.0)
+    assert gate.process(_tone(20)) == []
+    fan = _tone(500)
+    assert gate.process(fan) != []  # A sudden change opens the gate
+    for _ in range(300):
+        gate.process(fan)
+    assert gate.process(fan) == []
+    assert gate.noise_floor == pytest.approx(vad.rms(fan), rel=0.1)
+
+
+def test_utterance_segmenter() -> None:
+    """Test that utterances end at pauses or the length cap, and that clicks are dropped."""
+    segmenter = vad.UtteranceSegmenter(pause=0.2, min_speech=0.15, max_utterance=1.0)
+    quiet, loud = _tone(20), _tone(3000)
+    for _ in range(20):
+        assert segmenter.process(quiet) == []
+
+    # A single loud chunk is a click, dropped when the gate closes
+    assert segmenter.process(loud) == []
+    assert all(segmenter.process(quiet) == [] for _ in range(10))
+
+    # Speech is released once it lasted 3 chunks, and ends with None after the pause
+    out = [item for chunk in [loud] * 5 + [quiet] * 6 for item in segmenter.process(chunk)]
+    assert out[-1] is None
+    assert out.count(loud) == 5
+    assert None not in out[:-1]
+    assert segmenter.utterances == 1
+
+    # Speech without a pause is cut after 1s (16 chunks), then continues
+    out = [item for _ in range(20) for item in segmenter.process(loud)]
+    assert out.index(None) == 16
+    assert segmenter.flush() == [None]
+    assert segmenter.flush() == []
+    assert segmenter.utterances == 3
+
+
+def test_split_at_silences() -> None:
+    """Test that long audio is cut at the pause and windows overlap."""
+    second = constants.PYAUDIO_RATE
+    # 10s of speech with a pause between 8.0s and 8.3s
+    audio = _tone(3000, 8 * second) + bytes(int(0.3 * second) * 2) + _tone(3000, int(1.7 * second))
+    assert vad.split_at_silences(audio, window_seconds=20) == [(0, len(audio))]
+
+    windows = vad.split_at_silences(audio, window_seconds=9, overlap_seconds=1)
+    assert len(windows) == 2
+    (start1, cut), (start2, end2) = windows
+    assert start1 == 0
+    assert end2 == len(audio)
+    assert 8.0 * second * 2 <= cut <= 8.3 * second * 2
+    assert cut - start2 == pytest.approx(2 * second, abs=960)  # Aligned to 30 ms frames
@@ -1,10 +1,12 @@
 """Tests for the wake word detection module."""
 
 import asyncio
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from rich.live import Live
+from wyoming.wake import Detection, NotDetected
 
 from agent_cli import config
 from agent_cli.core.utils import InteractiveStopEvent
@@ -143,3 +145,138 @@ async def test_detect_wake_word_from_queue_connection_error(
     )
     assert result is None
     mock_wyoming_client_context.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_openwakeword_session(mock_logger: MagicMock):
+    """Test that the in-process session yields a detection per score above the threshold."""
+    pytest.importorskip("numpy")
+    model = MagicMock()
+    model.predict.side_effect = [{"hey_jarvis": score} for score in (0.1, 0.9, 0.2, 0.8)]
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    for _ in range(4):
+        queue.put_nowait(b"\x00\x00" * 1024)
+    queue.put_nowait(None)
+
+    cfg = config.WakeWord(
+        wake_server_ip="localhost",
+        wake_server_port=1234,
+        wake_word="hey_jarvis",
+        wake_word_provider="openwakeword",
+    )
+    with patch("agent_cli.services.wake_word._load_openwakeword_model", return_value=model):
+        async with wake_word.create_wake_word_session(cfg, mock_logger, queue) as session:
+            detections = [name async for name in session]
+
+    assert detections == ["hey_jarvis", "hey_jarvis"]
+    assert model.reset.call_count == 3  # At the start and after each detection
+    assert session.finished
+
+
+def test_openwakeword_model_paths(tmp_path: Path):
+    """Test that model files are checked on disk, without asking openWakeWord for a name."""
+    model_file = tmp_path / "my_word.tflite"
+    model_file.write_bytes(b"")
+    assert wake_word.openwakeword_model_error(str(model_file)) is None
+    error = wake_word.openwakeword_model_error(str(tmp_path / "missing.onnx"))
+    assert error is not None
+    assert "not found" in error
+    assert wake_word.DEFAULT_WAKE_WORDS["openwakeword"] != "ok_nabu"
+
+
+def test_openwakeword_pretrained_names():
+    """Test that the default is a pretrained model, and other names get a clear error."""
+    pytest.importorskip("openwakeword")
+    assert wake_word.openwakeword_model_error(wake_word.DEFAULT_WAKE_WORDS["openwakeword"]) is None
+    error = wake_word.openwakeword_model_error("ok_nabu")
+    assert error is not None
+    assert "hey_jarvis" in error
+
+
+def test_load_openwakeword_model_file_skips_download(tmp_path: Path):
+    """Test that a custom model file is loaded as is, with the framework of its format."""
+    pytest.importorskip("openwakeword")
+    model_file = str(tmp_path / "my_word.tflite")
+    with (
+        patch("openwakeword.utils.download_models") as mock_download,
+        patch("openwakeword.model.Model") as mock_model,
+    ):
+        wake_word._load_openwakeword_model.__wrapped__(model_file)
+    mock_download.assert_not_called()
+    mock_model.assert_called_once_with(wakeword_models=[model_file], inference_framework="tflite")
+
+
+@pytest.mark.asyncio
+async def test_wyoming_session_uses_one_connection(mock_logger: MagicMock):
+    """Test that consecutive detections arrive over a single Wyoming connection."""
+    client = AsyncMock()
+    client.read_event.side_effect = [
+        Detection(name="ok_nabu").event(),
+        Detection(name="ok_nabu").event(),
+        NotDetected().event(),
+    ]
+    client_context = MagicMock()
+    client_context.return_value.__aenter__.return_value = client
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    cfg = config.WakeWord(wake_server_ip="localhost", wake_server_port=1234, wake_word="ok_nabu")
+    with patch("agent_cli.services.wake_word.wyoming_client_context", client_context):
+        async with wake_word.create_wake_word_session(cfg, mock_logger, queue) as session:
+            assert await anext(session) == "ok_nabu"
+            assert await anext(session) == "ok_nabu"
+            assert await anext(session, None) is None
+
+    client_context.assert_called_once()
+    assert client.write_event.call_args_list[0].args[0].type == "detect"
+
+
+@pytest.mark.asyncio
+async def test_session_drain(mock_logger: MagicMock):
+    """Test that draining discards pending detections and audio, but not the end of stream."""
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    queue.put_nowait(b"\x00\x00")
+    session = wake_word.create_wake_word_session(
+        config.WakeWord(wake_server_ip="localhost", wake_server_port=1234, wake_word="test"),
+        mock_logger,
+        queue,
+    )
+    session._detected("test")
+    session.drain()
+    assert queue.empty()
+    assert session._detections.empty()
+
+    queue.put_nowait(None)
+    session.drain()
+    assert queue.get_nowait() is None
+
+
+@pytest.mark.asyncio
+@patch("agent_cli.services.wake_word.wyoming_client_context", side_effect=ConnectionRefusedError)
+async def test_session_restarts_warn_once(
+    mock_wyoming_client_context: MagicMock,
+    mock_logger: MagicMock,
+):
+    """Test that a detector that stays down is reported once, until audio flows again."""
+    cfg = config.WakeWord(wake_server_ip="localhost", wake_server_port=1234, wake_word="test")
+    session = wake_word.create_wake_word_session(cfg, mock_logger, asyncio.Queue())
+    for _ in range(3):
+        session.start()
+        assert await anext(session, None) is None
+    assert session.finished
+    assert session.failures == 3
+    mock_logger.warning.assert_called_once()
+    mock_logger.exception.assert_not_called()
+    assert mock_wyoming_client_context.call_args.kwargs["log_errors"] is False
+
+    session._report_progress(b"\x00\x00")
+    assert session.failures == 0
+
+
+def test_session_is_abstract(mock_logger: MagicMock):
+    """Test that a session needs a detector."""
+    with pytest.raises(TypeError):
+        wake_word.WakeWordSession(  # type: ignore[abstract]
+            config.WakeWord(wake_server_ip="localhost", wake_server_port=1234, wake_word="test"),
+            mock_logger,
+            asyncio.Queue(),
+        )